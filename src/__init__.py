@@ -1,7 +1,8 @@
-from .config_loader import get_paths_config, get_settings_config
+from .config_loader import get_paths_config, get_settings_config, get_settings, Settings
 
 __all__ = [
     "get_paths_config",
-    "get_settings_config"
+    "get_settings_config",
+    "get_settings",
+    "Settings"
 ]
-
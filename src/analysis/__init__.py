@@ -19,6 +19,9 @@ from .engagement import (
     compute_like_dislike_ratio_df,
     summarize_engagement_by_category_df,
     correlation_by_category_before_trend,
+    engagement_correlation_by_category,
+    build_distribution_sketches,
+    summarize_distribution_by_category,
     print_engagement_correlation_before_trend,
     like_dislike_ratio_vs_views,
     engagement_disabled_analysis,
@@ -27,6 +30,79 @@ from .engagement import (
     compare_status_impact
 )
 
+from .category_cube import CategoryDayCube
+
+from .change_points import (
+    build_category_day_series,
+    detect_spikes,
+    detect_change_points
+)
+
+from .correlation import (
+    grouped_correlation,
+    grouped_comoments,
+    bootstrap_correlation
+)
+
+from .date_index import (
+    DateRangeIndex,
+    build_date_indexes
+)
+
+from .group_utils import (
+    grouped_mode,
+    count_delimited,
+    sort_within_groups
+)
+
+from .near_duplicates import (
+    find_near_duplicates,
+    add_duplicate_clusters,
+    drop_near_duplicates
+)
+
+from .preview import (
+    build_preview_sample,
+    load_preview_sample,
+    preview_cache_path,
+    estimate_population,
+    is_preview
+)
+
+from .rank_dynamics import (
+    compute_daily_ranks,
+    add_daily_ranks,
+    compute_rank_dynamics,
+    summarize_rank_dynamics_by_category
+)
+
+from .sampling import (
+    stratified_positions,
+    stratified_sample
+)
+
+from .sketches import (
+    PrioritySample,
+    HyperLogLog,
+    TDigest,
+    approximate_top_k,
+    top_estimates,
+    approximate_nunique,
+    top_k_keys,
+    validate_sketches
+)
+
+from .trending_cube import (
+    TrendingCube,
+    build_trending_cube
+)
+
+from .trajectory import (
+    VideoSegments,
+    compute_snapshot_deltas,
+    build_trajectory_table
+)
+
 __all__ = [
     # category_trends
     "extract_categories",
@@ -47,10 +123,64 @@ __all__ = [
     "compute_like_dislike_ratio_df",
     "summarize_engagement_by_category_df",
     "correlation_by_category_before_trend",
+    "engagement_correlation_by_category",
+    "build_distribution_sketches",
+    "summarize_distribution_by_category",
     "print_engagement_correlation_before_trend",
     "like_dislike_ratio_vs_views",
     "engagement_disabled_analysis",
     "compute_engagement_rate_df",
     "summarize_engagement_by_category_df",
-    "compare_status_impact"
+    "compare_status_impact",
+    # category_cube
+    "CategoryDayCube",
+    # change_points
+    "build_category_day_series",
+    "detect_spikes",
+    "detect_change_points",
+    # correlation
+    "grouped_correlation",
+    "grouped_comoments",
+    "bootstrap_correlation",
+    # date_index
+    "DateRangeIndex",
+    "build_date_indexes",
+    # group_utils
+    "grouped_mode",
+    "count_delimited",
+    "sort_within_groups",
+    # near_duplicates
+    "find_near_duplicates",
+    "add_duplicate_clusters",
+    "drop_near_duplicates",
+    # preview
+    "build_preview_sample",
+    "load_preview_sample",
+    "preview_cache_path",
+    "estimate_population",
+    "is_preview",
+    # rank_dynamics
+    "compute_daily_ranks",
+    "add_daily_ranks",
+    "compute_rank_dynamics",
+    "summarize_rank_dynamics_by_category",
+    # sampling
+    "stratified_positions",
+    "stratified_sample",
+    # sketches
+    "PrioritySample",
+    "HyperLogLog",
+    "TDigest",
+    "approximate_top_k",
+    "top_estimates",
+    "approximate_nunique",
+    "top_k_keys",
+    "validate_sketches",
+    # trending_cube
+    "TrendingCube",
+    "build_trending_cube",
+    # trajectory
+    "VideoSegments",
+    "compute_snapshot_deltas",
+    "build_trajectory_table"
 ]
\ No newline at end of file
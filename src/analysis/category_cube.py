@@ -0,0 +1,244 @@
+import pandas as pd
+import numpy as np
+from typing import Dict, Iterable, List, Optional
+
+# =============================================================
+# Category x Day Cube - YouTube Dataset
+# =============================================================
+# Builds a dense (category, day) array of daily totals once, then
+# answers period growth (D/W/M), rolling windows and top-N
+# selection with NumPy operations over that array instead of
+# regrouping the raw frame for every question.
+# =============================================================
+
+_ONE_DAY = np.timedelta64(1, 'D')
+
+
+class CategoryDayCube:
+    """
+    Dense daily totals of a value column per category.
+
+    ``values[i, j]`` is the sum of ``value_column`` for ``categories[i]`` on
+    ``days[j]`` and ``counts[i, j]`` the number of rows behind it. ``days``
+    is a contiguous daily range, so days without data are present with a
+    zero count.
+
+    Args:
+        categories (np.ndarray): Sorted category labels (rows of the cube).
+        days (np.ndarray): Contiguous ``datetime64[D]`` range (columns of the cube).
+        values (np.ndarray): Daily sums, shape ``(len(categories), len(days))``.
+        counts (np.ndarray): Daily row counts, same shape as ``values``.
+        category_column (str): Name of the category column the cube was built from.
+    """
+
+    def __init__(self, categories: np.ndarray, days: np.ndarray, values: np.ndarray,
+                 counts: np.ndarray, category_column: str = 'category'):
+        self.categories = categories
+        self.days = days
+        self.values = values
+        self.counts = counts
+        self.category_column = category_column
+        self.totals = values.sum(axis=1)
+
+    @classmethod
+    def from_frame(cls, data: pd.DataFrame, category_column: str, value_column: str,
+                   date_column: str = 'date') -> 'CategoryDayCube':
+        """
+        Build the cube with a single ``groupby([category, day])`` pass.
+
+        The input frame is not modified; rows with a missing category or an
+        unparseable date are ignored.
+
+        Args:
+            data (pd.DataFrame): Dataset with category, value and date columns.
+            category_column (str): The column representing categories.
+            value_column (str): The numeric column to sum.
+            date_column (str): The date column. Defaults to 'date'.
+
+        Returns:
+            CategoryDayCube: The populated cube.
+
+        Raises:
+            KeyError: If ``date_column`` does not exist in the DataFrame.
+        """
+        if date_column not in data.columns:
+            raise KeyError(f"The column '{date_column}' is not found in the dataset.")
+
+        days = pd.to_datetime(data[date_column], errors='coerce').dt.normalize()
+        grouped = (
+            data[value_column]
+            .groupby([data[category_column].to_numpy(), days.to_numpy()])
+            .agg(['sum', 'size'])
+        )
+
+        if grouped.empty:
+            empty = np.zeros((0, 0))
+            return cls(np.array([], dtype=object), np.array([], dtype='datetime64[D]'),
+                       empty, empty.astype(np.int64), category_column)
+
+        cat_codes, categories = pd.factorize(grouped.index.get_level_values(0), sort=True)
+        day_values = grouped.index.get_level_values(1).to_numpy().astype('datetime64[D]')
+        first_day = day_values.min()
+        day_codes = ((day_values - first_day) // _ONE_DAY).astype(np.int64)
+        all_days = np.arange(first_day, day_values.max() + _ONE_DAY, dtype='datetime64[D]')
+
+        values = np.zeros((len(categories), len(all_days)), dtype=np.float64)
+        counts = np.zeros((len(categories), len(all_days)), dtype=np.int64)
+        values[cat_codes, day_codes] = grouped['sum'].to_numpy(dtype=np.float64)
+        counts[cat_codes, day_codes] = grouped['size'].to_numpy()
+
+        return cls(np.asarray(categories), all_days, values, counts, category_column)
+
+    def top_categories(self, top_n: int) -> List:
+        """
+        Return the top N categories by total value, largest first.
+
+        Args:
+            top_n (int): The number of categories to return.
+
+        Returns:
+            List: Category labels sorted by total value in descending order.
+        """
+        order = np.argsort(-self.totals, kind='stable')[:top_n]
+        return self.categories[order].tolist()
+
+    def _rows(self, categories: Optional[Iterable] = None, top_n: Optional[int] = None) -> np.ndarray:
+        """Positions of the selected categories, kept in cube (sorted) order."""
+        if top_n:
+            return np.sort(np.argsort(-self.totals, kind='stable')[:top_n])
+        if categories is not None:
+            return np.flatnonzero(np.isin(self.categories, list(categories)))
+        return np.arange(len(self.categories))
+
+    def aggregate(self, freq: str = 'D', categories: Optional[Iterable] = None,
+                  top_n: Optional[int] = None) -> pd.DataFrame:
+        """
+        Sum the cube into calendar periods.
+
+        Args:
+            freq (str): 'D' daily, 'W' weekly or 'M' monthly (any pandas period alias).
+            categories (Optional[Iterable]): Restrict to these categories. Defaults to None.
+            top_n (Optional[int]): Restrict to the top N categories by total. Defaults to None.
+
+        Returns:
+            pd.DataFrame: Period start as index (named 'period'), one column per
+            category. Cells for periods where a category had no rows are NaN and
+            periods without any rows for the selected categories are dropped.
+        """
+        rows = self._rows(categories, top_n)
+        values = self.values[rows]
+        counts = self.counts[rows]
+
+        starts = pd.DatetimeIndex(self.days).to_period(freq).start_time
+        if freq.upper() != 'D':
+            # Days are contiguous and sorted, so each period is one contiguous run
+            starts, offsets = np.unique(starts.to_numpy(), return_index=True)
+            starts = pd.DatetimeIndex(starts)
+            if values.shape[1]:
+                values = np.add.reduceat(values, offsets, axis=1)
+                counts = np.add.reduceat(counts, offsets, axis=1)
+
+        present = counts.sum(axis=0) > 0
+        table = np.where(counts > 0, values, np.nan)[:, present].T
+        return pd.DataFrame(
+            table,
+            index=pd.Index(starts[present], name='period'),
+            columns=pd.Index(self.categories[rows], name=self.category_column),
+        )
+
+    def growth(self, freq: str = 'M', categories: Optional[Iterable] = None,
+               top_n: Optional[int] = None) -> pd.DataFrame:
+        """
+        Percentage growth between consecutive periods.
+
+        Args:
+            freq (str): 'D' daily, 'W' weekly or 'M' monthly. Defaults to 'M'.
+            categories (Optional[Iterable]): Restrict to these categories. Defaults to None.
+            top_n (Optional[int]): Restrict to the top N categories by total. Defaults to None.
+
+        Returns:
+            pd.DataFrame: Growth in percent per period and category; the first period
+            and cells next to a missing period are 0.
+        """
+        totals = self.aggregate(freq, categories, top_n)
+        values = totals.to_numpy()
+        growth = np.full_like(values, np.nan)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            growth[1:] = (values[1:] / values[:-1] - 1) * 100
+        growth = np.where(np.isnan(growth), 0.0, growth)
+        return pd.DataFrame(growth, index=totals.index, columns=totals.columns)
+
+    def rolling(self, window: int, categories: Optional[Iterable] = None,
+                top_n: Optional[int] = None, mean: bool = True) -> pd.DataFrame:
+        """
+        Trailing moving sum or average over ``window`` days.
+
+        Computed from a cumulative sum along the day axis, so the cost does
+        not depend on the window length.
+
+        Args:
+            window (int): Window length in days (e.g. 7, 28, 90).
+            categories (Optional[Iterable]): Restrict to these categories. Defaults to None.
+            top_n (Optional[int]): Restrict to the top N categories by total. Defaults to None.
+            mean (bool): Return the moving average instead of the moving sum. Defaults to True.
+
+        Returns:
+            pd.DataFrame: Day as index, one column per category. The first
+            ``window - 1`` days are NaN.
+        """
+        if window < 1:
+            raise ValueError("window must be a positive integer.")
+        rows = self._rows(categories, top_n)
+        values = self.values[rows]
+        csum = np.concatenate([np.zeros((len(rows), 1)), np.cumsum(values, axis=1)], axis=1)
+
+        moving = np.full(values.shape, np.nan)
+        if values.shape[1] >= window:
+            moving[:, window - 1:] = csum[:, window:] - csum[:, :-window]
+            if mean:
+                moving /= window
+
+        return pd.DataFrame(
+            moving.T,
+            index=pd.DatetimeIndex(self.days, name='period'),
+            columns=pd.Index(self.categories[rows], name=self.category_column),
+        )
+
+    def rolling_growth(self, window: int, categories: Optional[Iterable] = None,
+                       top_n: Optional[int] = None) -> pd.DataFrame:
+        """
+        Percentage growth of each trailing ``window``-day total over the previous one.
+
+        Args:
+            window (int): Window length in days.
+            categories (Optional[Iterable]): Restrict to these categories. Defaults to None.
+            top_n (Optional[int]): Restrict to the top N categories by total. Defaults to None.
+
+        Returns:
+            pd.DataFrame: Day as index, one column per category. Days without two
+            complete windows are NaN.
+        """
+        moving = self.rolling(window, categories, top_n, mean=False)
+        values = moving.to_numpy()
+        growth = np.full_like(values, np.nan)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            growth[window:] = (values[window:] / values[:-window] - 1) * 100
+        return pd.DataFrame(growth, index=moving.index, columns=moving.columns)
+
+    def growth_report(self, freqs: Iterable[str] = ('D', 'W', 'M'),
+                      windows: Iterable[int] = (7, 28, 90),
+                      top_n: Optional[int] = None) -> Dict[str, pd.DataFrame]:
+        """
+        Compute period growth and rolling averages for several frequencies at once.
+
+        Args:
+            freqs (Iterable[str]): Period frequencies. Defaults to ('D', 'W', 'M').
+            windows (Iterable[int]): Rolling window lengths in days. Defaults to (7, 28, 90).
+            top_n (Optional[int]): Restrict to the top N categories by total. Defaults to None.
+
+        Returns:
+            Dict[str, pd.DataFrame]: Keys 'growth_<freq>' and 'rolling_<window>d'.
+        """
+        report = {f"growth_{freq}": self.growth(freq, top_n=top_n) for freq in freqs}
+        report.update({f"rolling_{window}d": self.rolling(window, top_n=top_n) for window in windows})
+        return report
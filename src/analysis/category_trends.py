@@ -4,6 +4,16 @@ from typing import List, Dict, Optional
 import re
 from collections import Counter
 
+from ..preprocessing.columnar_store import accepts_columnar_store
+from ..preprocessing.time_features import WEEKDAY_NAMES, trending_months, weekday_codes
+from .category_cube import CategoryDayCube
+from .date_index import DateRangeIndex
+from .group_utils import grouped_mode, count_delimited
+from .near_duplicates import drop_near_duplicates
+from .sketches import PrioritySample, top_estimates, top_k_keys
+from .trending_cube import TrendingCube
+
+@accepts_columnar_store(columns=[], column_args=('category_column',))
 def extract_categories(data: pd.DataFrame, category_column: str) -> List[str]:
     """
     Extract unique categories from a specified column in the dataset.
@@ -20,12 +30,14 @@ def extract_categories(data: pd.DataFrame, category_column: str) -> List[str]:
     """
     return data[category_column].dropna().unique().tolist()
 
-def filter_trends(data: pd.DataFrame, start_date: Optional[str] = None, end_date: Optional[str] = None) -> pd.DataFrame:
+@accepts_columnar_store
+def filter_trends(data, start_date: Optional[str] = None, end_date: Optional[str] = None) -> pd.DataFrame:
     """
     Filter the dataset based on a given date range.
 
     Args:
-        data (pd.DataFrame): The input DataFrame containing a 'date' column.
+        data (pd.DataFrame or DateRangeIndex): The input DataFrame containing a 'date' column,
+            or a prebuilt DateRangeIndex for repeated queries.
         start_date (Optional[str]): The start date in 'YYYY-MM-DD' format. Defaults to None.
         end_date (Optional[str]): The end date in 'YYYY-MM-DD' format. Defaults to None.
 
@@ -34,41 +46,37 @@ def filter_trends(data: pd.DataFrame, start_date: Optional[str] = None, end_date
 
     Notes:
         The 'date' column must be in datetime format or convertible to it.
+        A DateRangeIndex (or a frame already sorted by 'date') is answered with
+        binary search and positional slicing instead of boolean masks.
     """
+    if isinstance(data, DateRangeIndex):
+        return data.range(start_date, end_date)
+    dates = data['date']
+    if pd.api.types.is_datetime64_any_dtype(dates) and dates.is_monotonic_increasing:
+        lo = dates.searchsorted(pd.to_datetime(start_date), side='left') if start_date else 0
+        hi = dates.searchsorted(pd.to_datetime(end_date), side='right') if end_date else len(data)
+        return data.iloc[lo:max(lo, hi)]
     if start_date:
         data = data[data['date'] >= pd.to_datetime(start_date)]
     if end_date:
         data = data[data['date'] <= pd.to_datetime(end_date)]
     return data
 
+@accepts_columnar_store(columns=['date'], column_args=('category_column', 'value_column'))
 def calculate_category_growth(data: pd.DataFrame, category_column: str, value_column: str, top_n: int = None, freq='M') -> pd.DataFrame:
     """
     Calculate percentage growth with time aggregation (e.g. monthly or weekly).
     
     freq: 'M' for monthly, 'W' for weekly, 'D' for daily (default)
-    """
-    if 'date' not in data.columns:
-        raise KeyError("The column 'date' is not found in the dataset.")
-
-    data['date'] = pd.to_datetime(data['date'], errors='coerce')
-    data = data.dropna(subset=['date'])
-
-    # Aggregate dates to the freq period (e.g. month start)
-    data['period'] = data['date'].dt.to_period(freq).dt.start_time
-
-    if top_n:
-        top_categories = data.groupby(category_column)[value_column].sum().nlargest(top_n).index
-        data = data[data[category_column].isin(top_categories)]
-
-    grouped = data.groupby([category_column, 'period'])[value_column].sum().reset_index()
-    pivoted = grouped.pivot(index='period', columns=category_column, values=value_column)
-    growth = pivoted.pct_change(fill_method=None).fillna(0) * 100
-
-    return growth
-
 
+    The totals come from a CategoryDayCube; build one directly when several
+    frequencies or rolling windows are needed from the same data.
+    """
+    cube = CategoryDayCube.from_frame(data, category_column, value_column)
+    return cube.growth(freq=freq, top_n=top_n)
 
 
+@accepts_columnar_store(columns=[], column_args=('category_column', 'value_column'))
 def identify_top_categories(data: pd.DataFrame, category_column: str, value_column: str, top_n: int = 5) -> List[str]:
     """
     Identify the top N categories based on total value.
@@ -82,9 +90,10 @@ def identify_top_categories(data: pd.DataFrame, category_column: str, value_colu
     Returns:
         List[str]: A list of top N category names sorted by total value in descending order.
     """
-    totals = data.groupby(category_column)[value_column].sum()
+    totals = data.groupby(category_column, observed=True)[value_column].sum()
     return totals.sort_values(ascending=False).head(top_n).index.tolist()
 
+@accepts_columnar_store(columns=['date', 'category'], column_args=('value_column',))
 def compare_trends(data: pd.DataFrame, categories: List[str], value_column: str) -> pd.DataFrame:
     """
     Compare the value trends of selected categories over time.
@@ -98,8 +107,10 @@ def compare_trends(data: pd.DataFrame, categories: List[str], value_column: str)
         pd.DataFrame: A pivoted DataFrame showing values by date and category.
     """
     filtered = data[data['category'].isin(categories)]
-    return filtered.pivot_table(index='date', columns='category', values=value_column, aggfunc='sum')
+    return filtered.pivot_table(index='date', columns='category', values=value_column, aggfunc='sum',
+                                observed=True)
 
+@accepts_columnar_store(columns=[], column_args=('category_column', 'value_column'))
 def aggregate_category_data(data: pd.DataFrame, category_column: str, value_column: str) -> pd.DataFrame:
     """
     Aggregate numeric data by category and compute summary statistics.
@@ -112,9 +123,10 @@ def aggregate_category_data(data: pd.DataFrame, category_column: str, value_colu
     Returns:
         pd.DataFrame: A DataFrame with aggregated statistics (sum, mean, std, count) per category.
     """
-    return data.groupby(category_column)[value_column].agg(['sum', 'mean', 'std', 'count']).reset_index()
+    return data.groupby(category_column, observed=True)[value_column].agg(['sum', 'mean', 'std', 'count']).reset_index()
 
 
+@accepts_columnar_store(columns=['days_to_trend', 'category_name'])
 def average_days_to_trend_by_category(df: pd.DataFrame) -> pd.DataFrame:
     """
     Compute the average number of days it takes for a video to trend after publishing, grouped by category.
@@ -122,73 +134,114 @@ def average_days_to_trend_by_category(df: pd.DataFrame) -> pd.DataFrame:
     Returns:
         pd.DataFrame: category_name and average days_to_trend
     """
+    valid = df["days_to_trend"] > 0
     return (
-        df[df["days_to_trend"] > 0]
-        .groupby("category_name")["days_to_trend"]
+        df["days_to_trend"][valid]
+        .groupby(df["category_name"][valid], observed=True)
         .mean()
         .sort_values()
         .reset_index(name="avg_days_to_trend")
     )
 
+@accepts_columnar_store(columns=['publish_weekday', 'publish_time'])
 def trending_day_distribution(df: pd.DataFrame) -> pd.DataFrame:
     """
     Counts how many videos trended on each day of the week.
 
     Parameters:
-        df (pd.DataFrame): Must contain 'publish_weekday' column with day names (e.g., 'Monday').
+        df (pd.DataFrame or TrendingCube): Must contain a 'publish_weekday' column (day names, or the
+            Categorical from ``add_time_features``) or 'publish_time', or be a prebuilt TrendingCube.
 
     Returns:
         pd.DataFrame: A DataFrame with 'weekday' and 'count', sorted from Monday to Sunday.
     """
-    weekday_order = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
-    df['publish_weekday'] = pd.Categorical(df['publish_weekday'], categories=weekday_order, ordered=True)
+    if isinstance(df, TrendingCube):
+        return df.trending_day_distribution()
+    codes = weekday_codes(df)
+    counts = np.bincount(codes[codes >= 0], minlength=len(WEEKDAY_NAMES))
 
-    return (
-        df['publish_weekday']
-        .value_counts()
-        .sort_index()
-        .reset_index(name='count')
-        .rename(columns={'index': 'weekday'})
-    )
+    return pd.DataFrame({
+        'weekday': pd.Categorical(WEEKDAY_NAMES, categories=WEEKDAY_NAMES, ordered=True),
+        'count': counts.astype(np.int64),
+    })
 
 
+@accepts_columnar_store(columns=['trending_month', 'trending_date'])
 def trending_by_month(df: pd.DataFrame) -> pd.DataFrame:
     """
     Calculate the number of trending videos per month.
 
+    Args:
+        df (pd.DataFrame or TrendingCube): Data with a 'trending_month' feature or a 'trending_date'
+            column, or a prebuilt TrendingCube.
+
     Returns:
         pd.DataFrame: month and count of trending videos
     """
-    df["trending_month"] = pd.to_datetime(df["trending_date"]).dt.month
+    if isinstance(df, TrendingCube):
+        return df.trending_by_month()
+    months = trending_months(df).rename("month")
     return (
-        df["trending_month"]
+        months
         .value_counts()
         .sort_index()
         .reset_index(name="count")
-        .rename(columns={"index": "month"})
     )
 
-def analyze_top_tags_by_category(df: pd.DataFrame, top_n: int = 10) -> dict:
+def _normalize_tags(tags: pd.Series) -> pd.Series:
+    """Lowercase '|'-separated tags, drop quotes and separate them with commas."""
+    return tags.str.lower().str.replace('"', '').str.replace('|', ',')
+
+
+@accepts_columnar_store(columns=['tags', 'category_name', 'title', 'channel_title', 'publish_time', 'trending_date', 'duplicate_cluster'])
+def analyze_top_tags_by_category(df: pd.DataFrame, top_n: int = 10, approximate: bool = False,
+                                 dedupe: bool = False, epsilon: float = 0.001) -> dict:
     """
     Analyzes top tags per category from trending videos.
 
     Args:
         df (pd.DataFrame): DataFrame containing 'tags' and 'category_name' columns.
         top_n (int): Number of top tags to return per category.
+        approximate (bool): Estimate tag counts from a priority sample of about
+            ``100 / epsilon`` videos per category (see ``PrioritySample``) instead of
+            splitting the tags of every video. Defaults to False.
+        dedupe (bool): Drop reuploads of near-duplicate titles by other channels
+            (see ``drop_near_duplicates``) before counting. Defaults to False.
+        epsilon (float): Error parameter of the approximate path. Defaults to 0.001.
 
     Returns:
         dict: Dictionary where keys are categories and values are DataFrames of top tags.
     """
     tag_by_category = {}
-
-    # Ensure correct format
-    df = df.dropna(subset=['tags', 'category_name']).copy()
-    df['tags'] = df['tags'].str.lower().str.replace('"', '').str.replace('|', ',')
+    if dedupe:
+        df = drop_near_duplicates(df)
+
+    valid = df['tags'].notna() & df['category_name'].notna()
+
+    if approximate:
+        # Sample videos per category first: only the sampled videos' tags are split
+        raw_tags = df['tags'][valid].reset_index(drop=True)
+        categories = df['category_name'][valid].reset_index(drop=True)
+        for category, positions in categories.groupby(categories, observed=True).indices.items():
+            rows = PrioritySample.from_error(epsilon, seed=0).update(positions).estimates()
+            # A video trends for several days: split each distinct tag string once
+            rows['key'] = raw_tags.iloc[rows['key'].to_numpy(dtype=np.int64)].to_numpy()
+            per_string = rows.groupby('key', sort=False)[['count', 'variance']].sum()
+            split = [[tag.strip() for tag in tags.split(',')]
+                     for tags in _normalize_tags(per_string.index.to_series())]
+            per_tag = per_string.iloc[np.repeat(np.arange(len(split)), [len(tags) for tags in split])]
+            per_tag = per_tag.reset_index(drop=True).assign(key=[tag for tags in split for tag in tags])
+            top = top_estimates(per_tag[(per_tag['key'] != '') & (per_tag['key'] != '[none]')], top_n)
+            tag_by_category[category] = pd.DataFrame({'tag': top['key'], 'count': top['count'].round().astype(int)})
+        return tag_by_category
+
+    # Ensure correct format, working on the two needed columns only
+    tags = _normalize_tags(df['tags'][valid])
 
     # Group by category
-    for category, group in df.groupby('category_name'):
+    for category, group in tags.groupby(df['category_name'][valid], observed=True):
         all_tags = [
-            tag.strip() for tags in group['tags']
+            tag.strip() for tags in group
             for tag in tags.split(',') if tag and tag != '[none]'
         ]
         tag_counts = Counter(all_tags)
@@ -199,6 +252,7 @@ def analyze_top_tags_by_category(df: pd.DataFrame, top_n: int = 10) -> dict:
 
 
 
+@accepts_columnar_store(columns=['title', 'category_name', 'views', 'likes', 'comment_count'])
 def analyze_clickbait_effect_by_category(df: pd.DataFrame, keywords=None) -> pd.DataFrame:
     """
     Analyze how clickbait-style keywords in video titles impact engagement within each category.
@@ -220,51 +274,73 @@ def analyze_clickbait_effect_by_category(df: pd.DataFrame, keywords=None) -> pd.
 
     pattern = '|'.join(re.escape(word.lower()) for word in keywords)
 
-    df = df.copy()
-    df['clickbait_in_title'] = df['title'].str.lower().str.contains(pattern, na=False)
+    clickbait = df['title'].str.lower().str.contains(pattern, na=False).rename('clickbait_in_title')
 
     result = (
-        df.groupby(['category_name', 'clickbait_in_title'])[['views', 'likes', 'comment_count']]
+        df.groupby([df['category_name'], clickbait], observed=True)[['views', 'likes', 'comment_count']]
         .mean()
         .reset_index()
     )
     return result
 
 
-def summarize_top_trending_channels(df, top_n=10):
+@accepts_columnar_store(columns=['video_id', 'views', 'likes', 'category_name', 'title', 'channel_title', 'publish_time', 'trending_date', 'duplicate_cluster'])
+def summarize_top_trending_channels(df, top_n=10, approximate=False, dedupe=False):
     """
     Returns the top N most consistently trending channels and their common traits.
+
+    With approximate=True the top channels are picked from a priority sample of
+    the rows (``approximate_top_k``) instead of an exact value_counts over every
+    channel. With dedupe=True, reuploads of near-duplicate titles by other
+    channels are dropped first.
     """
-    top_channels = df['channel_title'].value_counts().head(top_n).index
+    if dedupe:
+        df = drop_near_duplicates(df)
+    top_channels = top_k_keys(df['channel_title'], top_n, approximate=approximate)
     subset = df[df['channel_title'].isin(top_channels)]
 
     summary = (
-        subset.groupby('channel_title')
+        subset.groupby('channel_title', observed=True)
         .agg(trending_count=('video_id', 'count'),
              unique_videos=('video_id', 'nunique'),
              avg_views=('views', 'mean'),
-             avg_likes=('likes', 'mean'),
-             most_common_category=('category_name', lambda x: x.mode().iloc[0] if not x.mode().empty else 'N/A'))
-        .reset_index()
-        .sort_values(by='trending_count', ascending=False)
+             avg_likes=('likes', 'mean'))
+    )
+    summary['most_common_category'] = (
+        grouped_mode(subset['channel_title'], subset['category_name'], default='N/A')
+        .reindex(summary.index, fill_value='N/A')
     )
 
-    return summary
+    return summary.reset_index().sort_values(by='trending_count', ascending=False)
 
 
-def analyze_channel_format_category_consistency(df, min_trending=10):
+@accepts_columnar_store(columns=['video_id', 'category_name', 'tags', 'title', 'channel_title', 'publish_time', 'trending_date', 'duplicate_cluster'])
+def analyze_channel_format_category_consistency(df, min_trending=10, dedupe=False):
     """
     Checks if high-trending channels tend to stick to consistent categories or varied ones.
+
+    With dedupe=True, reuploads of near-duplicate titles by other channels are dropped first.
     """
+    if dedupe:
+        df = drop_near_duplicates(df)
+    channels = df['channel_title']
+
     # Filter to channels with many trending videos
     channel_stats = (
-        df.groupby('channel_title')
+        df.groupby(channels, observed=True)
         .agg(
             trending_count=('video_id', 'count'),
             unique_categories=('category_name', 'nunique'),
-            common_category=('category_name', lambda x: x.mode().iloc[0] if not x.mode().empty else 'N/A'),
-            avg_tags_per_video=('tags', lambda x: x.apply(lambda t: len(str(t).split('|'))).mean())
         )
+    )
+    channel_stats['common_category'] = (
+        grouped_mode(channels, df['category_name'], default='N/A')
+        .reindex(channel_stats.index, fill_value='N/A')
+    )
+    channel_stats['avg_tags_per_video'] = count_delimited(df['tags']).groupby(channels, observed=True).mean()
+
+    channel_stats = (
+        channel_stats
         .query('trending_count >= @min_trending')
         .sort_values(by='trending_count', ascending=False)
     )
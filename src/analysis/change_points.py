@@ -0,0 +1,283 @@
+import warnings
+
+import pandas as pd
+import numpy as np
+from typing import Optional, Sequence
+
+# =============================================================
+# Change Points & Spikes - YouTube Dataset
+# =============================================================
+# Detection on the category x day series behind
+# `plot_category_trends`, for every (country, category) series at
+# once:
+#   - detect_spikes: rolling robust z-scores (median / MAD of the
+#     trailing window) flag single days far from the recent level
+#   - detect_change_points: binary segmentation for shifts in the
+#     mean, run for all series and segments together; each round is
+#     one vectorized pass over prefix sums, so runtime is near-linear
+#     in the series length
+# The outputs feed `highlight_trend_peaks` and
+# `annotate_trend_changes` directly.
+# =============================================================
+
+DEFAULT_SERIES_KEYS = ('country', 'category_name')
+
+# MAD and mean absolute deviation to standard deviation for normal data
+_MAD_SCALE = 1.4826
+_MEAN_AD_SCALE = 1.2533
+
+
+def build_category_day_series(data: pd.DataFrame, value_column: str = 'views',
+                              by: Sequence[str] = DEFAULT_SERIES_KEYS,
+                              date_column: str = 'trending_date') -> pd.DataFrame:
+    """
+    Daily totals of ``value_column`` per series as a dense matrix.
+
+    One series per combination of the ``by`` columns present in ``data``
+    (e.g. country and category); days without rows are 0, as in the daily
+    resample of ``plot_category_trends``. Rows with a missing key or date
+    are ignored.
+
+    Args:
+        data (pd.DataFrame): Trending snapshots.
+        value_column (str): Column to sum. Defaults to 'views'.
+        by (Sequence[str]): Series key columns. Missing columns are skipped.
+            Defaults to ('country', 'category_name').
+        date_column (str): Date column. Defaults to 'trending_date'.
+
+    Returns:
+        pd.DataFrame: One row per series (indexed by the keys, sorted) and
+        one column per day of the contiguous date range.
+
+    Raises:
+        KeyError: If ``value_column`` or ``date_column`` does not exist in the DataFrame.
+    """
+    for column in (value_column, date_column):
+        if column not in data.columns:
+            raise KeyError(f"The column '{column}' is not found in the dataset.")
+    by = [c for c in by if c in data.columns]
+    days = pd.to_datetime(data[date_column], errors='coerce').to_numpy(dtype='datetime64[ns]').astype('datetime64[D]')
+    factorized = [pd.factorize(data[column], sort=True) for column in by]
+    codes = np.ravel_multi_index([np.maximum(c, 0) for c, _ in factorized],
+                                 [max(len(uniques), 1) for _, uniques in factorized]) if by \
+        else np.zeros(len(data), dtype=np.int64)
+    valid = ~np.isnat(days)
+    for c, _ in factorized:
+        valid &= c >= 0
+    values = pd.to_numeric(data[value_column], errors='coerce').to_numpy(dtype=np.float64)
+    values = np.where(np.isnan(values), 0.0, values)
+
+    if not valid.any():
+        return pd.DataFrame(index=pd.MultiIndex.from_arrays([[]] * len(by), names=by) if by else None)
+    day_number = days[valid].view(np.int64)
+    first = day_number.min()
+    n_days = int(day_number.max() - first + 1)
+    present, series = np.unique(codes[valid], return_inverse=True)
+    matrix = np.bincount(series * n_days + (day_number - first), weights=values[valid],
+                         minlength=len(present) * n_days).reshape(len(present), n_days)
+
+    columns = pd.DatetimeIndex(np.arange(first, first + n_days).astype('datetime64[D]').astype('datetime64[ns]'),
+                               name=date_column)
+    if by:
+        levels = np.unravel_index(present, [max(len(uniques), 1) for _, uniques in factorized])
+        index = pd.MultiIndex.from_arrays([np.asarray(uniques)[level] for (_, uniques), level in zip(factorized, levels)],
+                                          names=by) if len(by) > 1 \
+            else pd.Index(np.asarray(factorized[0][1])[levels[0]], name=by[0])
+    else:
+        index = pd.Index([value_column])
+    return pd.DataFrame(matrix, index=index, columns=columns)
+
+
+def _long_frame(series: pd.DataFrame, rows: np.ndarray, cols: np.ndarray, columns: dict) -> pd.DataFrame:
+    """Detection results as rows of (keys..., date, columns...)."""
+    keys = series.index[rows].to_frame(index=False) if len(series) else pd.DataFrame()
+    keys[series.columns.name or 'date'] = series.columns[cols]
+    for name, values in columns.items():
+        keys[name] = values
+    return keys
+
+
+def detect_spikes(series: pd.DataFrame, window: int = 28, threshold: float = 3.5,
+                  min_periods: Optional[int] = None) -> pd.DataFrame:
+    """
+    Flag days far from the recent level of their series (robust z-score).
+
+    The baseline of day t is the median of the ``window`` days before it
+    and the scale is their MAD (median absolute deviation), so a spike
+    does not inflate its own baseline and earlier spikes barely move it.
+    The modified z-score ``(x - median) / (1.4826 * MAD)`` is flagged when
+    its absolute value exceeds ``threshold``. When the MAD is 0 the mean
+    absolute deviation is used; windows that are completely flat are
+    skipped. All series are scored together in O(n * window).
+
+    Args:
+        series (pd.DataFrame): Series matrix from ``build_category_day_series``
+            (or any frame with one series per row and dates as columns).
+        window (int): Trailing window length in days. Defaults to 28 (four
+            weeks, so weekday effects are part of the baseline).
+        threshold (float): Absolute z-score to flag. Defaults to 3.5.
+        min_periods (Optional[int]): Days of history needed before scoring.
+            Defaults to ``window``.
+
+    Returns:
+        pd.DataFrame: One row per spike with the series keys, the date,
+        'value', 'baseline' (window median), 'z_score' and 'direction'
+        ('spike' or 'dip'), in series and date order.
+    """
+    values = series.to_numpy(dtype=np.float64)
+    m, n = values.shape
+    min_periods = window if min_periods is None else min_periods
+    empty = {'value': [], 'baseline': [], 'z_score': [], 'direction': []}
+    if n <= min_periods or not m:
+        return _long_frame(series, np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64), empty)
+
+    # Trailing windows of day t cover t - window .. t - 1; pad the start with NaN
+    padded = np.concatenate([np.full((m, window), np.nan), values], axis=1)
+    windows = np.lib.stride_tricks.sliding_window_view(padded, window, axis=1)[:, :n]
+    baseline = np.full((m, n), np.nan)
+    scale = np.full((m, n), np.nan)
+    # Full windows take the fast NaN-free median; only the first days need nanmedian
+    for part, median, mean in ((slice(window, n), np.median, np.mean),
+                               (slice(min(min_periods, window), window), np.nanmedian, np.nanmean)):
+        block = windows[:, part]
+        if not block.size:
+            continue
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore', RuntimeWarning)
+            center = median(block, axis=2)
+            deviation = np.abs(block - center[..., None])
+            mad = _MAD_SCALE * median(deviation, axis=2)
+            fallback = _MEAN_AD_SCALE * mean(deviation, axis=2)
+        baseline[:, part] = center
+        scale[:, part] = np.where(mad > 0, mad, fallback)
+    z = np.divide(values - baseline, scale, out=np.zeros_like(values), where=scale > 0)
+    z[:, :min_periods] = 0.0
+
+    rows, cols = np.nonzero(np.abs(z) > threshold)
+    return _long_frame(series, rows, cols, {
+        'value': values[rows, cols],
+        'baseline': baseline[rows, cols],
+        'z_score': z[rows, cols],
+        'direction': np.where(z[rows, cols] > 0, 'spike', 'dip'),
+    })
+
+
+def _noise_scale(values: np.ndarray) -> np.ndarray:
+    """Per-series noise level: MAD of first differences / sqrt(2), robust to level shifts."""
+    if values.shape[1] < 3:
+        return np.ones(len(values))
+    diffs = np.diff(values, axis=1)
+    deviation = np.abs(diffs - np.median(diffs, axis=1, keepdims=True))
+    scale = _MAD_SCALE * np.median(deviation, axis=1) / np.sqrt(2)
+    fallback = _MEAN_AD_SCALE * deviation.mean(axis=1) / np.sqrt(2)
+    return np.where(scale > 0, scale, np.where(fallback > 0, fallback, 1.0))
+
+
+def detect_change_points(series: pd.DataFrame, penalty: Optional[float] = None, min_size: int = 7,
+                         max_change_points: Optional[int] = None) -> pd.DataFrame:
+    """
+    Find shifts in the mean level of every series with binary segmentation.
+
+    Each series is scaled by its noise level (MAD of day-to-day changes),
+    then segments are split recursively at the point that most reduces the
+    squared error, as long as the reduction exceeds ``penalty``. All
+    segments of all series are searched in one vectorized pass per round
+    (prefix sums give every candidate split's gain in O(1)), so a round
+    costs O(n) per series and the number of rounds is the depth of the
+    segmentation (about log n for well-spread change points).
+
+    Args:
+        series (pd.DataFrame): Series matrix from ``build_category_day_series``.
+        penalty (Optional[float]): Minimum gain (in squared noise units) of a
+            split. Defaults to ``2 * log(n)`` for n days (BIC-like).
+        min_size (int): Minimum days between change points and from the
+            series ends. Defaults to 7.
+        max_change_points (Optional[int]): Keep at most this many change
+            points per series (the largest gains). Defaults to no limit.
+
+    Returns:
+        pd.DataFrame: One row per change point with the series keys, the
+        date (first day of the new level), 'value' (series value that day),
+        'mean_before', 'mean_after' (means of the adjacent segments in the
+        series' units), 'change', 'relative_change' and 'gain', in series
+        and date order.
+    """
+    values = series.to_numpy(dtype=np.float64)
+    m, n = values.shape
+    penalty = 2 * np.log(max(n, 2)) if penalty is None else penalty
+    normalized = values / _noise_scale(values)[:, None]
+    prefix = np.zeros((m, n + 1))
+    np.cumsum(normalized, axis=1, out=prefix[:, 1:])
+    flat_prefix = prefix.ravel()
+
+    seg_series = np.arange(m)
+    seg_start = np.zeros(m, dtype=np.int64)
+    seg_end = np.full(m, n, dtype=np.int64)
+    found_series, found_split, found_gain = [], [], []
+
+    while len(seg_series):
+        lengths = seg_end - seg_start
+        candidates = np.maximum(lengths - 2 * min_size + 1, 0)
+        splittable = candidates > 0
+        seg_series, seg_start, seg_end = seg_series[splittable], seg_start[splittable], seg_end[splittable]
+        candidates = candidates[splittable]
+        if not len(seg_series):
+            break
+
+        # Flattened candidate splits of every segment
+        owner = np.repeat(np.arange(len(seg_series)), candidates)
+        offsets = np.cumsum(candidates) - candidates
+        split = seg_start[owner] + min_size + (np.arange(len(owner)) - offsets[owner])
+        base = seg_series[owner] * (n + 1)
+        start, end = seg_start[owner], seg_end[owner]
+        left = flat_prefix[base + split] - flat_prefix[base + start]
+        total = flat_prefix[base + end] - flat_prefix[base + start]
+        right = total - left
+        n_left, n_right = split - start, end - split
+        gain = left ** 2 / n_left + right ** 2 / n_right - total ** 2 / (n_left + n_right)
+
+        starts = offsets
+        best_gain = np.maximum.reduceat(gain, starts)
+        hit = np.where(gain == best_gain[owner], np.arange(len(gain)), len(gain))
+        best = np.minimum.reduceat(hit, starts)
+        accept = best_gain > penalty
+
+        found_series.append(seg_series[accept])
+        found_split.append(split[best[accept]])
+        found_gain.append(best_gain[accept])
+        chosen = split[best[accept]]
+        seg_series = np.concatenate([seg_series[accept], seg_series[accept]])
+        seg_start, seg_end = (np.concatenate([seg_start[accept], chosen]),
+                              np.concatenate([chosen, seg_end[accept]]))
+
+    rows = np.concatenate(found_series) if found_series else np.zeros(0, dtype=np.int64)
+    cols = np.concatenate(found_split) if found_split else np.zeros(0, dtype=np.int64)
+    gains = np.concatenate(found_gain) if found_gain else np.zeros(0)
+    if max_change_points is not None and len(rows):
+        # Largest gains first, then keep the first max_change_points per series
+        order = np.lexsort((-gains, rows))
+        rank = np.arange(len(order)) - np.searchsorted(rows[order], rows[order])
+        keep = order[rank < max_change_points]
+        rows, cols, gains = rows[keep], cols[keep], gains[keep]
+    order = np.lexsort((cols, rows))
+    rows, cols, gains = rows[order], cols[order], gains[order]
+
+    # Segment bounds around each change point: previous and next change point of the same series
+    same_before = np.r_[False, rows[1:] == rows[:-1]]
+    same_after = np.r_[rows[1:] == rows[:-1], False]
+    lower = np.where(same_before, np.r_[0, cols[:-1]], 0)
+    upper = np.where(same_after, np.r_[cols[1:], n], n)
+    raw_prefix = np.zeros((m, n + 1))
+    np.cumsum(values, axis=1, out=raw_prefix[:, 1:])
+    mean_before = (raw_prefix[rows, cols] - raw_prefix[rows, lower]) / np.maximum(cols - lower, 1)
+    mean_after = (raw_prefix[rows, upper] - raw_prefix[rows, cols]) / np.maximum(upper - cols, 1)
+    change = mean_after - mean_before
+    return _long_frame(series, rows, cols, {
+        'value': values[rows, cols],
+        'mean_before': mean_before,
+        'mean_after': mean_after,
+        'change': change,
+        'relative_change': np.divide(change, np.abs(mean_before), out=np.full(len(change), np.nan),
+                                     where=mean_before != 0),
+        'gain': gains,
+    })
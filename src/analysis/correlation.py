@@ -0,0 +1,272 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Sequence, Union
+
+import numpy as np
+import pandas as pd
+
+from .group_utils import sort_within_groups
+
+# =============================================================
+# Grouped Correlation - YouTube Dataset
+# =============================================================
+# Per-group (e.g. per-category) correlation matrices computed from
+# grouped sufficient statistics (counts, sums, cross-products) with
+# bincount, instead of one DataFrame.corr() per group, plus
+# vectorized percentile-bootstrap confidence intervals:
+#   - grouped_correlation: Pearson/Spearman matrices per group
+#   - bootstrap_correlation: correlations of one column with others,
+#     with CIs from resampling index matrices, run in parallel with
+#     reproducible SeedSequence streams
+# =============================================================
+
+METHODS = ('pearson', 'spearman')
+
+
+def _check_method(method: str) -> None:
+    if method not in METHODS:
+        raise ValueError(f"method must be one of {METHODS}, got '{method}'.")
+
+
+def _group_codes(df: pd.DataFrame, by: Optional[str]):
+    """Integer group code per row (-1 for a missing key) and the sorted group labels."""
+    if by is None:
+        return np.zeros(len(df), dtype=np.int64), pd.Index([None])
+    codes, labels = pd.factorize(df[by], sort=True)
+    return codes.astype(np.int64), pd.Index(labels, name=by)
+
+
+def _complete_rows(df: pd.DataFrame, columns: Sequence[str], codes: np.ndarray):
+    """Float matrix of the rows with a group and no missing value (listwise deletion)."""
+    values = np.empty((len(df), len(columns)), dtype=np.float64)
+    for j, column in enumerate(columns):
+        series = df[column]
+        if not pd.api.types.is_numeric_dtype(series):
+            series = pd.to_numeric(series, errors='coerce')
+        values[:, j] = series.to_numpy(dtype=np.float64, na_value=np.nan)
+    keep = (codes >= 0) & ~np.isnan(values).any(axis=1)
+    return values[keep], codes[keep]
+
+
+def _rank_within_groups(values: np.ndarray, codes: np.ndarray) -> np.ndarray:
+    """Average ranks of every column within each group (ties share their mean rank)."""
+    n = len(values)
+    ranks = np.empty_like(values, dtype=np.float64)
+    for j in range(values.shape[1]):
+        order = sort_within_groups(values[:, j], codes)
+        ordered_values, ordered_codes = values[order, j], codes[order]
+        new_group = np.ones(n, dtype=bool)
+        new_group[1:] = ordered_codes[1:] != ordered_codes[:-1]
+        new_tie = new_group.copy()
+        new_tie[1:] |= ordered_values[1:] != ordered_values[:-1]
+        # 1-based position within the group, averaged over each run of ties
+        group_start = np.maximum.accumulate(np.where(new_group, np.arange(n), 0))
+        position = np.arange(1, n + 1, dtype=np.float64) - group_start
+        tie = np.cumsum(new_tie) - 1
+        mean_rank = np.bincount(tie, position) / np.bincount(tie)
+        ranks[order, j] = mean_rank[tie]
+    return ranks
+
+
+def _rank_rows(values: np.ndarray) -> np.ndarray:
+    """Average ranks along the last axis of a 2-D array, one row per bootstrap replicate."""
+    n_rows, n = values.shape
+    order = np.argsort(values, axis=1, kind='stable')
+    ordered = np.take_along_axis(values, order, axis=1)
+    starts = np.ones((n_rows, n), dtype=bool)
+    starts[:, 1:] = ordered[:, 1:] != ordered[:, :-1]
+    # Tie groups numbered across all rows (every row starts a new group)
+    tie_group = np.cumsum(starts.ravel()) - 1
+    positions = np.tile(np.arange(1, n + 1, dtype=np.float64), n_rows)
+    mean_rank = np.bincount(tie_group, positions) / np.bincount(tie_group)
+    ranks = np.empty_like(values, dtype=np.float64)
+    np.put_along_axis(ranks, order, mean_rank[tie_group].reshape(n_rows, n), axis=1)
+    return ranks
+
+
+def grouped_comoments(values: np.ndarray, codes: np.ndarray, n_groups: int):
+    """
+    Counts, means and centered cross-product sums of each group.
+
+    Means come from grouped sums; the co-moments are then summed over data
+    centered on its group mean, which avoids the cancellation of
+    ``sum(xy) - sum(x) * sum(y) / n`` on large counts such as views.
+
+    Args:
+        values (np.ndarray): ``(n_rows, k)`` float matrix without missing values.
+        codes (np.ndarray): Group code (0 .. n_groups - 1) of every row.
+        n_groups (int): Number of groups.
+
+    Returns:
+        tuple: ``counts`` (n_groups,), ``means`` (n_groups, k) and ``comoments``
+        (n_groups, k, k).
+    """
+    k = values.shape[1]
+    counts = np.bincount(codes, minlength=n_groups).astype(np.float64)
+    sums = np.column_stack([np.bincount(codes, values[:, j], n_groups) for j in range(k)]) if k else \
+        np.zeros((n_groups, 0))
+    with np.errstate(invalid='ignore', divide='ignore'):
+        means = sums / counts[:, None]
+    centered = values - means[codes]
+
+    comoments = np.empty((n_groups, k, k), dtype=np.float64)
+    for i in range(k):
+        for j in range(i, k):
+            comoments[:, i, j] = comoments[:, j, i] = np.bincount(codes, centered[:, i] * centered[:, j], n_groups)
+    return counts, means, comoments
+
+
+def _comoments_to_corr(comoments: np.ndarray) -> np.ndarray:
+    variances = np.diagonal(comoments, axis1=1, axis2=2)
+    scale = np.sqrt(variances[:, :, None] * variances[:, None, :])
+    with np.errstate(invalid='ignore', divide='ignore'):
+        return comoments / scale
+
+
+def grouped_correlation(df: pd.DataFrame, columns: Sequence[str], by: Optional[str] = None,
+                        method: str = 'pearson', min_count: int = 3) -> pd.DataFrame:
+    """
+    Correlation matrix of ``columns`` within every group, in one vectorized pass.
+
+    Equivalent to ``df.groupby(by)[columns].corr(method)`` on rows without
+    missing values, but computed from grouped sufficient statistics instead
+    of one ``corr()`` call per group.
+
+    Args:
+        df (pd.DataFrame): Input data.
+        columns (Sequence[str]): Numeric columns to correlate.
+        by (Optional[str]): Group column (e.g. 'category_name'). None correlates all rows.
+        method (str): 'pearson' or 'spearman' (Pearson on within-group average ranks).
+        min_count (int): Groups with fewer complete rows get NaN. Defaults to 3.
+
+    Returns:
+        pd.DataFrame: Indexed by (group, variable) - or by variable alone when
+        ``by`` is None - with one column per variable.
+    """
+    _check_method(method)
+    columns = list(columns)
+    codes, labels = _group_codes(df, by)
+    values, codes = _complete_rows(df, columns, codes)
+    if method == 'spearman':
+        values = _rank_within_groups(values, codes)
+
+    counts, _, comoments = grouped_comoments(values, codes, len(labels))
+    corr = _comoments_to_corr(comoments)
+    corr[counts < max(min_count, 2)] = np.nan
+
+    index = pd.Index(columns)
+    if by is None:
+        return pd.DataFrame(corr[0], index=index, columns=columns)
+    index = pd.MultiIndex.from_product([labels, columns], names=[by, None])
+    return pd.DataFrame(corr.reshape(-1, len(columns)), index=index, columns=columns)
+
+
+def _row_corr(x: np.ndarray, y: np.ndarray) -> np.ndarray:
+    """Pearson correlation of every row of ``x`` with the same row of ``y`` (both 2-D)."""
+    xc = x - x.mean(axis=1, keepdims=True)
+    yc = y - y.mean(axis=1, keepdims=True)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        return (xc * yc).sum(axis=1) / np.sqrt((xc * xc).sum(axis=1) * (yc * yc).sum(axis=1))
+
+
+def _bootstrap_batch(values: np.ndarray, method: str, n_boot: int, seed: np.random.SeedSequence) -> np.ndarray:
+    """
+    Correlations of column 0 with every other column on ``n_boot`` resamples.
+
+    All resamples of the batch are drawn as one ``(n_boot, n)`` index matrix.
+    """
+    n = len(values)
+    rng = np.random.default_rng(seed)
+    index = rng.integers(0, n, size=(n_boot, n))
+    x = values[:, 0][index]
+    if method == 'spearman':
+        x = _rank_rows(x)
+    result = np.empty((n_boot, values.shape[1] - 1))
+    for j in range(1, values.shape[1]):
+        y = values[:, j][index]
+        result[:, j - 1] = _row_corr(x, _rank_rows(y) if method == 'spearman' else y)
+    return result
+
+
+def bootstrap_correlation(df: pd.DataFrame, x: str, y: Union[str, Sequence[str]], by: Optional[str] = None,
+                          method: str = 'pearson', n_boot: int = 1000, confidence: float = 0.95,
+                          seed: Optional[int] = 0, n_jobs: Optional[int] = None, min_count: int = 3,
+                          max_batch_elements: int = 2_000_000) -> pd.DataFrame:
+    """
+    Correlation of ``x`` with each ``y`` column per group, with bootstrap confidence intervals.
+
+    Rows are resampled with replacement within each group. Replicates are
+    drawn in batches whose ``(replicates, rows)`` index matrix holds at most
+    ``max_batch_elements`` entries, and batches run on a thread pool. Every
+    batch gets its own child of ``SeedSequence(seed)`` and the batch layout
+    does not depend on ``n_jobs``, so results are reproducible for a given
+    seed whatever the number of workers. The same resamples are used for
+    every ``y`` column.
+
+    Args:
+        df (pd.DataFrame): Input data.
+        x (str): Reference column (e.g. 'avg_views_per_day').
+        y (str or Sequence[str]): Column(s) to correlate with ``x``.
+        by (Optional[str]): Group column. None uses all rows as one group.
+        method (str): 'pearson' or 'spearman'.
+        n_boot (int): Bootstrap replicates per group. 0 skips the intervals.
+        confidence (float): Confidence level of the percentile interval. Defaults to 0.95.
+        seed (Optional[int]): Seed of the resampling streams.
+        n_jobs (Optional[int]): Worker threads. Defaults to the number of CPUs.
+        min_count (int): Groups with fewer complete rows get NaN. Defaults to 3.
+        max_batch_elements (int): Memory bound of one resampling batch.
+
+    Returns:
+        pd.DataFrame: Columns [by,] 'variable', 'n', 'correlation', 'ci_lower', 'ci_upper'.
+    """
+    _check_method(method)
+    ys = [y] if isinstance(y, str) else list(y)
+    codes, labels = _group_codes(df, by)
+    values, codes = _complete_rows(df, [x] + ys, codes)
+    n_groups = len(labels)
+
+    ranked = _rank_within_groups(values, codes) if method == 'spearman' else values
+    counts, _, comoments = grouped_comoments(ranked, codes, n_groups)
+    point = _comoments_to_corr(comoments)[:, 0, 1:]
+    valid = counts >= max(min_count, 2)
+    point[~valid] = np.nan
+
+    lower = np.full((n_groups, len(ys)), np.nan)
+    upper = np.full((n_groups, len(ys)), np.nan)
+    if n_boot > 0 and valid.any():
+        order = np.argsort(codes, kind='stable')
+        bounds = np.concatenate([[0], np.cumsum(counts.astype(np.int64))])
+        group_seeds = np.random.SeedSequence(seed).spawn(n_groups)
+
+        tasks = []
+        for g in np.flatnonzero(valid):
+            group_values = values[order[bounds[g]:bounds[g + 1]]]
+            batch = max(1, min(n_boot, max_batch_elements // len(group_values)))
+            sizes = [min(batch, n_boot - start) for start in range(0, n_boot, batch)]
+            for size, batch_seed in zip(sizes, group_seeds[g].spawn(len(sizes))):
+                tasks.append((g, group_values, size, batch_seed))
+
+        n_jobs = n_jobs or os.cpu_count() or 1
+        run = lambda task: _bootstrap_batch(task[1], method, task[2], task[3])
+        if n_jobs == 1:
+            results = list(map(run, tasks))
+        else:
+            with ThreadPoolExecutor(max_workers=n_jobs) as executor:
+                results = list(executor.map(run, tasks))
+
+        alpha = (1 - confidence) / 2
+        task_groups = np.array([task[0] for task in tasks])
+        for g in np.flatnonzero(valid):
+            replicates = np.concatenate([r for r, tg in zip(results, task_groups) if tg == g])
+            lower[g], upper[g] = np.nanquantile(replicates, [alpha, 1 - alpha], axis=0)
+
+    result = pd.DataFrame({
+        'variable': np.tile(ys, n_groups),
+        'n': np.repeat(counts.astype(np.int64), len(ys)),
+        'correlation': point.ravel(),
+        'ci_lower': lower.ravel(),
+        'ci_upper': upper.ravel(),
+    })
+    if by is not None:
+        result.insert(0, by, np.repeat(labels.to_numpy(), len(ys)))
+    return result
@@ -0,0 +1,152 @@
+import pandas as pd
+import numpy as np
+from typing import Dict, Iterator, Optional, Tuple
+
+# =============================================================
+# Sorted Date Index - YouTube Dataset
+# =============================================================
+# A reusable, sorted view of a trending frame that answers date
+# range queries with binary search instead of boolean masks, and
+# keeps per-day row offsets so windowed analyses can walk the
+# timeline without rescanning the whole frame.
+# =============================================================
+
+_NS_PER_DAY = 86_400 * 1_000_000_000
+
+
+def _to_ns(value) -> int:
+    """Convert a date-like bound to an int64 nanosecond timestamp."""
+    return pd.Timestamp(value).value
+
+
+class DateRangeIndex:
+    """
+    Sorted date index over a DataFrame for fast range slicing.
+
+    The frame is sorted once by ``date_column`` (skipped if it is already
+    monotonic) and the dates are kept as an int64 array, so every range
+    query is two ``np.searchsorted`` calls followed by a positional slice.
+    Slices are taken with ``iloc[lo:hi]`` and are views of the sorted frame
+    whenever pandas can provide them.
+
+    Rows with a missing date are moved to the end and are never returned by
+    a bounded query.
+
+    Args:
+        data (pd.DataFrame): The input DataFrame.
+        date_column (str): Name of the datetime column to index. Defaults to 'date'.
+
+    Raises:
+        KeyError: If ``date_column`` does not exist in the DataFrame.
+    """
+
+    def __init__(self, data: pd.DataFrame, date_column: str = 'date'):
+        if date_column not in data.columns:
+            raise KeyError(f"The column '{date_column}' is not found in the dataset.")
+
+        dates = pd.to_datetime(data[date_column], errors='coerce')
+        if dates.is_monotonic_increasing and not dates.hasnans:
+            frame = data
+        else:
+            order = np.argsort(dates.to_numpy(dtype='datetime64[ns]'), kind='stable')
+            frame = data.iloc[order]
+            dates = dates.iloc[order]
+
+        self.date_column = date_column
+        self.frame = frame
+        self._n_valid = int(dates.notna().sum())
+        self._values = dates.to_numpy(dtype='datetime64[ns]')[:self._n_valid].view('int64')
+
+        # Per-day row offsets: day d covers rows offsets[d]:offsets[d + 1]
+        day_values = self._values - self._values % _NS_PER_DAY
+        self.days, starts = np.unique(day_values, return_index=True)
+        self.offsets = np.append(starts, self._n_valid).astype(np.int64)
+
+    def __len__(self) -> int:
+        return len(self.frame)
+
+    def bounds(self, start_date: Optional[str] = None, end_date: Optional[str] = None) -> Tuple[int, int]:
+        """
+        Return the positional bounds ``(lo, hi)`` of rows inside a date range.
+
+        Args:
+            start_date (Optional[str]): Inclusive lower bound. Defaults to None.
+            end_date (Optional[str]): Inclusive upper bound. Defaults to None.
+
+        Returns:
+            Tuple[int, int]: Row positions such that ``frame.iloc[lo:hi]`` is the range.
+        """
+        lo = 0 if start_date is None else int(np.searchsorted(self._values, _to_ns(start_date), side='left'))
+        hi = self._n_valid if end_date is None else int(np.searchsorted(self._values, _to_ns(end_date), side='right'))
+        return lo, max(lo, hi)
+
+    def range(self, start_date: Optional[str] = None, end_date: Optional[str] = None) -> pd.DataFrame:
+        """
+        Slice the indexed frame to a date range (both bounds inclusive).
+
+        Args:
+            start_date (Optional[str]): The start date in 'YYYY-MM-DD' format. Defaults to None.
+            end_date (Optional[str]): The end date in 'YYYY-MM-DD' format. Defaults to None.
+
+        Returns:
+            pd.DataFrame: Rows within the range, sorted by date. With no bounds the
+            whole sorted frame (including rows with a missing date) is returned.
+        """
+        if start_date is None and end_date is None:
+            return self.frame
+        lo, hi = self.bounds(start_date, end_date)
+        return self.frame.iloc[lo:hi]
+
+    def iter_days(self) -> Iterator[Tuple[pd.Timestamp, pd.DataFrame]]:
+        """
+        Iterate over the indexed frame one calendar day at a time.
+
+        Yields:
+            Tuple[pd.Timestamp, pd.DataFrame]: The day and the rows dated on that day.
+        """
+        for i, day in enumerate(self.days):
+            yield pd.Timestamp(day), self.frame.iloc[self.offsets[i]:self.offsets[i + 1]]
+
+    def iter_windows(self, window_days: int = 30) -> Iterator[Tuple[pd.Timestamp, pd.DataFrame]]:
+        """
+        Iterate over trailing windows of ``window_days`` calendar days.
+
+        Each window ends on a day present in the index and covers the rows dated in
+        ``(day - window_days, day]``. Window starts are found with a single vectorized
+        ``searchsorted`` over the day offsets, so no rows are rescanned.
+
+        Args:
+            window_days (int): Window length in days. Defaults to 30.
+
+        Yields:
+            Tuple[pd.Timestamp, pd.DataFrame]: The window end day and the rows in the window.
+        """
+        if window_days < 1:
+            raise ValueError("window_days must be a positive integer.")
+        first = np.searchsorted(self.days, self.days - (window_days - 1) * _NS_PER_DAY, side='left')
+        for i, day in enumerate(self.days):
+            yield pd.Timestamp(day), self.frame.iloc[self.offsets[first[i]]:self.offsets[i + 1]]
+
+
+def build_date_indexes(data: pd.DataFrame, country_column: str = 'country',
+                       date_column: str = 'date') -> Dict[str, DateRangeIndex]:
+    """
+    Build one DateRangeIndex per country.
+
+    Args:
+        data (pd.DataFrame): Combined dataset containing a country column.
+        country_column (str): Name of the country column. Defaults to 'country'.
+        date_column (str): Name of the datetime column to index. Defaults to 'date'.
+
+    Returns:
+        Dict[str, DateRangeIndex]: Mapping of country code to its date index.
+
+    Raises:
+        KeyError: If ``country_column`` does not exist in the DataFrame.
+    """
+    if country_column not in data.columns:
+        raise KeyError(f"The column '{country_column}' is not found in the dataset.")
+    return {
+        country: DateRangeIndex(group, date_column=date_column)
+        for country, group in data.groupby(country_column, sort=True)
+    }
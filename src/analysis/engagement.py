@@ -1,5 +1,11 @@
 import pandas as pd
 
+from ..preprocessing.columnar_store import accepts_columnar_store
+from ..preprocessing.time_features import trending_months
+from .correlation import bootstrap_correlation
+from .sketches import TDigest
+from .trending_cube import TrendingCube
+
 # =============================================================
 # Engagement & Trend Analysis by Category - YouTube Dataset
 # =============================================================
@@ -15,6 +21,7 @@ import pandas as pd
 # Engagement Rate Calculation
 # ------------------------------
 
+@accepts_columnar_store(columns=['views', 'likes', 'comment_count'])
 def compute_engagement_rate_df(df: pd.DataFrame) -> pd.Series:
     """
     Compute engagement rate for each video in the DataFrame.
@@ -30,6 +37,7 @@ def compute_engagement_rate_df(df: pd.DataFrame) -> pd.Series:
     return ((df["likes"] + df["comment_count"]) / safe_views) * 100
 
 
+@accepts_columnar_store(columns=['likes', 'dislikes'])
 def compute_like_dislike_ratio_df(df: pd.DataFrame) -> pd.Series:
     """
     Compute like-to-dislike ratio per video.
@@ -47,33 +55,144 @@ def compute_like_dislike_ratio_df(df: pd.DataFrame) -> pd.Series:
 # Category-Level Engagement Summary
 # ------------------------------
 
+@accepts_columnar_store(columns=['category_name', 'video_id', 'views', 'likes', 'comment_count'])
 def summarize_engagement_by_category_df(df: pd.DataFrame) -> pd.DataFrame:
     """
     Summarize total and average engagement metrics grouped by category.
 
     Args:
-        df (pd.DataFrame): Dataset with 'category_name', 'likes', 'comment_count', and 'views'.
+        df (pd.DataFrame or TrendingCube): Dataset with 'category_name', 'likes', 'comment_count', and 'views',
+            or a prebuilt TrendingCube.
 
     Returns:
         pd.DataFrame: Summary with total/average metrics for each category.
     """
-    df = df.copy()
-    df["engagement_rate"] = compute_engagement_rate_df(df).fillna(0)
+    if isinstance(df, TrendingCube):
+        return df.summarize_engagement_by_category()
+    engagement_rate = pd.to_numeric(compute_engagement_rate_df(df), errors="coerce").fillna(0)
+    categories = df["category_name"]
 
-    grouped = df.groupby("category_name").agg(
+    grouped = df.groupby(categories, observed=True).agg(
         video_count=("video_id", "count"),
         total_likes=("likes", "sum"),
         total_comments=("comment_count", "sum"),
         total_views=("views", "sum"),
-        avg_engagement_rate=("engagement_rate", "mean")
-    ).reset_index()
+    )
+    grouped["avg_engagement_rate"] = engagement_rate.groupby(categories, observed=True).mean()
+    grouped = grouped.reset_index()
 
     return grouped
 
+# ------------------------------
+# Distribution Summaries (quantile sketches)
+# ------------------------------
+
+DISTRIBUTION_GROUPS = ("category_name", "country", "trending_month")
+
+
+def _metric_values(df: pd.DataFrame, metric: str) -> pd.Series:
+    if metric == "engagement_rate":
+        return pd.to_numeric(compute_engagement_rate_df(df), errors="coerce")
+    return df[metric]
+
+
+@accepts_columnar_store(columns=['trending_month', 'trending_date', 'views', 'likes', 'comment_count'], column_args=('metrics', 'by'))
+def build_distribution_sketches(df: pd.DataFrame, metrics=("views", "engagement_rate"), by=DISTRIBUTION_GROUPS,
+                                compression: float = 200, chunk_size: int = 1_000_000) -> dict:
+    """
+    Build mergeable quantile sketches (t-digests) of engagement metrics per group.
+
+    The data is sketched ``chunk_size`` rows at a time. Sketches of different
+    countries or files merge with ``TDigest.merge``, so the full history never
+    has to be sorted at once.
+
+    Args:
+        df (pd.DataFrame): Dataset with the ``by`` columns and the metric columns.
+        metrics (Sequence[str]): Columns to sketch; 'engagement_rate' is
+            computed with ``compute_engagement_rate_df``.
+        by (Sequence[str]): Group columns; those missing from ``df`` are skipped,
+            and 'trending_month' may be derived from 'trending_date'.
+        compression (float): t-digest compression. Defaults to 200.
+        chunk_size (int): Rows sketched per update. Defaults to 1,000,000.
+
+    Returns:
+        dict: One ``TDigest`` per metric.
+    """
+    by = [c for c in by if c in df.columns or (c == "trending_month" and "trending_date" in df.columns)]
+    sketches = {metric: TDigest(compression) for metric in metrics}
+    for start in range(0, len(df), chunk_size):
+        chunk = df.iloc[start:start + chunk_size]
+        keys = [trending_months(chunk).rename("trending_month") if c == "trending_month" else chunk[c] for c in by]
+        for metric, sketch in sketches.items():
+            sketch.update(_metric_values(chunk, metric), keys or None)
+    return sketches
+
+
+def summarize_distribution_by_category(data, metric: str = "views", by=("category_name",),
+                                       quantiles=(0.5, 0.9, 0.99), compression: float = 200) -> pd.DataFrame:
+    """
+    Median and tail percentiles of a metric per group, next to the means.
+
+    Means are dominated by viral outliers; the quantiles show the typical
+    video (p50) and the tail (p90, p99). They come from t-digests, whose rank
+    error is well below 1%.
+
+    Args:
+        data (pd.DataFrame, dict or TDigest): Dataset, the result of
+            ``build_distribution_sketches`` (e.g. merged across countries) or
+            a single sketch of ``metric``.
+        metric (str): 'views', 'likes', 'engagement_rate', ... Defaults to 'views'.
+        by (Sequence[str]): Key levels to report; finer sketch groups (e.g.
+            country and month) are combined. Defaults to category.
+        quantiles (Sequence[float]): Quantiles to report.
+        compression (float): t-digest compression when ``data`` is a DataFrame.
+
+    Returns:
+        pd.DataFrame: Columns [by...], 'count', 'mean' and 'p50', 'p90', ...
+        sorted by the group keys.
+    """
+    by = [by] if isinstance(by, str) else list(by)
+    if isinstance(data, TDigest):
+        sketch = data
+    elif isinstance(data, dict):
+        sketch = data[metric]
+    else:
+        sketch = build_distribution_sketches(data, metrics=(metric,), by=by, compression=compression)[metric]
+    if len(sketch) and [n for n in sketch.keys.names if n is not None] != by:
+        sketch = sketch.rollup(by)
+
+    summary = sketch.quantile(list(quantiles))
+    summary.columns = [f"p{100 * q:g}" for q in quantiles]
+    summary.insert(0, "mean", sketch.means_by_group())
+    summary.insert(0, "count", sketch.counts().astype("int64"))
+    if not len(sketch) and by:
+        # An empty digest never saw the key levels
+        summary.index = pd.MultiIndex.from_arrays([[] for _ in by], names=by)
+    return summary.sort_index().reset_index()
+
 # ------------------------------
 # Correlation Analysis
 # ------------------------------
 
+def _per_day_engagement(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Views, likes, dislikes and comments per day before trending, with the category.
+
+    Rows with ``days_to_trend`` <= 0 are skipped to avoid division by zero.
+    """
+    valid = df["days_to_trend"] > 0
+    days = df["days_to_trend"][valid]
+
+    return pd.DataFrame({
+        "category_name": df["category_name"][valid],
+        "avg_views_per_day": df["views"][valid] / days,
+        "avg_likes_per_day": df["likes"][valid] / days,
+        "avg_dislikes_per_day": df["dislikes"][valid] / days,
+        "avg_comments_per_day": df["comment_count"][valid] / days,
+    })
+
+
+@accepts_columnar_store(columns=['category_name', 'days_to_trend', 'views', 'likes', 'dislikes', 'comment_count'])
 def correlation_by_category_before_trend(df: pd.DataFrame) -> pd.Series:
     """
     Compute correlation between views and per-day engagement metrics before trending,
@@ -86,23 +205,8 @@ def correlation_by_category_before_trend(df: pd.DataFrame) -> pd.Series:
     Returns:
         pd.Series: Correlation of each metric (per day before trend) with views.
     """
-    df = df.copy()
-
-    # Filter out invalid values
-    df = df[df["days_to_trend"] > 0]  # remove invalid zeros to avoid division by zero
-
-    # Estimate engagement per day before trending
-    df["likes_per_day"] = df["likes"] / df["days_to_trend"]
-    df["dislikes_per_day"] = df["dislikes"] / df["days_to_trend"]
-    df["comments_per_day"] = df["comment_count"] / df["days_to_trend"]
-    df["views_per_day"] = df["views"] / df["days_to_trend"]
-
-    grouped = df.groupby("category_name").agg(
-        avg_views_per_day=("views_per_day", "mean"),
-        avg_likes_per_day=("likes_per_day", "mean"),
-        avg_dislikes_per_day=("dislikes_per_day", "mean"),
-        avg_comments_per_day=("comments_per_day", "mean")
-    ).reset_index()
+    per_day = _per_day_engagement(df)
+    grouped = per_day.groupby("category_name", observed=True).mean().reset_index()
 
     corr_matrix = grouped[[
         "avg_views_per_day",
@@ -114,7 +218,43 @@ def correlation_by_category_before_trend(df: pd.DataFrame) -> pd.Series:
     return corr_matrix["avg_views_per_day"].sort_values(ascending=False)
 
 
+@accepts_columnar_store(columns=['category_name', 'days_to_trend', 'views', 'likes', 'dislikes', 'comment_count'])
+def engagement_correlation_by_category(df: pd.DataFrame, method: str = "pearson", n_boot: int = 0,
+                                       confidence: float = 0.95, seed: int = 0, n_jobs: int = None) -> pd.DataFrame:
+    """
+    Correlate views per day with likes, dislikes and comments per day within each category.
 
+    Unlike ``correlation_by_category_before_trend``, which correlates about 15
+    category means, this uses every video of a category.
+
+    Args:
+        df (pd.DataFrame): Dataset with 'category_name', 'likes', 'dislikes',
+                           'comment_count', 'views', 'days_to_trend'.
+        method (str): 'pearson' or 'spearman'.
+        n_boot (int): Bootstrap replicates for the confidence intervals (0 = none).
+        confidence (float): Confidence level of the intervals.
+        seed (int): Seed for reproducible resampling.
+        n_jobs (int): Worker threads for the bootstrap. Defaults to all CPUs.
+
+    Returns:
+        pd.DataFrame: Columns 'category_name', 'variable', 'n', 'correlation',
+        'ci_lower', 'ci_upper' (intervals are NaN when ``n_boot`` is 0).
+    """
+    return bootstrap_correlation(
+        _per_day_engagement(df),
+        x="avg_views_per_day",
+        y=["avg_likes_per_day", "avg_dislikes_per_day", "avg_comments_per_day"],
+        by="category_name",
+        method=method,
+        n_boot=n_boot,
+        confidence=confidence,
+        seed=seed,
+        n_jobs=n_jobs,
+    )
+
+
+
+@accepts_columnar_store(columns=['category_name', 'days_to_trend', 'views', 'likes', 'dislikes', 'comment_count'])
 def print_engagement_correlation_before_trend(df: pd.DataFrame) -> None:
     """
     Print correlation summary between daily engagement metrics (before trending) and views.
@@ -149,6 +289,7 @@ def print_engagement_correlation_before_trend(df: pd.DataFrame) -> None:
 # Like/Dislike Ratio vs Views
 # ------------------------------
 
+@accepts_columnar_store(columns=['category_name', 'views', 'likes', 'dislikes'])
 def like_dislike_ratio_vs_views(df: pd.DataFrame) -> pd.DataFrame:
     """
     Analyze relationship between average like/dislike ratio and views across categories.
@@ -159,13 +300,11 @@ def like_dislike_ratio_vs_views(df: pd.DataFrame) -> pd.DataFrame:
     Returns:
         pd.DataFrame: Grouped by category with ratio and average views, sorted by views.
     """
-    df = df.copy()
-    df["like_dislike_ratio"] = compute_like_dislike_ratio_df(df)
-
-    grouped = df.groupby("category_name").agg(
-        avg_like_dislike_ratio=("like_dislike_ratio", "mean"),
-        avg_views=("views", "mean")
-    ).reset_index()
+    categories = df["category_name"]
+    grouped = pd.DataFrame({
+        "avg_like_dislike_ratio": compute_like_dislike_ratio_df(df).groupby(categories, observed=True).mean(),
+        "avg_views": df["views"].groupby(categories, observed=True).mean(),
+    }).reset_index()
 
     corr = grouped["avg_like_dislike_ratio"].corr(grouped["avg_views"])
     print(f"Correlation between like/dislike ratio and average views: {corr:.3f}")
@@ -175,16 +314,20 @@ def like_dislike_ratio_vs_views(df: pd.DataFrame) -> pd.DataFrame:
 # Disabled Engagement Features
 # ------------------------------
 
+@accepts_columnar_store(columns=['comments_disabled', 'ratings_disabled', 'video_id', 'views', 'likes', 'comment_count'])
 def engagement_disabled_analysis(df: pd.DataFrame) -> pd.DataFrame:
     """
     Compare performance of videos with disabled comments or ratings.
 
     Args:
-        df (pd.DataFrame): Dataset with boolean columns 'comments_disabled', 'ratings_disabled'.
+        df (pd.DataFrame or TrendingCube): Dataset with boolean columns 'comments_disabled', 'ratings_disabled',
+            or a prebuilt TrendingCube.
 
     Returns:
         pd.DataFrame: Grouped statistics showing average views, likes, comments.
     """
+    if isinstance(df, TrendingCube):
+        return df.engagement_disabled_analysis()
     return df.groupby(["comments_disabled", "ratings_disabled"]).agg(
         avg_views=("views", "mean"),
         avg_likes=("likes", "mean"),
@@ -194,18 +337,20 @@ def engagement_disabled_analysis(df: pd.DataFrame) -> pd.DataFrame:
 
 
 
+@accepts_columnar_store(columns=['comments_disabled', 'ratings_disabled', 'video_error_or_removed', 'views', 'likes', 'dislikes', 'comment_count'])
 def compare_status_impact(df: pd.DataFrame) -> pd.DataFrame:
     """
     Compare the impact of video status flags on engagement metrics.
 
     Parameters:
     -----------
-    df : pd.DataFrame
+    df : pd.DataFrame or TrendingCube
         DataFrame containing YouTube trending video data. Must include the following columns:
         - 'comments_disabled'
         - 'ratings_disabled'
         - 'video_error_or_removed'
         - 'views', 'likes', 'dislikes', 'comment_count'
+        A prebuilt TrendingCube is answered by rolling up its cells.
 
     Returns:
     --------
@@ -213,6 +358,9 @@ def compare_status_impact(df: pd.DataFrame) -> pd.DataFrame:
         A multi-index DataFrame showing average engagement metrics when each flag is ON vs OFF.
         Rows are a MultiIndex of (Flag, Metric), and columns are 'Flag OFF', 'Flag ON'.
     """
+    if isinstance(df, TrendingCube):
+        return df.compare_status_impact()
+
     status_flags = ['comments_disabled', 'ratings_disabled', 'video_error_or_removed']
     engagement_metrics = ['views', 'likes', 'dislikes', 'comment_count']
 
@@ -0,0 +1,92 @@
+import re
+import pandas as pd
+import numpy as np
+
+# =============================================================
+# Grouped Aggregation Utilities - YouTube Dataset
+# =============================================================
+# Vectorized replacements for per-group Python lambdas such as
+# `lambda x: x.mode().iloc[0]` or per-row `str.split` counting,
+# for use inside channel, category and tag summaries.
+# =============================================================
+
+
+def grouped_mode(keys: pd.Series, values: pd.Series, default=None) -> pd.Series:
+    """
+    Most frequent value per group, without a Python function per group.
+
+    Counts every (key, value) pair once, then keeps the largest count per
+    key. Ties are broken by the smallest value, matching
+    ``x.mode().iloc[0]``.
+
+    Args:
+        keys (pd.Series): Group labels (e.g. ``df['channel_title']``).
+        values (pd.Series): Values to take the mode of (e.g. ``df['category_name']``).
+        default: Value for groups whose values are all missing. Those groups
+            are omitted when ``default`` is None.
+
+    Returns:
+        pd.Series: The mode of ``values`` per key, indexed by key and sorted by key.
+    """
+    key_name = keys.name if keys.name is not None else 'key'
+    value_name = values.name if values.name is not None and values.name != key_name else 'value'
+
+    counts = (
+        pd.Series(np.ones(len(keys), dtype=np.int64))
+        .groupby([keys.to_numpy(), values.to_numpy()])
+        .sum()
+    )
+    ranked = pd.DataFrame({
+        'key': counts.index.get_level_values(0),
+        'value': counts.index.get_level_values(1),
+        'count': counts.to_numpy(),
+    })
+    # Group-sorted input: stable sort by descending count keeps the smallest value first on ties
+    ranked = ranked.sort_values(['key', 'count'], ascending=[True, False], kind='stable')
+    first = ranked.drop_duplicates('key')
+    mode = pd.Series(first['value'].to_numpy(), index=pd.Index(first['key'].to_numpy(), name=key_name),
+                     name=value_name)
+
+    if default is not None:
+        all_keys = pd.Index(pd.unique(keys.dropna().to_numpy()), name=key_name).sort_values()
+        mode = mode.reindex(all_keys, fill_value=default)
+    return mode
+
+
+def count_delimited(values: pd.Series, sep: str = '|') -> pd.Series:
+    """
+    Count the items in delimiter-separated strings, e.g. tags like 'a|b|c'.
+
+    Equivalent to ``values.apply(lambda t: len(str(t).split(sep)))`` but
+    vectorized: missing values count as one item, as ``str(nan)`` would.
+
+    Args:
+        values (pd.Series): Delimited strings.
+        sep (str): Delimiter. Defaults to '|'.
+
+    Returns:
+        pd.Series: Number of items per row (int64), aligned with ``values``.
+    """
+    counts = values.astype(str).str.count(re.escape(sep))
+    return counts.astype(np.int64) + 1
+
+
+def sort_within_groups(values: np.ndarray, codes: np.ndarray, stable: bool = False) -> np.ndarray:
+    """
+    Permutation sorting rows by group code, then by value (ties stay contiguous).
+
+    Args:
+        values (np.ndarray): Values to sort within each group.
+        codes (np.ndarray): Non-negative integer group code per row.
+        stable (bool): Keep rows with equal group and value in input order.
+
+    Returns:
+        np.ndarray: Row order.
+    """
+    by_value = np.argsort(values, kind='stable' if stable else None)
+    if len(codes) and codes.max() < np.iinfo(np.int16).max:
+        # Stable sort on a 16-bit key is a radix sort: cheap re-grouping of the value order
+        return by_value[np.argsort(codes.astype(np.int16)[by_value], kind='stable')]
+    position = np.empty(len(values), dtype=np.int64)
+    position[by_value] = np.arange(len(values))
+    return np.argsort(codes * len(values) + position)
@@ -0,0 +1,285 @@
+import pandas as pd
+import numpy as np
+from typing import Optional
+
+from .sketches import hash_values
+
+# =============================================================
+# Near-Duplicate Titles - YouTube Dataset
+# =============================================================
+# Clusters reuploads and near-identical titles (across channels and
+# countries) with MinHash signatures of character shingles (plus,
+# optionally, tags) and locality-sensitive hashing: rows only meet
+# the rows sharing one of their band buckets, so clustering is
+# near-linear instead of comparing every pair of titles. Clusters
+# are exposed as a column used to deduplicate channel and tag
+# statistics.
+# =============================================================
+
+DUPLICATE_CLUSTER_COLUMN = 'duplicate_cluster'
+
+_MAX_TITLE_LENGTH = 200
+_HASH_MIX = np.uint64(0x9E3779B97F4A7C15)
+_EMPTY = np.iinfo(np.uint64).max
+
+
+def normalize_titles(titles: pd.Series) -> pd.Series:
+    """
+    Lowercase, drop punctuation and collapse whitespace.
+
+    Missing titles stay missing, and so do titles left empty (emoji or
+    punctuation only): they carry no text to compare.
+    """
+    normalized = (
+        titles.astype('string').str.lower()
+        .str.replace(r'[\W_]+', ' ', regex=True)
+        .str.strip()
+    )
+    return normalized.mask(normalized == '').astype(object)
+
+
+def _shingle_hashes(texts: np.ndarray, k: int):
+    """
+    Character k-shingles of every text as one uint64 per position.
+
+    Returns the ``(n_texts, n_positions)`` shingle matrix and the mask of
+    positions that hold a shingle. Texts shorter than ``k`` are one shingle.
+    """
+    lengths = np.fromiter((len(t) for t in texts), dtype=np.int64, count=len(texts))
+    width = int(min(max(lengths.max(initial=0), k), _MAX_TITLE_LENGTH))
+    chars = texts.astype(f'U{width}').view(np.uint32).reshape(len(texts), width).astype(np.uint64)
+    positions = width - k + 1
+    # Code points fit in 21 bits, so three characters pack into one uint64 exactly
+    shingles = np.zeros((len(texts), positions), dtype=np.uint64)
+    for offset in range(k):
+        shingles = (shingles << np.uint64(21)) ^ chars[:, offset:offset + positions]
+    valid = np.arange(positions) <= np.maximum(np.minimum(lengths, width) - k, 0)[:, None]
+    return shingles, valid
+
+
+def _permutations(num_perm: int, seed: int):
+    rng = np.random.default_rng(seed)
+    a = rng.integers(1, 2 ** 63, num_perm, dtype=np.uint64) | np.uint64(1)
+    b = rng.integers(0, 2 ** 63, num_perm, dtype=np.uint64)
+    return a, b
+
+
+def minhash_signatures(texts, k: int = 3, num_perm: int = 64, seed: int = 0, tags=None,
+                       chunk_rows: int = 20_000) -> np.ndarray:
+    """
+    MinHash signatures of the character shingles of each text.
+
+    The i-th signature value of a text is the minimum over its shingles of
+    the i-th hash function (multiply-shift hashing of the packed shingle),
+    so two texts agree on a signature value with probability equal to the
+    Jaccard similarity of their shingle sets.
+
+    Args:
+        texts (array-like): Normalized texts (see ``normalize_titles``).
+        k (int): Shingle length in characters, at most 3. Defaults to 3.
+        num_perm (int): Signature length. Defaults to 64.
+        seed (int): Seed of the hash functions; signatures only compare
+            when computed with the same seed.
+        tags (Optional[array-like]): Lists of tags per text; each tag is one
+            more element of the text's set.
+        chunk_rows (int): Texts hashed at a time, to bound memory.
+
+    Returns:
+        np.ndarray: uint64 array of shape ``(len(texts), num_perm)``.
+    """
+    if not 1 <= k <= 3:
+        raise ValueError("k must be between 1 and 3.")
+    texts = np.asarray(texts, dtype=object)
+    a, b = _permutations(num_perm, seed)
+    signatures = np.full((len(texts), num_perm), _EMPTY, dtype=np.uint64)
+
+    for start in range(0, len(texts), chunk_rows):
+        shingles, valid = _shingle_hashes(texts[start:start + chunk_rows], k)
+        block = signatures[start:start + chunk_rows]
+        for i in range(num_perm):
+            hashed = a[i] * shingles + b[i]
+            hashed[~valid] = _EMPTY
+            block[:, i] = hashed.min(axis=1)
+
+    if tags is not None:
+        lists = pd.Series(list(tags), dtype=object)
+        counts = lists.map(lambda t: len(t) if isinstance(t, (list, tuple, np.ndarray)) else 0).to_numpy()
+        has_tags = np.flatnonzero(counts > 0)
+        if len(has_tags):
+            flat = hash_values(np.concatenate([np.asarray(lists.iloc[i], dtype=object) for i in has_tags]))
+            starts = np.concatenate([[0], np.cumsum(counts[has_tags])[:-1]])
+            for i in range(num_perm):
+                tag_min = np.minimum.reduceat(a[i] * flat + b[i], starts)
+                signatures[has_tags, i] = np.minimum(signatures[has_tags, i], tag_min)
+    return signatures
+
+
+def _connected_components(n: int, u: np.ndarray, v: np.ndarray) -> np.ndarray:
+    """Smallest member of each node's component, by min-label propagation with pointer jumping."""
+    labels = np.arange(n)
+    while True:
+        low = np.minimum(labels[u], labels[v])
+        updated = labels.copy()
+        np.minimum.at(updated, u, low)
+        np.minimum.at(updated, v, low)
+        updated = updated[updated]
+        if np.array_equal(updated, labels):
+            return labels
+        labels = updated
+
+
+def lsh_clusters(signatures: np.ndarray, bands: int = 16, threshold: float = 0.7) -> np.ndarray:
+    """
+    Cluster MinHash signatures with banded locality-sensitive hashing.
+
+    The signature is cut into ``bands`` bands; rows with identical values in
+    a band share its bucket and become candidates. Each candidate is linked
+    to the first row of its bucket when their estimated Jaccard similarity
+    (share of equal signature values) is at least ``threshold``, and the
+    linked rows form the clusters. Each band is one hash and one factorize,
+    so the cost is linear in the number of rows.
+
+    Args:
+        signatures (np.ndarray): Output of ``minhash_signatures``.
+        bands (int): Number of bands; must divide the signature length.
+            More bands find less similar pairs. Defaults to 16.
+        threshold (float): Minimum estimated Jaccard similarity of a link.
+
+    Returns:
+        np.ndarray: int64 cluster id per row, numbered from 0 in order of
+        each cluster's first row.
+    """
+    n, num_perm = signatures.shape
+    if num_perm % bands:
+        raise ValueError("bands must divide the signature length.")
+    rows = num_perm // bands
+    sources, targets = [], []
+    for band in range(bands):
+        key = np.zeros(n, dtype=np.uint64)
+        for column in signatures[:, band * rows:(band + 1) * rows].T:
+            key = key * _HASH_MIX + column
+        bucket, uniques = pd.factorize(key)
+        if len(uniques) == n:
+            continue
+        first = np.empty(len(uniques), dtype=np.int64)
+        # Reversed assignment leaves the earliest row of every bucket
+        first[bucket[::-1]] = np.arange(n - 1, -1, -1)
+        candidate = np.flatnonzero(first[bucket] != np.arange(n))
+        sources.append(candidate)
+        targets.append(first[bucket[candidate]])
+
+    if sources:
+        u, v = np.concatenate(sources), np.concatenate(targets)
+        similarity = (signatures[u] == signatures[v]).mean(axis=1)
+        keep = similarity >= threshold
+        labels = _connected_components(n, u[keep], v[keep])
+    else:
+        labels = np.arange(n)
+    return pd.factorize(labels)[0].astype(np.int64)
+
+
+def find_near_duplicates(df: pd.DataFrame, column: str = 'title', include_tags: bool = False,
+                         tags_column: str = 'tags', k: int = 3, num_perm: int = 64, bands: int = 16,
+                         threshold: float = 0.7, seed: int = 0) -> np.ndarray:
+    """
+    Near-duplicate cluster of every row, from its title (and tags).
+
+    Titles are normalized and only distinct titles are hashed, so repeated
+    snapshots of a video cost nothing extra. Rows with identical normalized
+    titles always share a cluster; rows with a missing title, or one that
+    normalizes to nothing (emoji or punctuation only), get -1.
+
+    Args:
+        df (pd.DataFrame): Dataset with the title column.
+        column (str): Text column. Defaults to 'title'.
+        include_tags (bool): Add the row's tags (``tags_column``, '|'-separated)
+            to its set. Defaults to False.
+        tags_column (str): Tag column. Defaults to 'tags'.
+        k (int): Shingle length in characters. Defaults to 3.
+        num_perm (int): MinHash signature length. Defaults to 64.
+        bands (int): LSH bands. Defaults to 16.
+        threshold (float): Minimum estimated Jaccard similarity. Defaults to 0.7.
+        seed (int): Seed of the hash functions.
+
+    Returns:
+        np.ndarray: int64 cluster id per row.
+    """
+    text = normalize_titles(df[column])
+    if include_tags and tags_column in df.columns:
+        tags = df[tags_column].astype('string').str.lower().str.replace('"', '', regex=False)
+        units = text + '\x1f' + tags.fillna('').astype(object)
+        units = units.where(text.notna())
+    else:
+        tags, units = None, text
+    codes, uniques = pd.factorize(units)
+
+    clusters = np.full(len(df), -1, dtype=np.int64)
+    if not len(uniques):
+        return clusters
+    unique_text = np.asarray(uniques, dtype=object)
+    tag_lists = None
+    if tags is not None:
+        parts = pd.Series(unique_text).str.split('\x1f', n=1, regex=False)
+        unique_text = parts.str[0].to_numpy(dtype=object)
+        tag_lists = parts.str[1].str.split('|', regex=False).map(
+            lambda items: [t.strip() for t in items if t.strip() and t.strip() != '[none]'])
+    signatures = minhash_signatures(unique_text, k=k, num_perm=num_perm, seed=seed, tags=tag_lists)
+    unique_clusters = lsh_clusters(signatures, bands=bands, threshold=threshold)
+    present = codes >= 0
+    clusters[present] = unique_clusters[codes[present]]
+    return clusters
+
+
+def add_duplicate_clusters(df: pd.DataFrame, column: str = 'title', include_tags: bool = False,
+                           cluster_column: str = DUPLICATE_CLUSTER_COLUMN, **kwargs) -> pd.DataFrame:
+    """
+    Return a copy of ``df`` with the ``find_near_duplicates`` cluster column.
+
+    Args:
+        df (pd.DataFrame): Dataset with the title column.
+        column (str): Text column. Defaults to 'title'.
+        include_tags (bool): Also compare tags. Defaults to False.
+        cluster_column (str): Name of the new column. Defaults to 'duplicate_cluster'.
+        **kwargs: Further ``find_near_duplicates`` options.
+
+    Returns:
+        pd.DataFrame: The data with ``cluster_column`` added.
+    """
+    result = df.copy(deep=False)
+    result[cluster_column] = find_near_duplicates(df, column=column, include_tags=include_tags, **kwargs)
+    return result
+
+
+def drop_near_duplicates(df: pd.DataFrame, cluster_column: str = DUPLICATE_CLUSTER_COLUMN,
+                         channel_column: str = 'channel_title', time_column: Optional[str] = None) -> pd.DataFrame:
+    """
+    Drop reuploads: keep each cluster's rows from its original channel only.
+
+    The original channel of a cluster is the channel of its earliest row by
+    ``time_column`` (default 'publish_time', else 'trending_date'). All rows
+    of that channel are kept, including daily snapshots of the same video;
+    rows from other channels in the cluster are dropped. The cluster column
+    is computed with ``find_near_duplicates`` when missing.
+
+    Args:
+        df (pd.DataFrame): Dataset with title and channel columns.
+        cluster_column (str): Cluster column. Defaults to 'duplicate_cluster'.
+        channel_column (str): Channel column. Defaults to 'channel_title'.
+        time_column (Optional[str]): Column deciding which upload came first.
+
+    Returns:
+        pd.DataFrame: The rows kept, in their original order.
+    """
+    clusters = df[cluster_column].to_numpy() if cluster_column in df.columns else find_near_duplicates(df)
+    if time_column is None:
+        time_column = next((c for c in ('publish_time', 'trending_date') if c in df.columns), None)
+    order = np.arange(len(df)) if time_column is None else \
+        np.argsort(pd.to_datetime(df[time_column], errors='coerce').to_numpy(dtype='datetime64[ns]'), kind='stable')
+    # Earliest row of each cluster in time order
+    ordered_clusters = clusters[order]
+    seen = pd.Series(ordered_clusters).duplicated().to_numpy()
+    first_rows = order[~seen & (ordered_clusters >= 0)]
+    channels = df[channel_column].to_numpy()
+    original = pd.Series(channels[first_rows], index=clusters[first_rows])
+    keep = (clusters < 0) | (original.reindex(clusters).to_numpy() == channels)
+    return df[keep]
@@ -0,0 +1,248 @@
+import hashlib
+import os
+from pathlib import Path
+from statistics import NormalDist
+from typing import Sequence, Union
+
+import numpy as np
+import pandas as pd
+
+from ..preprocessing.time_features import trending_months
+from .sampling import stratified_positions
+
+# =============================================================
+# Preview Mode - YouTube Dataset
+# =============================================================
+# Persisted stratified samples (by country, category and trending
+# month) for fast exploratory runs, and stratified estimators that
+# scale sample counts, totals and means back to the full data with
+# confidence intervals.
+# =============================================================
+
+STRATUM_COLUMN = 'preview_stratum'
+WEIGHT_COLUMN = 'preview_weight'
+SAMPLE_COLUMN = 'preview_sample'
+DEFAULT_STRATA = ('country', 'category_name', 'trending_month')
+
+
+def _stratum_codes(df: pd.DataFrame, by: Sequence[str]) -> np.ndarray:
+    """
+    Combined int64 code of the ``by`` columns (-1 where any part is missing).
+    """
+    parts = []
+    for column in by:
+        values = trending_months(df) if column == 'trending_month' else df[column]
+        parts.append(pd.factorize(values)[0])
+    if not parts:
+        return np.zeros(len(df), dtype=np.int64)
+    missing = np.any([p < 0 for p in parts], axis=0)
+    combined = np.ravel_multi_index([np.maximum(p, 0) for p in parts], [max(p.max() + 1, 1) for p in parts])
+    return np.where(missing, -1, combined).astype(np.int64)
+
+
+def build_preview_sample(df: pd.DataFrame, fraction: float, by: Sequence[str] = DEFAULT_STRATA, seed: int = 0,
+                         min_per_stratum: int = 2, sample_id: str = None) -> pd.DataFrame:
+    """
+    Draw a stratified sample of ``fraction`` of the rows for preview runs.
+
+    Strata are the combinations of the ``by`` columns that exist in ``df``
+    ('trending_month' may also be derived from 'trending_date'). Every
+    stratum keeps at least ``min_per_stratum`` rows (2 allows a variance
+    estimate). Rows with a missing stratum label are never sampled.
+
+    The sample carries three extra columns used by ``estimate_population``:
+    ``preview_stratum`` (stratum code within the sample), ``preview_weight``
+    (rows of the stratum in ``df`` per sampled row) and ``preview_sample``
+    (the sample's id). Stratum codes restart in every sample, so samples of
+    different data (e.g. one per country) can be concatenated only if their
+    ids differ; ``estimate_population`` keeps their strata apart by id.
+
+    Args:
+        df (pd.DataFrame): Full (preprocessed) dataset.
+        fraction (float): Share of rows to keep, in (0, 1].
+        by (Sequence[str]): Stratum columns. Defaults to country, category and trending month.
+        seed (int): Seed of the sample.
+        min_per_stratum (int): Minimum rows per stratum. Defaults to 2.
+        sample_id (str, optional): Id of the sample, e.g. the country code.
+            Defaults to a fingerprint of the stratum sizes, fraction and seed.
+
+    Returns:
+        pd.DataFrame: The sampled rows in their original order.
+    """
+    if not 0 < fraction <= 1:
+        raise ValueError("fraction must be in (0, 1].")
+    by = [c for c in by if c in df.columns or (c == 'trending_month' and 'trending_date' in df.columns)]
+    codes = _stratum_codes(df, by)
+    positions = stratified_positions(pd.Series(codes).where(codes >= 0), int(round(fraction * len(df))),
+                                     seed=seed, min_per_stratum=min_per_stratum)
+
+    population = np.bincount(codes[codes >= 0], minlength=codes.max() + 1)
+    stratum, sampled_codes = np.unique(codes[positions], return_inverse=True)
+    sampled = np.bincount(sampled_codes)
+    sample = df.iloc[positions].copy()
+    sample[STRATUM_COLUMN] = sampled_codes.astype(np.int32)
+    sample[WEIGHT_COLUMN] = (population[stratum] / sampled)[sampled_codes]
+    if sample_id is None:
+        fingerprint = np.concatenate([[len(df), seed], population]).astype(np.int64).tobytes() + repr(fraction).encode()
+        sample_id = hashlib.sha1(fingerprint).hexdigest()[:12]
+    sample[SAMPLE_COLUMN] = str(sample_id)
+    return sample
+
+
+def is_preview(df: pd.DataFrame) -> bool:
+    """
+    Whether ``df`` is a preview sample (as opposed to the full data).
+    """
+    return WEIGHT_COLUMN in df.columns and STRATUM_COLUMN in df.columns
+
+
+def preview_cache_path(source_path: Union[str, Path], fraction: float, seed: int = 0, key: str = None) -> Path:
+    """
+    Return the preview sample file stored alongside a dataset file.
+
+    ``key`` identifies how the dataset was built from the file (e.g. a hash
+    of the preprocessing settings), so samples of differently filtered data
+    never share a file.
+    """
+    source_path = Path(source_path)
+    suffix = f"-{key}" if key else ""
+    return source_path.with_name(f"{source_path.name}.preview-{fraction:g}-{seed}{suffix}.parquet")
+
+
+def load_preview_sample(build, cache_path: Union[str, Path], fraction: float, source_path=None,
+                        by: Sequence[str] = DEFAULT_STRATA, seed: int = 0, sample_id: str = None) -> pd.DataFrame:
+    """
+    Load a persisted preview sample, building and saving it when missing or stale.
+
+    Only the modification time of ``source_path`` is checked: anything else
+    ``build`` depends on (settings, dropped columns) belongs in the cache
+    path, see the ``key`` of ``preview_cache_path``. The sample holds a
+    fraction of the rows, so counts and totals computed on it must be scaled
+    with ``estimate_population``.
+
+    Args:
+        build (callable): Returns the full dataset; only called when the cache
+            is missing or older than ``source_path``.
+        cache_path (str or Path): Sample file, e.g. from ``preview_cache_path``.
+        fraction (float): Share of rows to keep.
+        source_path (str or Path, optional): File the dataset comes from, used
+            to invalidate a stale sample.
+        by (Sequence[str]): Stratum columns.
+        seed (int): Seed of the sample.
+        sample_id (str, optional): Id of the sample (see ``build_preview_sample``).
+
+    Returns:
+        pd.DataFrame: The preview sample.
+    """
+    fresh = os.path.exists(cache_path) and (
+        source_path is None or os.stat(cache_path).st_mtime_ns >= os.stat(source_path).st_mtime_ns)
+    if fresh:
+        return pd.read_parquet(cache_path)
+    sample = build_preview_sample(build(), fraction, by=by, seed=seed, sample_id=sample_id).reset_index(drop=True)
+    tmp = f"{cache_path}.tmp"
+    sample.to_parquet(tmp, index=False)
+    os.replace(tmp, cache_path)
+    return sample
+
+
+def estimate_population(df: pd.DataFrame, columns: Sequence[str] = (), by: Union[str, Sequence[str], None] = None,
+                        confidence: float = 0.95) -> pd.DataFrame:
+    """
+    Estimate full-data row counts, totals and means from a preview sample.
+
+    Uses the stratified (expansion) estimator: every sampled row stands for
+    ``preview_weight`` rows of its stratum. Standard errors include the
+    finite population correction, and means of a group are ratio estimates
+    with linearized variance. Intervals are normal ``confidence`` intervals.
+    Strata with one sampled row contribute no variance, and missing values
+    count as 0.
+
+    On the full data (no preview columns) every row has weight 1 and the
+    intervals collapse to the exact values, so the same code serves both modes.
+
+    Concatenated samples (e.g. one per country) are estimated per sample:
+    strata are keyed by ``preview_sample`` and ``preview_stratum``, so
+    samples must have distinct ids (see ``build_preview_sample``).
+
+    Args:
+        df (pd.DataFrame): Preview sample from ``build_preview_sample`` (or full data).
+        columns (Sequence[str]): Numeric columns to estimate totals and means of.
+        by (str, Sequence[str] or None): Group column(s), e.g. 'category_name'.
+        confidence (float): Confidence level. Defaults to 0.95.
+
+    Returns:
+        pd.DataFrame: Columns [by...], 'statistic' ('count', 'total_<column>',
+        'mean_<column>'), 'estimate', 'std_error', 'ci_lower', 'ci_upper'.
+    """
+    by = [by] if isinstance(by, str) else list(by or [])
+    if is_preview(df):
+        strata = df[STRATUM_COLUMN].to_numpy(dtype=np.int64)
+        if SAMPLE_COLUMN in df.columns:
+            # Stratum codes restart in every sample
+            strata = df.groupby([SAMPLE_COLUMN, STRATUM_COLUMN], sort=False).ngroup().to_numpy(dtype=np.int64)
+        weights = df[WEIGHT_COLUMN].to_numpy(dtype=np.float64)
+    else:
+        strata = np.zeros(len(df), dtype=np.int64)
+        weights = np.ones(len(df))
+
+    if by:
+        grouped = df.groupby(by, sort=True, dropna=True)
+        groups = grouped.ngroup().fillna(-1).to_numpy(dtype=np.int64)
+        keys = grouped.size().index.to_frame(index=False)
+    else:
+        groups = np.zeros(len(df), dtype=np.int64)
+        keys = pd.DataFrame(index=[0])
+    n_groups, n_strata = len(keys), strata.max() + 1 if len(strata) else 0
+
+    # Stratum sizes: sampled rows n_h, population N_h and the variance factor N_h^2 (1 - f_h) / n_h
+    n_h = np.bincount(strata, minlength=n_strata).astype(np.float64)
+    N_h = np.bincount(strata, weights=weights, minlength=n_strata)
+    # Rows outside every group (missing 'by' values) still count towards their stratum sizes
+    keep = groups >= 0
+    groups, strata = groups[keep], strata[keep]
+    factor = np.divide(N_h ** 2 * (1 - np.divide(n_h, N_h, out=np.ones_like(N_h), where=N_h > 0)), n_h,
+                       out=np.zeros_like(N_h), where=n_h > 0)
+    cell = groups * n_strata + strata
+
+    def cell_sums(values):
+        return np.bincount(cell, weights=values, minlength=n_groups * n_strata).reshape(n_groups, n_strata)
+
+    def variance(sum_z, sum_zz):
+        # Sample variance within each stratum of z (zero outside the group)
+        s2 = np.divide(sum_zz - sum_z ** 2 / np.maximum(n_h, 1), n_h - 1, out=np.zeros_like(sum_z), where=n_h > 1)
+        return (np.maximum(s2, 0) * factor).sum(axis=1)
+
+    z = NormalDist().inv_cdf(0.5 + confidence / 2)
+    rows = []
+
+    def add(statistic, estimate, var):
+        se = np.sqrt(var)
+        frame = keys.copy()
+        frame['statistic'] = statistic
+        frame['estimate'] = estimate
+        frame['std_error'] = se
+        frame['ci_lower'] = estimate - z * se
+        frame['ci_upper'] = estimate + z * se
+        rows.append(frame)
+
+    ones = np.ones(len(groups))
+    count_h = cell_sums(ones)
+    count = (count_h * N_h / np.maximum(n_h, 1)).sum(axis=1)
+    add('count', count, variance(count_h, count_h))
+
+    for column in columns:
+        y = pd.to_numeric(df[column], errors='coerce').to_numpy(dtype=np.float64)[keep]
+        y = np.nan_to_num(y)
+        y_h, yy_h = cell_sums(y), cell_sums(y * y)
+        total = (y_h * N_h / np.maximum(n_h, 1)).sum(axis=1)
+        add(f'total_{column}', total, variance(y_h, yy_h))
+
+        ratio = np.divide(total, count, out=np.full_like(total, np.nan), where=count > 0)
+        r = np.nan_to_num(ratio)[:, None]
+        # Linearized residuals u = (y - R) / N_g of the group's rows
+        u_h = (y_h - r * count_h) / np.maximum(count, 1e-300)[:, None]
+        uu_h = (yy_h - 2 * r * y_h + r ** 2 * count_h) / np.maximum(count, 1e-300)[:, None] ** 2
+        add(f'mean_{column}', ratio, variance(u_h, uu_h))
+
+    result = pd.concat(rows, ignore_index=True)
+    return result.sort_values(by, kind='stable', ignore_index=True) if by else result
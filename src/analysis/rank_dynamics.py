@@ -0,0 +1,190 @@
+import pandas as pd
+import numpy as np
+from typing import Optional, Sequence
+
+from .group_utils import sort_within_groups
+from .trajectory import VideoSegments
+
+# =============================================================
+# Daily Rank Dynamics - YouTube Dataset
+# =============================================================
+# Reconstructs each day's leaderboard per country (rank by views)
+# with one grouped argsort, stores the rank as an int16 column, and
+# derives per-video rank dynamics (entry/exit/best rank, rank
+# velocity, days in the top N) with segment operations over the
+# per-video segments of the trajectory engine.
+# =============================================================
+
+RANK_COLUMN = 'daily_rank'
+DEFAULT_TOP_N = 10
+
+_MAX_RANK = np.iinfo(np.int16).max
+
+
+def compute_daily_ranks(data: pd.DataFrame, by: Sequence[str] = ('country',), value_column: str = 'views',
+                        date_column: str = 'trending_date') -> np.ndarray:
+    """
+    Rank every snapshot by ``value_column`` among the snapshots of its day.
+
+    Rows are grouped by the ``by`` columns (e.g. country) and the trending
+    day, and sorted by descending value inside each group with one grouped
+    argsort. Rank 1 is the most viewed video of the day; ties keep the
+    input order. Rows with a missing group, date or value get rank 0.
+
+    Args:
+        data (pd.DataFrame): Daily snapshots.
+        by (Sequence[str]): Leaderboard columns besides the day. Missing
+            columns are skipped. Defaults to ('country',).
+        value_column (str): Ranking value. Defaults to 'views'.
+        date_column (str): Snapshot date. Defaults to 'trending_date'.
+
+    Returns:
+        np.ndarray: int16 rank per row, aligned with ``data``.
+
+    Raises:
+        KeyError: If ``value_column`` or ``date_column`` does not exist in the DataFrame.
+        ValueError: If a daily leaderboard has more rows than an int16 can rank.
+    """
+    for column in (value_column, date_column):
+        if column not in data.columns:
+            raise KeyError(f"The column '{column}' is not found in the dataset.")
+    by = [c for c in by if c in data.columns]
+    days = pd.to_datetime(data[date_column], errors='coerce').dt.normalize()
+    factorized = [pd.factorize(data[column]) for column in by] + [pd.factorize(days)]
+    codes = np.ravel_multi_index([np.maximum(c, 0) for c, _ in factorized],
+                                 [max(len(uniques), 1) for _, uniques in factorized])
+    values = pd.to_numeric(data[value_column], errors='coerce').to_numpy(dtype=np.float64)
+    valid = np.flatnonzero(np.all([c >= 0 for c, _ in factorized], axis=0) & ~np.isnan(values))
+
+    ranks = np.zeros(len(data), dtype=np.int16)
+    if not len(valid):
+        return ranks
+    # Dense group codes keep the radix path of sort_within_groups for up to 32k leaderboards
+    _, group = np.unique(codes[valid], return_inverse=True)
+    order = sort_within_groups(-values[valid], group, stable=True)
+    sorted_group = group[order]
+    starts = np.flatnonzero(np.r_[True, sorted_group[1:] != sorted_group[:-1]])
+    lengths = np.diff(np.append(starts, len(order)))
+    if lengths.max() > _MAX_RANK:
+        raise ValueError(f"A daily leaderboard has {lengths.max()} rows; at most {_MAX_RANK} can be ranked.")
+    position = np.arange(len(order)) - np.repeat(starts, lengths)
+    ranks[valid[order]] = position + 1
+    return ranks
+
+
+def add_daily_ranks(data: pd.DataFrame, by: Sequence[str] = ('country',), value_column: str = 'views',
+                    date_column: str = 'trending_date', rank_column: str = RANK_COLUMN) -> pd.DataFrame:
+    """
+    Return a copy of ``data`` with the int16 daily rank from ``compute_daily_ranks``.
+
+    Args:
+        data (pd.DataFrame): Daily snapshots.
+        by (Sequence[str]): Leaderboard columns besides the day.
+        value_column (str): Ranking value. Defaults to 'views'.
+        date_column (str): Snapshot date. Defaults to 'trending_date'.
+        rank_column (str): Name of the new column. Defaults to 'daily_rank'.
+
+    Returns:
+        pd.DataFrame: The data with ``rank_column`` added.
+    """
+    result = data.copy(deep=False)
+    result[rank_column] = compute_daily_ranks(data, by=by, value_column=value_column, date_column=date_column)
+    return result
+
+
+def compute_rank_dynamics(data: pd.DataFrame, top_n: int = DEFAULT_TOP_N, rank_column: str = RANK_COLUMN,
+                          segments: Optional[VideoSegments] = None, carry: Sequence[str] = ('category_name',),
+                          date_column: str = 'trending_date') -> pd.DataFrame:
+    """
+    Per-video rank movement across its trending days.
+
+    Ranks are computed with ``compute_daily_ranks`` when ``rank_column`` is
+    missing. Columns per video (keys as in ``VideoSegments``):
+
+    - 'entry_rank', 'exit_rank', 'best_rank': rank on the first and last
+      trending day, and the best (lowest) rank
+    - 'days_to_best': days from the first trending day to the best rank
+    - 'rank_velocity': mean places gained per day between consecutive
+      snapshots (positive when climbing; NaN with one snapshot)
+    - 'days_in_top': snapshots ranked within ``top_n``
+    - 'entered_top', 'exited_top': rank crossed into (out of) the top
+      ``top_n`` between two consecutive snapshots
+
+    Args:
+        data (pd.DataFrame): Daily snapshots.
+        top_n (int): Size of the top of the leaderboard. Defaults to 10.
+        rank_column (str): Rank column. Defaults to 'daily_rank'.
+        segments (Optional[VideoSegments]): Precomputed segments of ``data``.
+        carry (Sequence[str]): Columns copied from each video's first snapshot.
+        date_column (str): Snapshot date. Defaults to 'trending_date'.
+
+    Returns:
+        pd.DataFrame: One row per video, in segment order.
+    """
+    ranks = data[rank_column].to_numpy() if rank_column in data.columns \
+        else compute_daily_ranks(data, date_column=date_column)
+    segments = segments if segments is not None else VideoSegments(data, date_column=date_column)
+    starts = segments.starts
+    ends = starts + segments.lengths - 1
+
+    rank = segments.take(ranks).astype(np.float64)
+    rank[rank <= 0] = np.nan
+    previous = segments.previous(rank)
+    gap = segments.days - segments.previous(segments.days.astype(np.float64))
+    velocity = np.divide(previous - rank, gap, out=np.full(len(rank), np.nan), where=gap > 0)
+    in_top = rank <= top_n
+    was_in_top = previous <= top_n
+    known = ~np.isnan(previous) & ~np.isnan(rank)
+
+    result = segments.keys.copy()
+    first = segments.order[starts]
+    for column in carry:
+        if column in data.columns and column not in result.columns:
+            result[column] = data[column].to_numpy()[first]
+    result['entry_rank'] = rank[starts]
+    result['exit_rank'] = rank[ends]
+    result['best_rank'] = -segments.segment_max(-rank)
+    best = segments.segment_argmax(-rank)
+    result['days_to_best'] = np.where(best >= 0, segments.days[np.maximum(best, 0)] - segments.days[starts], -1)
+    result['rank_velocity'] = segments.segment_mean(velocity)
+    result['days_in_top'] = np.add.reduceat(in_top.astype(np.int32), starts) if len(starts) else np.zeros(0)
+    result['entered_top'] = np.logical_or.reduceat(known & in_top & ~was_in_top, starts) \
+        if len(starts) else np.zeros(0, dtype=bool)
+    result['exited_top'] = np.logical_or.reduceat(known & ~in_top & was_in_top, starts) \
+        if len(starts) else np.zeros(0, dtype=bool)
+    return result
+
+
+def summarize_rank_dynamics_by_category(data: pd.DataFrame, top_n: int = DEFAULT_TOP_N,
+                                        category_column: str = 'category_name',
+                                        rank_column: str = RANK_COLUMN) -> pd.DataFrame:
+    """
+    Rank dynamics of the videos of each category.
+
+    Args:
+        data (pd.DataFrame): Daily snapshots with ``category_column``.
+        top_n (int): Size of the top of the leaderboard. Defaults to 10.
+        category_column (str): Category column. Defaults to 'category_name'.
+        rank_column (str): Rank column, computed when missing. Defaults to 'daily_rank'.
+
+    Returns:
+        pd.DataFrame: One row per category, sorted by 'top_share': 'videos',
+        'mean_entry_rank', 'mean_exit_rank', 'mean_best_rank',
+        'mean_rank_velocity', 'top_share' (share of videos ranked within
+        ``top_n`` at least once), 'mean_days_in_top', 'entries' and 'exits'
+        (videos crossing into and out of the top).
+    """
+    dynamics = compute_rank_dynamics(data, top_n=top_n, rank_column=rank_column, carry=(category_column,))
+    dynamics['reached_top'] = dynamics['days_in_top'] > 0
+    summary = dynamics.groupby(category_column).agg(
+        videos=('entry_rank', 'size'),
+        mean_entry_rank=('entry_rank', 'mean'),
+        mean_exit_rank=('exit_rank', 'mean'),
+        mean_best_rank=('best_rank', 'mean'),
+        mean_rank_velocity=('rank_velocity', 'mean'),
+        top_share=('reached_top', 'mean'),
+        mean_days_in_top=('days_in_top', 'mean'),
+        entries=('entered_top', 'sum'),
+        exits=('exited_top', 'sum'),
+    )
+    return summary.sort_values('top_share', ascending=False, kind='stable').reset_index()
@@ -0,0 +1,90 @@
+import pandas as pd
+import numpy as np
+from typing import Optional, Sequence, Union
+
+# =============================================================
+# Stratified Sampling - YouTube Dataset
+# =============================================================
+# Vectorized stratified row sampling (one shuffle and one stable
+# sort, no per-group Python loop) for bounded-size plot overlays
+# and previews.
+# =============================================================
+
+
+def stratified_positions(strata: Union[pd.Series, np.ndarray, None], n: int, seed: Optional[int] = 0,
+                         min_per_stratum: int = 1, n_rows: Optional[int] = None) -> np.ndarray:
+    """
+    Pick about ``n`` row positions, allocated to strata in proportion to their size.
+
+    Quotas use largest-remainder rounding, so exactly ``n`` rows are picked
+    unless the minimums require more. Every non-empty stratum keeps at least
+    ``min_per_stratum`` rows (or all of its rows if it is smaller), so rare
+    categories stay visible. Rows with a missing stratum label are never picked.
+
+    Args:
+        strata (array-like or None): Stratum label per row. None samples uniformly.
+        n (int): Target sample size. All rows are returned if ``n`` >= row count.
+        seed (Optional[int]): Seed of the shuffle.
+        min_per_stratum (int): Minimum rows per stratum. Defaults to 1.
+        n_rows (Optional[int]): Row count, required when ``strata`` is None.
+
+    Returns:
+        np.ndarray: Sorted int64 positions of the sampled rows.
+    """
+    if strata is None:
+        codes = np.zeros(n_rows, dtype=np.int64)
+    else:
+        codes = pd.factorize(pd.Series(strata) if not isinstance(strata, pd.Series) else strata)[0].astype(np.int64)
+    valid = np.flatnonzero(codes >= 0)
+    if n >= len(valid):
+        return valid
+
+    codes = codes[valid]
+    counts = np.bincount(codes)
+    exact = n * counts / len(codes)
+    quota = np.minimum(counts, np.maximum(np.floor(exact).astype(np.int64), min_per_stratum))
+    # Largest remainders get the rows left after flooring
+    short = n - quota.sum()
+    if short > 0:
+        candidates = np.flatnonzero(quota < counts)
+        best = candidates[np.argsort(quota[candidates] - exact[candidates], kind='stable')[:short]]
+        quota[best] += 1
+
+    rng = np.random.default_rng(seed)
+    shuffled = rng.permutation(len(codes))
+    # Group the shuffled rows by stratum; the order inside each stratum stays random
+    order = shuffled[np.argsort(codes[shuffled], kind='stable')]
+    starts = np.concatenate([[0], np.cumsum(counts)[:-1]])
+    rank = np.arange(len(order)) - starts[codes[order]]
+    picked = order[rank < quota[codes[order]]]
+    return np.sort(valid[picked])
+
+
+def stratified_sample(df: pd.DataFrame, by: Union[str, Sequence[str], None], n: int, seed: Optional[int] = 0,
+                      min_per_stratum: int = 1) -> pd.DataFrame:
+    """
+    Stratified random sample of about ``n`` rows of ``df``.
+
+    Args:
+        df (pd.DataFrame): Input data.
+        by (str, Sequence[str] or None): Stratum column(s), e.g. 'category_name'
+            or ['country', 'category_name']. None samples uniformly.
+        n (int): Target sample size.
+        seed (Optional[int]): Seed for reproducible samples.
+        min_per_stratum (int): Minimum rows per stratum. Defaults to 1.
+
+    Returns:
+        pd.DataFrame: The sampled rows in their original order.
+    """
+    if by is None:
+        strata = None
+    elif isinstance(by, str):
+        strata = df[by]
+    else:
+        # Combined label codes; any missing part leaves the row unsampled
+        codes = [pd.factorize(df[column])[0] for column in by]
+        combined = pd.Series(np.ravel_multi_index([np.maximum(c, 0) for c in codes],
+                                                  [max(c.max() + 1, 1) for c in codes]))
+        strata = combined.where(np.all([c >= 0 for c in codes], axis=0))
+    positions = stratified_positions(strata, n, seed=seed, min_per_stratum=min_per_stratum, n_rows=len(df))
+    return df.iloc[positions]
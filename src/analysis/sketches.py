@@ -0,0 +1,583 @@
+import math
+import pandas as pd
+import numpy as np
+from typing import Iterable, Optional
+
+from .group_utils import sort_within_groups
+
+# =============================================================
+# Streaming Sketches - YouTube Dataset
+# =============================================================
+# Approximate, mergeable summaries for high-cardinality columns
+# (channels, tags, video ids):
+#   - PrioritySample: top-K heavy hitters from a weighted row sample
+#   - HyperLogLog: distinct counts (approximate nunique)
+#   - TDigest: quantiles (median, p90, p99) of many groups at once
+# HyperLogLog hashes values with pandas' vectorized hash_array; all
+# can be fed chunk by chunk and merge across chunks and countries.
+# =============================================================
+
+_DEFAULT_HASH_KEY = '0123456789123456'
+
+
+def hash_values(values, hash_key: str = _DEFAULT_HASH_KEY) -> np.ndarray:
+    """
+    Hash an array-like of values to uint64 with pandas' vectorized hasher.
+
+    Args:
+        values (array-like): Values to hash (strings, numbers, ...).
+        hash_key (str): 16-character key for the string hasher.
+
+    Returns:
+        np.ndarray: One uint64 hash per value.
+    """
+    array = np.asarray(values, dtype=object) if not isinstance(values, np.ndarray) else values
+    return pd.util.hash_array(array, hash_key=hash_key, categorize=True)
+
+
+def _bit_length(values: np.ndarray) -> np.ndarray:
+    """Vectorized int.bit_length for uint64 arrays (0 for 0)."""
+    _, exponent = np.frexp(values.astype(np.float64))
+    return exponent.astype(np.int64)
+
+
+class PrioritySample:
+    """
+    Mergeable priority sample of weighted keys, for heavy-hitter estimates.
+
+    Every row gets the priority ``weight / u`` with ``u`` uniform in (0, 1];
+    the ``size`` rows with the highest priorities are kept and ``threshold``
+    is the highest priority left out. A kept row stands for
+    ``max(weight, threshold)`` rows (or weight), an unbiased estimate with
+    the unbiased variance estimate ``threshold * max(0, threshold - weight)``
+    (priority sampling, Duffield, Lund and Thorup), so summing the kept rows
+    of a key estimates its count. With ``size = 100 / epsilon`` a key
+    heavier than ``epsilon * N`` is expected about 100 times in the sample,
+    a relative standard error of about 10%. Streams no longer than ``size``
+    are kept whole and counted exactly.
+
+    Counting keys costs one hash-table lookup per row whatever the sketch
+    (hashing a Python string is the expensive part), so the saving comes
+    from reading fewer rows: an update draws one random number per row and
+    only reads the keys of the rows it keeps. Samples of chunks or
+    countries merge by keeping the highest priorities of both; give
+    samples that will be merged different seeds.
+
+    Args:
+        size (int): Rows kept.
+        seed (int or None): Seed of the priorities.
+    """
+
+    def __init__(self, size: int = 100_000, seed: Optional[int] = None):
+        self.size = int(size)
+        self.keys = np.empty(0, dtype=object)
+        self.weights = np.empty(0)
+        self.priorities = np.empty(0)
+        self.threshold = 0.0
+        self._rng = np.random.default_rng(seed)
+
+    @classmethod
+    def from_error(cls, epsilon: float = 0.001, seed: Optional[int] = None) -> 'PrioritySample':
+        """Size a sample so that keys heavier than ``epsilon * N`` are estimated within about 10%."""
+        return cls(math.ceil(100 / epsilon), seed)
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def _absorb(self, keys: np.ndarray, weights: np.ndarray, priorities: np.ndarray, threshold: float) -> None:
+        """Add kept rows, then keep the ``size`` highest priorities above the threshold."""
+        keys = np.concatenate([self.keys, keys])
+        weights = np.concatenate([self.weights, weights])
+        priorities = np.concatenate([self.priorities, priorities])
+        threshold = max(self.threshold, threshold)
+        keep = np.flatnonzero(priorities > threshold)
+        if len(keep) > self.size:
+            order = keep[np.argpartition(-priorities[keep], self.size)]
+            threshold = max(threshold, float(priorities[order[self.size]]))
+            keep = order[:self.size]
+        self.keys, self.weights, self.priorities = keys[keep], weights[keep], priorities[keep]
+        self.threshold = threshold
+
+    def _uniform_candidates(self, n: int):
+        """
+        Positions and priorities of the rows of an unweighted chunk that can be kept.
+
+        A row can only be kept with ``u`` below ``1 / threshold``, and only the
+        ``size + 1`` smallest ``u`` of the chunk matter, so ``u`` is drawn
+        below a cutoff a little above ``(size + 1) / n`` only: the rows under
+        the cutoff are found by geometric gaps between Bernoulli successes,
+        and their ``u`` is uniform below it. Should too few rows fall under
+        the cutoff, the chunk is drawn again with the largest useful cutoff.
+        """
+        limit = 1.0 if self.threshold <= 1 else 1 / self.threshold
+        cutoff = min(limit, 1.5 * (self.size + 1) / max(n, 1))
+        while True:
+            batch = int(cutoff * n * 1.1) + 16
+            positions, last = [], -1
+            while last < n - 1:
+                drawn = last + np.cumsum(self._rng.geometric(cutoff, batch))
+                last = drawn[-1]
+                positions.append(drawn[drawn < n])
+            positions = np.concatenate(positions)
+            if len(positions) > self.size or cutoff >= limit:
+                return positions, 1 / (cutoff * (1 - self._rng.random(len(positions))))
+            cutoff = limit
+
+    def update(self, values, weights=None) -> 'PrioritySample':
+        """
+        Add a chunk of values (optionally weighted).
+
+        Args:
+            values (array-like): Keys, e.g. ``df['channel_title']``; missing
+                keys are sampled like any other and dropped by ``top``.
+            weights (array-like, optional): Weight per key (e.g. likes);
+                missing and negative weights count as 0. Defaults to 1.
+
+        Returns:
+            PrioritySample: self, to allow chaining.
+        """
+        if weights is None:
+            candidates, priorities = self._uniform_candidates(len(values))
+            weights = np.ones(len(candidates))
+        else:
+            weights = np.maximum(np.nan_to_num(np.asarray(weights, dtype=np.float64)), 0)
+            priorities = weights / (1 - self._rng.random(len(weights)))
+            candidates = np.flatnonzero(priorities > self.threshold)
+            weights, priorities = weights[candidates], priorities[candidates]
+        threshold = 0.0
+        if len(candidates) > self.size:
+            # Only the size + 1 highest priorities of the chunk can matter
+            order = np.argpartition(-priorities, self.size)
+            threshold = float(priorities[order[self.size]])
+            order = np.sort(order[:self.size])
+            candidates, weights, priorities = candidates[order], weights[order], priorities[order]
+        keys = values.iloc[candidates].to_numpy(dtype=object) if isinstance(values, pd.Series) \
+            else np.asarray(values, dtype=object)[candidates]
+        self._absorb(keys, weights, priorities, threshold)
+        return self
+
+    def merge(self, other: 'PrioritySample') -> 'PrioritySample':
+        """Merge another sample (e.g. from another chunk or country) into this one."""
+        self._absorb(other.keys, other.weights, other.priorities, other.threshold)
+        return self
+
+    def estimates(self) -> pd.DataFrame:
+        """
+        Return the kept rows with their estimates.
+
+        Returns:
+            pd.DataFrame: Columns 'key', 'count' (rows or weight the kept
+            row stands for) and 'variance' (0 when counted exactly).
+        """
+        counts = np.maximum(self.weights, self.threshold)
+        return pd.DataFrame({
+            'key': self.keys,
+            'count': counts,
+            'variance': self.threshold * np.maximum(self.threshold - self.weights, 0),
+        })
+
+    def top(self, k: int = 10) -> pd.DataFrame:
+        """
+        Return the k heaviest keys.
+
+        Returns:
+            pd.DataFrame: Columns 'key', 'count' (estimated total) and
+            'error' (three standard errors; 0 when counted exactly), sorted
+            by count.
+        """
+        return top_estimates(self.estimates(), k)
+
+
+def top_estimates(rows: pd.DataFrame, k: int = 10) -> pd.DataFrame:
+    """
+    Sum the 'count' and 'variance' of sampled rows per key and keep the k heaviest keys.
+
+    Args:
+        rows (pd.DataFrame): ``PrioritySample.estimates()``, possibly with
+            the keys replaced, e.g. by the tags of each sampled video
+            (one row per tag).
+        k (int): Number of keys to return. Defaults to 10.
+
+    Returns:
+        pd.DataFrame: Columns 'key', 'count' and 'error' (three standard
+        errors), sorted by count.
+    """
+    totals = rows.groupby('key', sort=False)[['count', 'variance']].sum()
+    top = totals.sort_values('count', ascending=False, kind='stable').head(k)
+    return pd.DataFrame({
+        'key': np.asarray(top.index, dtype=object),
+        'count': top['count'].to_numpy(),
+        'error': 3 * np.sqrt(top['variance'].to_numpy()),
+    })
+
+
+class HyperLogLog:
+    """
+    HyperLogLog distinct-count estimator.
+
+    Uses ``2 ** precision`` one-byte registers; the relative standard error
+    is about ``1.04 / sqrt(2 ** precision)`` (1.6% at the default precision 12).
+
+    Args:
+        precision (int): Number of index bits, between 4 and 18.
+    """
+
+    def __init__(self, precision: int = 12):
+        if not 4 <= precision <= 18:
+            raise ValueError("precision must be between 4 and 18.")
+        self.precision = precision
+        self.registers = np.zeros(2 ** precision, dtype=np.uint8)
+
+    @classmethod
+    def from_error(cls, relative_error: float = 0.01) -> 'HyperLogLog':
+        """Pick the smallest precision whose standard error is below ``relative_error``."""
+        precision = math.ceil(2 * math.log2(1.04 / relative_error))
+        return cls(min(max(precision, 4), 18))
+
+    @property
+    def relative_error(self) -> float:
+        return 1.04 / math.sqrt(len(self.registers))
+
+    def update(self, values) -> 'HyperLogLog':
+        """Add a chunk of values; missing values are ignored."""
+        values = pd.Series(np.asarray(values, dtype=object)).dropna().to_numpy()
+        return self.update_hashes(hash_values(values))
+
+    def update_hashes(self, hashes: np.ndarray) -> 'HyperLogLog':
+        """Add precomputed uint64 hashes (e.g. ``hash_values`` of a numeric array)."""
+        hashes = np.asarray(hashes, dtype=np.uint64)
+        bits = 64 - self.precision
+        index = (hashes >> np.uint64(bits)).astype(np.int64)
+        remainder = hashes & np.uint64((1 << bits) - 1)
+        rank = (bits - _bit_length(remainder) + 1).astype(np.uint8)
+        np.maximum.at(self.registers, index, rank)
+        return self
+
+    def merge(self, other: 'HyperLogLog') -> 'HyperLogLog':
+        """Merge another estimator of the same precision into this one."""
+        if self.precision != other.precision:
+            raise ValueError("Only HyperLogLog sketches with the same precision can be merged.")
+        np.maximum(self.registers, other.registers, out=self.registers)
+        return self
+
+    def estimate(self) -> float:
+        """Return the estimated number of distinct values."""
+        m = len(self.registers)
+        alpha = 0.7213 / (1 + 1.079 / m)
+        raw = alpha * m * m / np.sum(np.power(2.0, -self.registers.astype(np.float64)))
+        zeros = int(np.count_nonzero(self.registers == 0))
+        if raw <= 2.5 * m and zeros:
+            return m * math.log(m / zeros)  # linear counting for small cardinalities
+        return float(raw)
+
+
+class TDigest:
+    """
+    Mergeable t-digests of a numeric column for many groups at once.
+
+    Each group's distribution is summarized by centroids (mean, weight)
+    that are small near the tails and larger in the middle, using the
+    arcsine scale function: a centroid spans at most one unit of
+    ``k(q) = compression / (2 * pi) * asin(2q - 1)``, so a group keeps about
+    ``compression / 2`` centroids and extreme quantiles (p99) stay accurate.
+    Groups with fewer than about ``compression / 3`` values are kept exactly.
+
+    All groups are compressed together with one sort and a few bincounts,
+    so updates cost no per-group Python loop. Digests with the same
+    compression merge exactly like chunks.
+
+    Args:
+        compression (float): Size/accuracy trade-off. Defaults to 200.
+    """
+
+    def __init__(self, compression: float = 200):
+        self.compression = float(compression)
+        self.keys = pd.Index([])
+        self.groups = np.zeros(0, dtype=np.int64)
+        self.means = np.zeros(0, dtype=np.float64)
+        self.weights = np.zeros(0, dtype=np.float64)
+        self.minimum = np.zeros(0, dtype=np.float64)
+        self.maximum = np.zeros(0, dtype=np.float64)
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def _absorb(self, keys: pd.Index, groups, means, weights, minimum, maximum) -> None:
+        """Add centroids keyed into ``keys``, then compress."""
+        if len(self.keys) == 0:
+            combined = keys
+        else:
+            combined = self.keys.append(keys).unique()
+        old = combined.get_indexer(self.keys)[self.groups] if len(self.groups) else self.groups
+        new = combined.get_indexer(keys)[groups]
+
+        n = len(combined)
+        low = np.full(n, np.inf)
+        high = np.full(n, -np.inf)
+        if len(self.keys):
+            position = combined.get_indexer(self.keys)
+            low[position], high[position] = self.minimum, self.maximum
+        position = combined.get_indexer(keys)
+        np.minimum.at(low, position, minimum)
+        np.maximum.at(high, position, maximum)
+
+        self.keys = combined
+        self.minimum, self.maximum = low, high
+        self._compress(np.concatenate([old, new]), np.concatenate([self.means, means]),
+                       np.concatenate([self.weights, weights]))
+
+    def _compress(self, groups: np.ndarray, means: np.ndarray, weights: np.ndarray) -> None:
+        order = sort_within_groups(means, groups)
+        groups, means, weights = groups[order], means[order], weights[order]
+        totals = np.bincount(groups, weights=weights, minlength=len(self.keys))
+        cumulative = np.cumsum(weights)
+        # Weight of all earlier groups, so q restarts at 0 in every group
+        before = np.concatenate([[0.0], np.cumsum(totals)[:-1]])[groups]
+        q = (cumulative - weights / 2 - before) / totals[groups]
+        bucket = np.floor(self.compression / (2 * np.pi) * np.arcsin(np.clip(2 * q - 1, -1, 1)))
+        # Sorted by group and q, so equal (group, bucket) runs are consecutive
+        starts = np.ones(len(groups), dtype=bool)
+        starts[1:] = (groups[1:] != groups[:-1]) | (bucket[1:] != bucket[:-1])
+        cell = np.cumsum(starts) - 1
+        merged = np.bincount(cell, weights=weights)
+        self.means = np.bincount(cell, weights=weights * means) / merged
+        self.weights = merged
+        self.groups = groups[starts]
+
+    def update(self, values, groups=None, weights=None) -> 'TDigest':
+        """
+        Add a chunk of values.
+
+        Args:
+            values (array-like): Numeric values; missing values are ignored.
+            groups (array-like, list of array-likes or None): Group key of each
+                value, e.g. ``df['category_name']`` or
+                ``[df['category_name'], df['country']]``. None adds every value
+                to a single group.
+            weights (array-like or None): Weight of each value, e.g. its count
+                when repeated values were aggregated beforehand. Defaults to 1.
+
+        Returns:
+            TDigest: self, to allow chaining.
+        """
+        values = pd.to_numeric(pd.Series(values), errors='coerce').to_numpy(dtype=np.float64)
+        if groups is None:
+            codes, keys = np.zeros(len(values), dtype=np.int64), pd.Index([None])
+        elif isinstance(groups, (list, tuple)) and all(np.ndim(g) == 1 for g in groups):
+            # Combine per-level codes instead of hashing tuples
+            factorized = [pd.factorize(pd.Series(g)) for g in groups]
+            sizes = [max(len(uniques), 1) for _, uniques in factorized]
+            combined = np.ravel_multi_index([np.maximum(c, 0) for c, _ in factorized], sizes)
+            combined[np.any([c < 0 for c, _ in factorized], axis=0)] = -1
+            present, codes = np.unique(combined, return_inverse=True)
+            codes = np.where(combined < 0, -1, codes - (present[0] < 0))
+            present = present[present >= 0]
+            keys = pd.MultiIndex.from_arrays(
+                [np.asarray(uniques)[level] for (_, uniques), level in zip(factorized, np.unravel_index(present, sizes))],
+                names=[getattr(g, 'name', None) for g in groups])
+        else:
+            codes, keys = pd.factorize(pd.Series(groups))
+            # Plain labels (not Categorical) so digests of other chunks and countries merge
+            keys = pd.Index(np.asarray(keys), name=getattr(groups, 'name', None))
+        weights = np.ones(len(values)) if weights is None else np.asarray(weights, dtype=np.float64)
+        keep = np.isfinite(values) & (codes >= 0) & (weights > 0)
+        codes, values, weights = codes[keep], values[keep], weights[keep]
+        if not len(values):
+            return self
+        # Only keep groups that received values
+        used, codes = np.unique(codes, return_inverse=True)
+        keys = keys[used]
+        minimum = np.full(len(keys), np.inf)
+        maximum = np.full(len(keys), -np.inf)
+        np.minimum.at(minimum, codes, values)
+        np.maximum.at(maximum, codes, values)
+        self._absorb(keys, codes, values, weights, minimum, maximum)
+        return self
+
+    def merge(self, other: 'TDigest') -> 'TDigest':
+        """Merge another digest (e.g. from another chunk or country) into this one."""
+        if self.compression != other.compression:
+            raise ValueError("Only t-digests with the same compression can be merged.")
+        if len(other.keys):
+            self._absorb(other.keys, other.groups, other.means, other.weights, other.minimum, other.maximum)
+        return self
+
+    def rollup(self, levels) -> 'TDigest':
+        """
+        Return a digest with groups combined over the other key levels.
+
+        Args:
+            levels (str or list of str): Key levels to keep, e.g. 'category_name'
+                to combine countries and months.
+
+        Returns:
+            TDigest: A new digest.
+        """
+        levels = [levels] if isinstance(levels, str) else list(levels)
+        keys = self.keys.droplevel([n for n in self.keys.names if n not in levels]) \
+            if isinstance(self.keys, pd.MultiIndex) else self.keys
+        codes, uniques = keys.factorize()
+        if isinstance(keys, pd.MultiIndex):
+            uniques = pd.MultiIndex.from_tuples(uniques, names=keys.names)
+        else:
+            uniques = pd.Index(uniques, name=keys.name)
+        result = TDigest(self.compression)
+        result._absorb(uniques, codes[self.groups], self.means, self.weights,
+                       pd.Series(self.minimum).groupby(codes).min().to_numpy(),
+                       pd.Series(self.maximum).groupby(codes).max().to_numpy())
+        return result
+
+    def counts(self) -> pd.Series:
+        """Number of values added per group."""
+        return pd.Series(np.bincount(self.groups, weights=self.weights, minlength=len(self.keys)),
+                         index=self.keys, name='count')
+
+    def means_by_group(self) -> pd.Series:
+        """Exact mean of the values added per group."""
+        totals = np.bincount(self.groups, weights=self.weights * self.means, minlength=len(self.keys))
+        return pd.Series(totals / self.counts().to_numpy(), index=self.keys, name='mean')
+
+    def quantile(self, q) -> pd.DataFrame:
+        """
+        Estimate quantiles of every group.
+
+        Values are interpolated linearly between centroid centers, and
+        between the extreme centroids and the exact minimum and maximum.
+
+        Args:
+            q (float or list of float): Quantile(s) in [0, 1].
+
+        Returns:
+            pd.DataFrame: One row per group (indexed by the group keys) and
+            one column per quantile.
+        """
+        q = np.atleast_1d(np.asarray(q, dtype=np.float64))
+        n = len(self.keys)
+        if n == 0:
+            return pd.DataFrame(np.empty((0, len(q))), index=self.keys, columns=q)
+        totals = np.bincount(self.groups, weights=self.weights, minlength=n)
+        before = np.concatenate([[0.0], np.cumsum(totals)[:-1]])
+        centers = (np.cumsum(self.weights) - self.weights / 2 - before[self.groups]) / totals[self.groups]
+        # Groups are laid out at x = 2g + position in [0, 1], so interpolation never crosses groups
+        group_ids = np.arange(n)
+        x = np.concatenate([2 * group_ids, 2 * self.groups + centers, 2 * group_ids + 1])
+        y = np.concatenate([self.minimum, self.means, self.maximum])
+        order = np.argsort(x, kind='stable')
+        values = np.interp(2 * group_ids[:, None] + q[None, :], x[order], y[order])
+        return pd.DataFrame(values, index=self.keys, columns=q)
+
+
+def approximate_top_k(values, top_n: int = 10, epsilon: float = 0.001, weights=None,
+                      chunk_size: int = 1_000_000, seed: int = 0) -> pd.DataFrame:
+    """
+    Approximate the top N keys of a column from a priority sample of its rows.
+
+    About ``100 / epsilon`` rows are kept (see ``PrioritySample``), so a key
+    heavier than ``epsilon * N`` has a relative standard error of about 10%,
+    and less for heavier keys. Inputs no larger than the sample are counted
+    exactly. Memory is bounded by the sample, not by the number of distinct
+    keys. For data read in pieces, update one ``PrioritySample`` per piece
+    and ``merge`` them instead.
+
+    Args:
+        values (array-like): Keys, e.g. ``df['channel_title']``.
+        top_n (int): Number of keys to return. Defaults to 10.
+        epsilon (float): Share of the total weight a key needs for a reliable estimate.
+        weights (array-like, optional): Weight per key (e.g. likes); counts rows if omitted.
+        chunk_size (int): Rows sampled at a time. Defaults to 1,000,000.
+        seed (int): Seed of the sample.
+
+    Returns:
+        pd.DataFrame: Columns 'key', 'count' (estimated total) and 'error'
+        (three standard errors of the estimate; 0 when counted exactly),
+        sorted by count.
+    """
+    if not isinstance(values, pd.Series):
+        values = pd.Series(np.asarray(values, dtype=object))
+    weights = None if weights is None else np.asarray(weights, dtype=np.float64)
+    sample = PrioritySample.from_error(epsilon, seed)
+    for start in range(0, len(values), chunk_size):
+        sample.update(values.iloc[start:start + chunk_size],
+                      None if weights is None else weights[start:start + chunk_size])
+    return sample.top(top_n)
+
+
+def approximate_nunique(values, relative_error: float = 0.01) -> float:
+    """Estimate the number of distinct non-null values with HyperLogLog."""
+    return HyperLogLog.from_error(relative_error).update(values).estimate()
+
+
+def top_k_keys(values, top_n: int = 10, approximate: bool = False, weights=None,
+               epsilon: float = 0.001) -> pd.Index:
+    """
+    Return the N most frequent (or heaviest, with ``weights``) keys.
+
+    The exact path uses ``value_counts`` / ``groupby().sum()`` over every row;
+    the approximate path counts a weighted row sample (``approximate_top_k``).
+
+    Returns:
+        pd.Index: Keys ordered from heaviest to lightest.
+    """
+    if approximate:
+        return pd.Index(approximate_top_k(values, top_n, epsilon, weights)['key'])
+    if weights is None:
+        values = pd.Series(values)
+        if isinstance(values.dtype, pd.CategoricalDtype):
+            # Count the codes; listing the keys in order of appearance first breaks
+            # ties as value_counts does on the labels
+            codes = values.cat.codes.to_numpy()
+            valid = np.flatnonzero(codes >= 0)
+            first = np.full(len(values.cat.categories), len(codes))
+            # Reversed assignment leaves the first position of every code
+            first[codes[valid[::-1]]] = valid[::-1]
+            keys = np.argsort(first, kind='stable')[:np.count_nonzero(first < len(codes))]
+            counts = np.bincount(codes[valid], minlength=len(first))[keys]
+            counts = pd.Series(counts, index=pd.Index(np.asarray(values.cat.categories)[keys]))
+            return counts.sort_values(ascending=False).head(top_n).index
+        return values.value_counts().head(top_n).index
+    return pd.Series(np.asarray(weights)).groupby(np.asarray(values)).sum() \
+        .sort_values(ascending=False).head(top_n).index
+
+
+def validate_sketches(values, top_n: int = 10, epsilon: float = 0.001,
+                      relative_error: float = 0.01, weights=None) -> dict:
+    """
+    Compare sketch answers with exact counts on the same data.
+
+    Args:
+        values (array-like): Keys to evaluate.
+        top_n (int): Number of heavy hitters to compare. Defaults to 10.
+        epsilon (float): Error parameter of the row sample (``approximate_top_k``).
+        relative_error (float): HyperLogLog target error.
+        weights (array-like, optional): Weight per key.
+
+    Returns:
+        dict: 'top_k' (DataFrame of key, estimated, exact, abs_error, rel_error),
+        'top_k_recall' (share of the exact top N found), 'nunique_estimate',
+        'nunique_exact' and 'nunique_rel_error'.
+    """
+    series = pd.Series(np.asarray(values, dtype=object))
+    if weights is None:
+        exact = series.value_counts()
+    else:
+        exact = pd.Series(np.asarray(weights, dtype=np.float64)).groupby(series).sum().sort_values(ascending=False)
+
+    approx = approximate_top_k(series, top_n, epsilon, weights)
+    exact_counts = exact.reindex(approx['key']).fillna(0).to_numpy()
+    table = pd.DataFrame({
+        'key': approx['key'],
+        'estimated': approx['count'],
+        'exact': exact_counts,
+    })
+    table['abs_error'] = (table['estimated'] - table['exact']).abs()
+    table['rel_error'] = table['abs_error'] / table['exact'].replace(0, np.nan)
+
+    nunique_exact = int(series.nunique())
+    nunique_estimate = approximate_nunique(series, relative_error)
+    return {
+        'top_k': table,
+        'top_k_recall': len(set(approx['key']) & set(exact.head(top_n).index)) / max(min(top_n, len(exact)), 1),
+        'nunique_estimate': nunique_estimate,
+        'nunique_exact': nunique_exact,
+        'nunique_rel_error': abs(nunique_estimate - nunique_exact) / max(nunique_exact, 1),
+    }
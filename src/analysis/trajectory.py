@@ -0,0 +1,229 @@
+import pandas as pd
+import numpy as np
+from typing import Optional, Sequence
+
+from .group_utils import sort_within_groups
+
+# =============================================================
+# Video Trajectories - YouTube Dataset
+# =============================================================
+# Every row is a snapshot of a video on one trending day. The rows
+# are sorted once by (country, video_id, trending_date) into
+# contiguous per-video segments; day-over-day deltas, growth rates,
+# days on trending and peak days are then computed with NumPy
+# segment operations (shifted differences masked at segment
+# starts, ufunc.reduceat) instead of a groupby-apply per video.
+# =============================================================
+
+TRAJECTORY_METRICS = ['views', 'likes', 'comment_count']
+
+# Columns copied from each video's first snapshot into the trajectory table
+TRAJECTORY_CARRY = ['category_name', 'channel_title']
+
+
+class VideoSegments:
+    """
+    Snapshots sorted into one contiguous segment per video.
+
+    ``order`` holds the positions of the sorted rows in the input frame
+    and ``starts`` the first sorted row of every segment, so any column
+    ``x`` sorted as ``x[order]`` can be reduced per video with
+    ``np.<ufunc>.reduceat(x[order], starts)``. Within a segment rows are
+    ordered by date (snapshots of the same day keep their input order);
+    segments are ordered by key, each key level in order of first
+    appearance. Rows with a missing key or date are left out.
+
+    Args:
+        data (pd.DataFrame): Snapshots, one row per video and trending day.
+        by (Optional[Sequence[str]]): Columns identifying a video. Defaults to
+            'country' (when present) and 'video_id', since a video trends
+            separately in every country.
+        date_column (str): Snapshot date. Defaults to 'trending_date'.
+
+    Raises:
+        KeyError: If a key column or ``date_column`` does not exist in the DataFrame.
+    """
+
+    def __init__(self, data: pd.DataFrame, by: Optional[Sequence[str]] = None,
+                 date_column: str = 'trending_date'):
+        if by is None:
+            by = [c for c in ('country', 'video_id') if c in data.columns] or ['video_id']
+        by = [by] if isinstance(by, str) else list(by)
+        for column in [*by, date_column]:
+            if column not in data.columns:
+                raise KeyError(f"The column '{column}' is not found in the dataset.")
+
+        dates = pd.to_datetime(data[date_column], errors='coerce')
+        days = dates.to_numpy(dtype='datetime64[ns]').astype('datetime64[D]').view(np.int64)
+        factorized = [pd.factorize(data[column]) for column in by]
+        codes = np.ravel_multi_index([np.maximum(c, 0) for c, _ in factorized],
+                                     [max(len(uniques), 1) for _, uniques in factorized])
+        valid = np.all([c >= 0 for c, _ in factorized], axis=0) & dates.notna().to_numpy()
+
+        rows = np.flatnonzero(valid)
+        order = rows[sort_within_groups(days[rows], codes[rows], stable=True)] if len(rows) else rows
+        sorted_codes = codes[order]
+        is_start = np.ones(len(order), dtype=bool)
+        is_start[1:] = sorted_codes[1:] != sorted_codes[:-1]
+
+        self.by = by
+        self.date_column = date_column
+        self.index = data.index
+        self.order = order
+        self.days = days[order]
+        self.is_start = is_start
+        self.starts = np.flatnonzero(is_start)
+        self.lengths = np.diff(np.append(self.starts, len(order)))
+        # Segment number of every sorted row
+        self.segment = np.cumsum(is_start) - 1
+        first = order[self.starts]
+        self.keys = pd.DataFrame({column: data[column].to_numpy()[first] for column in by})
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def take(self, values) -> np.ndarray:
+        """Sort an array-like aligned with the input frame into segment order."""
+        return np.asarray(values)[self.order]
+
+    def previous(self, values: np.ndarray) -> np.ndarray:
+        """Value of the previous snapshot of the same video (NaN at segment starts)."""
+        shifted = np.empty(len(values), dtype=np.float64)
+        shifted[1:] = values[:-1]
+        shifted[self.is_start] = np.nan
+        return shifted
+
+    def position_in_segment(self) -> np.ndarray:
+        """0-based rank of every sorted row within its segment."""
+        return np.arange(len(self.order)) - self.starts[self.segment]
+
+    def segment_max(self, values: np.ndarray) -> np.ndarray:
+        """Per-segment maximum, skipping NaN (NaN for all-NaN segments)."""
+        if not len(self.starts):
+            return np.zeros(0)
+        peak = np.maximum.reduceat(np.where(np.isnan(values), -np.inf, values), self.starts)
+        return np.where(np.isneginf(peak), np.nan, peak)
+
+    def segment_argmax(self, values: np.ndarray) -> np.ndarray:
+        """Sorted position of the first per-segment maximum (-1 for all-NaN segments)."""
+        peak = self.segment_max(values)
+        hit = values == peak[self.segment]
+        first = np.minimum.reduceat(np.where(hit, np.arange(len(values)), len(values)), self.starts) \
+            if len(self.starts) else np.zeros(0, dtype=np.int64)
+        return np.where(first < len(values), first, -1)
+
+    def segment_mean(self, values: np.ndarray) -> np.ndarray:
+        """Per-segment mean, skipping NaN."""
+        if not len(self.starts):
+            return np.zeros(0)
+        finite = np.isfinite(values)
+        total = np.add.reduceat(np.where(finite, values, 0.0), self.starts)
+        count = np.add.reduceat(finite.astype(np.int64), self.starts)
+        return np.divide(total, count, out=np.full(len(total), np.nan), where=count > 0)
+
+
+def _metrics(data: pd.DataFrame, metrics: Sequence[str]):
+    return [m for m in metrics if m in data.columns]
+
+
+def compute_snapshot_deltas(data: pd.DataFrame, metrics: Sequence[str] = TRAJECTORY_METRICS,
+                            segments: Optional[VideoSegments] = None, by: Optional[Sequence[str]] = None,
+                            date_column: str = 'trending_date') -> pd.DataFrame:
+    """
+    Day-over-day change of each metric between consecutive snapshots of a video.
+
+    For every snapshot: its day on trending (1 for the first snapshot), the
+    days since the previous snapshot ('gap_days'), the metric increase
+    since then ('<metric>_delta') and the daily growth rate
+    ('<metric>_growth' = delta / gap_days / previous value). Deltas and
+    rates are NaN on a video's first snapshot; rates are also NaN when the
+    previous value is 0 or both snapshots share a date.
+
+    Args:
+        data (pd.DataFrame): Snapshots with the key, date and metric columns.
+        metrics (Sequence[str]): Cumulative counters to difference. Missing
+            columns are skipped. Defaults to views, likes and comment_count.
+        segments (Optional[VideoSegments]): Precomputed segments of ``data``,
+            to share one sort between analyses.
+        by (Optional[Sequence[str]]): Video key columns (see ``VideoSegments``).
+        date_column (str): Snapshot date. Defaults to 'trending_date'.
+
+    Returns:
+        pd.DataFrame: One row per snapshot in (video, date) order, indexed by
+        the snapshot's index in ``data``, with the key columns, the date,
+        'day_on_trending', 'gap_days' and the delta and growth columns.
+    """
+    segments = segments if segments is not None else VideoSegments(data, by=by, date_column=date_column)
+    order = segments.order
+    result = {column: data[column].to_numpy()[order] for column in segments.by}
+    result[segments.date_column] = segments.days.astype('datetime64[D]').astype('datetime64[ns]')
+    result['day_on_trending'] = (segments.position_in_segment() + 1).astype(np.int32)
+    gap = segments.days - segments.previous(segments.days.astype(np.float64))
+    result['gap_days'] = gap
+
+    for metric in _metrics(data, metrics):
+        values = pd.to_numeric(data[metric], errors='coerce').to_numpy(dtype=np.float64)[order]
+        before = segments.previous(values)
+        delta = values - before
+        rate = np.divide(delta, gap * before, out=np.full(len(delta), np.nan), where=(gap > 0) & (before > 0))
+        result[f'{metric}_delta'] = delta
+        result[f'{metric}_growth'] = rate
+    return pd.DataFrame(result, index=segments.index[order])
+
+
+def build_trajectory_table(data: pd.DataFrame, metrics: Sequence[str] = TRAJECTORY_METRICS,
+                           carry: Sequence[str] = TRAJECTORY_CARRY, segments: Optional[VideoSegments] = None,
+                           by: Optional[Sequence[str]] = None, date_column: str = 'trending_date') -> pd.DataFrame:
+    """
+    Compact per-video summary of how each metric grew while trending.
+
+    Columns per video: the key columns, the ``carry`` columns of its first
+    snapshot, 'first_trending_date', 'last_trending_date',
+    'days_on_trending' (snapshots), 'span_days' (first to last date,
+    inclusive) and per metric:
+
+    - '<metric>_first', '<metric>_last' and '<metric>_gain' (last - first)
+    - '<metric>_peak_gain': largest day-over-day delta
+    - '<metric>_peak_date': date of the snapshot with that delta
+    - '<metric>_mean_growth': mean daily growth rate
+
+    Peak and growth columns are NaN (NaT) for videos with one snapshot.
+
+    Args:
+        data (pd.DataFrame): Snapshots with the key, date and metric columns.
+        metrics (Sequence[str]): Cumulative counters. Missing columns are skipped.
+        carry (Sequence[str]): Descriptive columns to copy. Missing columns are skipped.
+        segments (Optional[VideoSegments]): Precomputed segments of ``data``.
+        by (Optional[Sequence[str]]): Video key columns (see ``VideoSegments``).
+        date_column (str): Snapshot date. Defaults to 'trending_date'.
+
+    Returns:
+        pd.DataFrame: One row per video, in segment order (see ``VideoSegments``).
+    """
+    segments = segments if segments is not None else VideoSegments(data, by=by, date_column=date_column)
+    deltas = compute_snapshot_deltas(data, metrics, segments=segments)
+    starts = segments.starts
+    ends = starts + segments.lengths - 1
+    dates = deltas[segments.date_column].to_numpy()
+
+    result = segments.keys.copy()
+    first = segments.order[starts]
+    for column in carry:
+        if column in data.columns and column not in result.columns:
+            result[column] = data[column].to_numpy()[first]
+    result['first_trending_date'] = dates[starts]
+    result['last_trending_date'] = dates[ends]
+    result['days_on_trending'] = segments.lengths.astype(np.int32)
+    result['span_days'] = (segments.days[ends] - segments.days[starts] + 1).astype(np.int32)
+
+    for metric in _metrics(data, metrics):
+        values = pd.to_numeric(data[metric], errors='coerce').to_numpy(dtype=np.float64)[segments.order]
+        delta = deltas[f'{metric}_delta'].to_numpy()
+        result[f'{metric}_first'] = values[starts]
+        result[f'{metric}_last'] = values[ends]
+        result[f'{metric}_gain'] = values[ends] - values[starts]
+        result[f'{metric}_peak_gain'] = segments.segment_max(delta)
+        peak = segments.segment_argmax(delta)
+        result[f'{metric}_peak_date'] = np.where(peak >= 0, dates[np.maximum(peak, 0)], np.datetime64('NaT'))
+        result[f'{metric}_mean_growth'] = segments.segment_mean(deltas[f'{metric}_growth'].to_numpy())
+    return result
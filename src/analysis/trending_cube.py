@@ -0,0 +1,307 @@
+import pandas as pd
+import numpy as np
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from ..preprocessing.columnar_store import accepts_columnar_store
+
+# =============================================================
+# Trending Cube - YouTube Dataset
+# =============================================================
+# Materializes additive measures (row count, sums and sums of
+# squares of the engagement metrics) over the dimensions most
+# report tables group by: category, trending day, publish weekday,
+# country and the status flags. Report tables are then answered
+# by rolling the (much smaller) set of cube cells up, instead of
+# scanning the raw frame once per table.
+# =============================================================
+
+DEFAULT_DIMENSIONS = [
+    'category_name',
+    'trending_date',
+    'publish_weekday',
+    'country',
+    'comments_disabled',
+    'ratings_disabled',
+    'video_error_or_removed',
+]
+
+CUBE_METRICS = ['views', 'likes', 'dislikes', 'comment_count', 'engagement_rate']
+
+STATUS_FLAGS = ['comments_disabled', 'ratings_disabled', 'video_error_or_removed']
+
+WEEKDAY_ORDER = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
+
+# Dimensions derived from a stored one at roll-up time
+_DERIVED_DIMENSIONS = {
+    'trending_month': 'trending_date',
+}
+
+
+class TrendingCube:
+    """
+    Sparse, array-backed cube of additive measures.
+
+    Only non-empty cells are stored. ``codes[dim]`` holds the integer label
+    code of every cell (-1 for a missing label), ``labels[dim]`` the sorted
+    labels and ``data`` a ``(n_cells, n_measures)`` float array whose columns
+    are named by ``measures``:
+
+    - ``count``: number of rows in the cell
+    - ``sum_<metric>``, ``sumsq_<metric>``, ``n_<metric>``: sum, sum of squares
+      and non-null count of each metric in ``CUBE_METRICS``
+
+    Build it with ``build_trending_cube``.
+    """
+
+    def __init__(self, labels: Dict[str, np.ndarray], codes: Dict[str, np.ndarray],
+                 measures: List[str], data: np.ndarray):
+        self.labels = labels
+        self.codes = codes
+        self.measures = measures
+        self.data = data
+        self._measure_pos = {name: i for i, name in enumerate(measures)}
+
+    @property
+    def dimensions(self) -> List[str]:
+        return list(self.labels)
+
+    def __len__(self) -> int:
+        return self.data.shape[0]
+
+    def _dimension(self, name: str) -> Tuple[np.ndarray, np.ndarray]:
+        """Return ``(codes, labels)`` for a stored or derived dimension."""
+        if name in self.labels:
+            return self.codes[name], self.labels[name]
+        source = _DERIVED_DIMENSIONS.get(name)
+        if source is None or source not in self.labels:
+            raise KeyError(f"Dimension '{name}' is not available in the cube.")
+        months = pd.DatetimeIndex(self.labels[source]).month.to_numpy()
+        month_codes, month_labels = pd.factorize(months, sort=True)
+        # Keep -1 (missing date) as -1 via a trailing sentinel slot
+        lookup = np.append(month_codes, -1)
+        return lookup[self.codes[source]], np.asarray(month_labels)
+
+    def rollup(self, dimensions: Sequence[str], measures: Optional[Sequence[str]] = None) -> pd.DataFrame:
+        """
+        Sum measures over the given dimensions.
+
+        Cells whose label is missing in any requested dimension are excluded,
+        mirroring ``groupby``'s default handling of missing keys.
+
+        Args:
+            dimensions (Sequence[str]): Dimensions to keep; all others are summed out.
+            measures (Optional[Sequence[str]]): Measures to return. Defaults to all.
+
+        Returns:
+            pd.DataFrame: One row per label combination, with the dimension labels
+            followed by the summed measures.
+        """
+        measures = list(self.measures if measures is None else measures)
+        positions = [self._measure_pos[m] for m in measures]
+        dims = [self._dimension(name) for name in dimensions]
+
+        keep = np.ones(len(self), dtype=bool)
+        for codes, _ in dims:
+            keep &= codes >= 0
+
+        if dims:
+            key = np.ravel_multi_index([codes[keep] for codes, _ in dims],
+                                       [max(len(labels), 1) for _, labels in dims])
+            cells, inverse = np.unique(key, return_inverse=True)
+        else:
+            cells, inverse = np.zeros(1, dtype=np.int64), np.zeros(int(keep.sum()), dtype=np.int64)
+
+        data = self.data[keep][:, positions]
+        sums = np.column_stack([
+            np.bincount(inverse, weights=data[:, i], minlength=len(cells)) for i in range(len(positions))
+        ]) if positions else np.empty((len(cells), 0))
+
+        result = {}
+        if dims:
+            unravelled = np.unravel_index(cells, [max(len(labels), 1) for _, labels in dims])
+            for name, (_, labels), label_codes in zip(dimensions, dims, unravelled):
+                result[name] = labels[label_codes]
+        for i, name in enumerate(measures):
+            result[name] = sums[:, i]
+        return pd.DataFrame(result)
+
+    def mean(self, dimensions: Sequence[str], metrics: Sequence[str]) -> pd.DataFrame:
+        """
+        Mean of each metric over the given dimensions (missing values skipped).
+
+        Args:
+            dimensions (Sequence[str]): Dimensions to group by.
+            metrics (Sequence[str]): Metrics from ``CUBE_METRICS``.
+
+        Returns:
+            pd.DataFrame: Dimension labels followed by one mean column per metric.
+        """
+        measures = [f"sum_{m}" for m in metrics] + [f"n_{m}" for m in metrics] + ['count']
+        rolled = self.rollup(dimensions, measures)
+        out = rolled[list(dimensions)].copy()
+        with np.errstate(divide='ignore', invalid='ignore'):
+            for m in metrics:
+                out[m] = rolled[f"sum_{m}"] / rolled[f"n_{m}"].replace(0, np.nan)
+        out['count'] = rolled['count'].astype(np.int64)
+        return out
+
+    def describe(self, dimensions: Sequence[str], metric: str) -> pd.DataFrame:
+        """
+        Count, mean and sample standard deviation of a metric from its sums of squares.
+
+        Args:
+            dimensions (Sequence[str]): Dimensions to group by.
+            metric (str): A metric from ``CUBE_METRICS``.
+
+        Returns:
+            pd.DataFrame: Dimension labels with 'count', 'mean' and 'std' columns.
+        """
+        rolled = self.rollup(dimensions, [f"n_{metric}", f"sum_{metric}", f"sumsq_{metric}"])
+        n = rolled[f"n_{metric}"]
+        total = rolled[f"sum_{metric}"]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            mean = total / n
+            var = (rolled[f"sumsq_{metric}"] - n * mean ** 2) / (n - 1)
+        out = rolled[list(dimensions)].copy()
+        out['count'] = n.astype(np.int64)
+        out['mean'] = mean
+        out['std'] = np.sqrt(var.clip(lower=0)).where(n > 1)
+        return out
+
+    # ------------------------------
+    # Report tables
+    # ------------------------------
+
+    def trending_by_month(self) -> pd.DataFrame:
+        """Number of trending rows per calendar month (see ``trending_by_month``)."""
+        rolled = self.rollup(['trending_month'], ['count']).sort_values('trending_month')
+        return pd.DataFrame({
+            'month': rolled['trending_month'].to_numpy(),
+            'count': rolled['count'].to_numpy(dtype=np.int64),
+        })
+
+    def trending_day_distribution(self) -> pd.DataFrame:
+        """Number of trending rows per publish weekday (see ``trending_day_distribution``)."""
+        rolled = self.rollup(['publish_weekday'], ['count'])
+        weekdays = rolled['publish_weekday']
+        if pd.api.types.is_numeric_dtype(weekdays):
+            weekdays = weekdays.map(dict(enumerate(WEEKDAY_ORDER)))
+        counts = pd.Series(rolled['count'].to_numpy(), index=weekdays.to_numpy())
+        counts = counts.groupby(level=0).sum().reindex(WEEKDAY_ORDER, fill_value=0)
+        return pd.DataFrame({
+            'weekday': pd.Categorical(WEEKDAY_ORDER, categories=WEEKDAY_ORDER, ordered=True),
+            'count': counts.to_numpy(dtype=np.int64),
+        })
+
+    def engagement_disabled_analysis(self) -> pd.DataFrame:
+        """Averages by comments/ratings disabled flags (see ``engagement_disabled_analysis``)."""
+        means = self.mean(['comments_disabled', 'ratings_disabled'], ['views', 'likes', 'comment_count'])
+        means = means.sort_values(['comments_disabled', 'ratings_disabled']).reset_index(drop=True)
+        return means.rename(columns={
+            'views': 'avg_views',
+            'likes': 'avg_likes',
+            'comment_count': 'avg_comments',
+        })
+
+    def compare_status_impact(self) -> pd.DataFrame:
+        """Mean metrics with each status flag OFF vs ON (see ``compare_status_impact``)."""
+        engagement_metrics = ['views', 'likes', 'dislikes', 'comment_count']
+        results = []
+        for flag in STATUS_FLAGS:
+            grouped = (
+                self.mean([flag], engagement_metrics)
+                .set_index(flag)[engagement_metrics]
+                .sort_index()
+                .rename(index={False: 'Flag OFF', True: 'Flag ON'})
+                .T
+            )
+            grouped.columns.name = flag
+            grouped['Flag'] = flag
+            grouped = grouped.set_index('Flag', append=True).reorder_levels([1, 0])
+            results.append(grouped)
+        return pd.concat(results)
+
+    def summarize_engagement_by_category(self) -> pd.DataFrame:
+        """Category totals and average engagement rate (see ``summarize_engagement_by_category_df``)."""
+        rolled = self.rollup(
+            ['category_name'],
+            ['count', 'sum_likes', 'sum_comment_count', 'sum_views', 'sum_engagement_rate'],
+        ).sort_values('category_name').reset_index(drop=True)
+        return pd.DataFrame({
+            'category_name': rolled['category_name'],
+            'video_count': rolled['count'].astype(np.int64),
+            'total_likes': rolled['sum_likes'],
+            'total_comments': rolled['sum_comment_count'],
+            'total_views': rolled['sum_views'],
+            'avg_engagement_rate': rolled['sum_engagement_rate'] / rolled['count'],
+        })
+
+
+@accepts_columnar_store(columns=DEFAULT_DIMENSIONS + CUBE_METRICS, column_args=('dimensions',))
+def build_trending_cube(df: pd.DataFrame, dimensions: Optional[Sequence[str]] = None) -> TrendingCube:
+    """
+    Build a TrendingCube from a cleaned trending DataFrame in one pass.
+
+    Args:
+        df (pd.DataFrame): Dataset with the engagement metrics and dimension columns.
+        dimensions (Optional[Sequence[str]]): Dimension columns to materialize.
+            Defaults to the columns of ``DEFAULT_DIMENSIONS`` present in ``df``.
+
+    Returns:
+        TrendingCube: The populated cube.
+
+    Raises:
+        KeyError: If an explicitly requested dimension is missing from ``df``.
+    """
+    from .engagement import compute_engagement_rate_df
+
+    if dimensions is None:
+        dimensions = [d for d in DEFAULT_DIMENSIONS if d in df.columns]
+    missing = [d for d in dimensions if d not in df.columns]
+    if missing:
+        raise KeyError(f"Missing dimension columns in DataFrame: {missing}")
+
+    labels, row_codes = {}, []
+    for dim in dimensions:
+        column = df[dim]
+        if dim == 'trending_date':
+            column = pd.to_datetime(column, errors='coerce').dt.normalize()
+        codes, uniques = pd.factorize(column, sort=True)
+        labels[dim] = np.asarray(uniques)
+        row_codes.append(codes)
+
+    metrics = {}
+    for metric in CUBE_METRICS:
+        if metric == 'engagement_rate':
+            values = pd.to_numeric(compute_engagement_rate_df(df), errors='coerce').fillna(0)
+        elif metric in df.columns:
+            values = pd.to_numeric(df[metric], errors='coerce')
+        else:
+            values = pd.Series(np.nan, index=df.index)
+        metrics[metric] = values.to_numpy(dtype=np.float64, na_value=np.nan)
+
+    # Shift codes by one so that missing labels (-1) get their own slot
+    if row_codes:
+        key = np.ravel_multi_index([c + 1 for c in row_codes], [len(labels[d]) + 1 for d in dimensions])
+        cells, inverse = np.unique(key, return_inverse=True)
+    else:
+        cells, inverse = np.zeros(1, dtype=np.int64), np.zeros(len(df), dtype=np.int64)
+
+    measures = ['count']
+    columns = [np.bincount(inverse, minlength=len(cells)).astype(np.float64)]
+    for metric, values in metrics.items():
+        valid = ~np.isnan(values)
+        filled = np.where(valid, values, 0.0)
+        measures += [f"sum_{metric}", f"sumsq_{metric}", f"n_{metric}"]
+        columns += [
+            np.bincount(inverse, weights=filled, minlength=len(cells)),
+            np.bincount(inverse, weights=filled * filled, minlength=len(cells)),
+            np.bincount(inverse, weights=valid.astype(np.float64), minlength=len(cells)),
+        ]
+
+    codes = {}
+    if row_codes:
+        cell_codes = np.unravel_index(cells, [len(labels[d]) + 1 for d in dimensions])
+        codes = {dim: (c - 1).astype(np.int32) for dim, c in zip(dimensions, cell_codes)}
+
+    return TrendingCube(labels, codes, measures, np.column_stack(columns))
@@ -1,7 +1,13 @@
+import copy
+import functools
+import threading
+from dataclasses import asdict, dataclass, field, fields
 from pathlib import Path
+import pandas as pd
 import yaml
 
 
+@functools.lru_cache(maxsize=None)
 def find_project_root(marker_files=('README.md', 'requirements.txt', '.git')) -> Path:
     """
     Find the project root directory by looking for marker files/directories.
@@ -50,6 +56,44 @@ def load_yaml(relative_path: str) -> dict:
         raise ValueError(f"Error parsing YAML file at path: {abs_path}\n{str(e)}")
 
 
+# Parsed YAML (and derived objects) per file, keyed by the file's mtime and size
+_cache = {}
+_cache_lock = threading.Lock()
+
+
+def _load_cached(relative_path: str, build=lambda raw: raw):
+    """
+    Return ``build(load_yaml(relative_path))``, re-reading the file only when it changed.
+
+    A single ``stat`` call per lookup detects edits (modification time or size).
+    """
+    abs_path = PROJECT_ROOT / relative_path
+    try:
+        stat = abs_path.stat()
+    except FileNotFoundError:
+        raise FileNotFoundError(f"YAML file not found at path: {abs_path}")
+    key = (relative_path, build)
+    stamp = (stat.st_mtime_ns, stat.st_size)
+
+    with _cache_lock:
+        cached = _cache.get(key)
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+
+    value = build(load_yaml(relative_path))
+    with _cache_lock:
+        _cache[key] = (stamp, value)
+    return value
+
+
+def clear_config_cache():
+    """
+    Drop all cached configuration, forcing the next lookup to re-read the YAML files.
+    """
+    with _cache_lock:
+        _cache.clear()
+
+
 def get_paths_config() -> dict:
     """
     Load paths configuration from config/paths.yaml and convert all relative paths to absolute Path objects.
@@ -60,7 +104,10 @@ def get_paths_config() -> dict:
     Note:
         This ensures paths work regardless of the current working directory when scripts/notebooks are executed.
     """
-    raw_config = load_yaml("config/paths.yaml")
+    return dict(_load_cached("config/paths.yaml", _build_paths_config))
+
+
+def _build_paths_config(raw_config: dict) -> dict:
     paths_config = {}
     
     for key, value in raw_config.items():
@@ -84,9 +131,227 @@ def get_settings_config() -> dict:
     Load settings configuration from config/settings.yaml
     
     Returns:
-        dict: Settings configuration dictionary.
+        dict: Settings configuration dictionary (a copy, safe to modify).
+    """
+    return copy.deepcopy(_load_cached("config/settings.yaml"))
+
+
+# =============================================================
+# Typed settings
+# =============================================================
+# Frozen, slotted dataclasses mirroring config/settings.yaml. They are
+# validated once when the file is (re)loaded and are cheap to pickle
+# into worker processes, e.g. ``settings.visualization.plot_dpi``.
+# =============================================================
+
+
+def _section(cls, raw, name):
+    """
+    Build a settings dataclass from a YAML mapping, checking keys and types.
+    """
+    raw = {} if raw is None else raw
+    if not isinstance(raw, dict):
+        raise ValueError(f"Settings section '{name}' must be a mapping.")
+    known = {f.name: f for f in fields(cls)}
+    unknown = set(raw) - set(known)
+    if unknown:
+        raise ValueError(f"Unknown key(s) in '{name}': {', '.join(sorted(map(str, unknown)))}")
+
+    values = {}
+    for key, value in raw.items():
+        expected = known[key].type
+        if value is None and known[key].default is None:
+            values[key] = value
+            continue
+        if expected is bool and not isinstance(value, bool):
+            raise ValueError(f"'{name}.{key}' must be true or false, got {value!r}.")
+        if expected is int and (isinstance(value, bool) or not isinstance(value, int)):
+            raise ValueError(f"'{name}.{key}' must be an integer, got {value!r}.")
+        if expected is float:
+            if isinstance(value, bool) or not isinstance(value, (int, float)):
+                raise ValueError(f"'{name}.{key}' must be a number, got {value!r}.")
+            value = float(value)
+        if expected is str and not isinstance(value, str):
+            raise ValueError(f"'{name}.{key}' must be a string, got {value!r}.")
+        if expected == tuple[str, ...]:
+            if not isinstance(value, list) or not all(isinstance(v, str) for v in value):
+                raise ValueError(f"'{name}.{key}' must be a list of strings, got {value!r}.")
+            value = tuple(value)
+        values[key] = value
+    return values
+
+
+@dataclass(frozen=True, slots=True)
+class EngagementMetrics:
+    views: bool = True
+    likes: bool = True
+    comments: bool = True
+    shares: bool = False
+
+
+@dataclass(frozen=True, slots=True)
+class TimePeriod:
+    start_date: str = None
+    end_date: str = None
+
+    def __post_init__(self):
+        start = pd.Timestamp(self.start_date) if self.start_date else None
+        end = pd.Timestamp(self.end_date) if self.end_date else None
+        if start is not None and end is not None and start > end:
+            raise ValueError(f"time_period.start_date {self.start_date} is after end_date {self.end_date}.")
+
+
+@dataclass(frozen=True, slots=True)
+class AnalysisSettings:
+    country_list: tuple[str, ...] = ()
+    engagement_metrics: EngagementMetrics = field(default_factory=EngagementMetrics)
+    time_period: TimePeriod = field(default_factory=TimePeriod)
+    trending_category_threshold: int = 0
+    preview_mode: bool = False
+    preview_fraction: float = 0.1
+
+    def __post_init__(self):
+        if self.trending_category_threshold < 0:
+            raise ValueError("'trending_category_threshold' must not be negative.")
+        if not 0 < self.preview_fraction <= 1:
+            raise ValueError("'preview_fraction' must be in (0, 1].")
+
+
+@dataclass(frozen=True, slots=True)
+class VisualizationSettings:
+    plot_style: str = "default"
+    save_plots: bool = True
+    plot_format: str = "png"
+    plot_dpi: int = 100
+    show_plots: bool = True
+
+    def __post_init__(self):
+        if self.plot_dpi <= 0:
+            raise ValueError("'plot_dpi' must be positive.")
+
+
+@dataclass(frozen=True, slots=True)
+class OutputSettings:
+    save_reports: bool = True
+    report_format: str = "pdf"
+    tables_format: str = "csv"
+
+
+@dataclass(frozen=True, slots=True)
+class PreprocessingSettings:
+    drop_missing_values: bool = True
+    remove_duplicates: bool = True
+    convert_to_lowercase: bool = False
+    columns_to_clean: tuple[str, ...] = ()
+    compact_video_ids: bool = False
+    memory_budget_mb: int = 0
+
+    def __post_init__(self):
+        if self.memory_budget_mb < 0:
+            raise ValueError("'memory_budget_mb' must not be negative.")
+
+
+@dataclass(frozen=True, slots=True)
+class TestSettings:
+    __test__ = False  # not a pytest test class
+
+    run_unit_tests: bool = True
+    coverage_threshold: int = 0
+
+
+@dataclass(frozen=True, slots=True)
+class Settings:
+    """
+    Validated, immutable view of config/settings.yaml.
+
+    Attributes:
+        analysis (AnalysisSettings): ``analysis_settings`` section.
+        visualization (VisualizationSettings): ``visualization_settings`` section.
+        output (OutputSettings): ``output_settings`` section.
+        preprocessing (PreprocessingSettings): ``preprocessing_settings`` section.
+        test (TestSettings): ``test_settings`` section.
+    """
+    analysis: AnalysisSettings = field(default_factory=AnalysisSettings)
+    visualization: VisualizationSettings = field(default_factory=VisualizationSettings)
+    output: OutputSettings = field(default_factory=OutputSettings)
+    preprocessing: PreprocessingSettings = field(default_factory=PreprocessingSettings)
+    test: TestSettings = field(default_factory=TestSettings)
+
+    @classmethod
+    def from_dict(cls, raw: dict) -> "Settings":
+        """
+        Validate a parsed settings.yaml mapping and build the typed settings.
+
+        Args:
+            raw: Parsed YAML content.
+
+        Returns:
+            Settings: The typed settings. Missing keys take their defaults.
+
+        Raises:
+            ValueError: On unknown keys, wrongly typed values or invalid values.
+        """
+        raw = {} if raw is None else raw
+        sections = {
+            "analysis_settings": ("analysis", AnalysisSettings),
+            "visualization_settings": ("visualization", VisualizationSettings),
+            "output_settings": ("output", OutputSettings),
+            "preprocessing_settings": ("preprocessing", PreprocessingSettings),
+            "test_settings": ("test", TestSettings),
+        }
+        unknown = set(raw) - set(sections)
+        if unknown:
+            raise ValueError(f"Unknown settings section(s): {', '.join(sorted(map(str, unknown)))}")
+
+        values = {}
+        for section, (attribute, cls_) in sections.items():
+            section_raw = dict(raw.get(section) or {})
+            if cls_ is AnalysisSettings:
+                metrics = section_raw.pop("engagement_metrics", None)
+                period = section_raw.pop("time_period", None)
+                kwargs = _section(cls_, section_raw, section)
+                kwargs["engagement_metrics"] = EngagementMetrics(
+                    **_section(EngagementMetrics, metrics, f"{section}.engagement_metrics"))
+                kwargs["time_period"] = TimePeriod(**_section(TimePeriod, period, f"{section}.time_period"))
+            else:
+                kwargs = _section(cls_, section_raw, section)
+            values[attribute] = cls_(**kwargs)
+        return cls(**values)
+
+    def to_dict(self) -> dict:
+        """
+        Return the settings as plain Python objects (tuples become lists).
+        """
+        names = {"analysis": "analysis_settings", "visualization": "visualization_settings",
+                 "output": "output_settings", "preprocessing": "preprocessing_settings",
+                 "test": "test_settings"}
+
+        def plain(value):
+            if isinstance(value, dict):
+                return {k: plain(v) for k, v in value.items()}
+            if isinstance(value, tuple):
+                return [plain(v) for v in value]
+            return value
+
+        return {names[k]: plain(v) for k, v in asdict(self).items()}
+
+
+def get_settings() -> Settings:
+    """
+    Return the typed settings from config/settings.yaml.
+
+    The file is parsed and validated once and re-read only when its
+    modification time or size changes, so this is cheap to call in loops.
+    The result is immutable and can be passed to worker processes.
+
+    Returns:
+        Settings: The validated settings.
+
+    Raises:
+        FileNotFoundError: If settings.yaml doesn't exist.
+        ValueError: If settings.yaml is malformed or invalid.
     """
-    return load_yaml("config/settings.yaml")
+    return _load_cached("config/settings.yaml", Settings.from_dict)
 
 
 
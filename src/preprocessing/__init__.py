@@ -6,11 +6,64 @@ from .data_utils import (
     convert_to_datetime,
     explore_data,
     unique_values_with_counts,
-    save_table
+    save_table,
+    load_table
 )
 
 from .merge_datasets import dataset_merger
 
+from .columnar_store import (
+    ColumnarStore,
+    write_columnar_store,
+    open_columnar_store,
+    accepts_columnar_store
+)
+
+from .partitioned_store import (
+    write_partitioned_dataset,
+    read_partitioned_dataset,
+    list_partitions
+)
+
+from .export_queue import ExportQueue, ExportError, savefig_options
+
+from .time_features import (
+    WEEKDAY_NAMES,
+    derive_time_features,
+    add_time_features,
+    time_features_cache_path
+)
+
+from .shared_frame import (
+    SharedFrame,
+    share_frame,
+    attach_shared_frame,
+    map_shared,
+    benchmark_handoff
+)
+
+from .video_ids import (
+    encode_video_ids,
+    decode_video_ids,
+    compact_video_ids,
+    restore_video_ids
+)
+
+from .memory_planner import (
+    MemoryPlan,
+    plan_run,
+    run_planned,
+    iter_plan_frames,
+    estimate_file_footprint,
+    parquet_footprint,
+    memory_budget_bytes,
+    track_stage
+)
+
+from .profiler import DatasetProfile, profile_dataset, load_profile
+
+from .pipeline import preprocess_dataset, load_country_dataset, clean_text_columns
+
 
 __all__ = [
     "load_data",
@@ -21,4 +74,42 @@ __all__ = [
     "convert_to_datetime",
     "explore_data",
     "unique_values_with_counts",
-    "save_table"]
\ No newline at end of file
+    "save_table",
+    "load_table",
+    "ColumnarStore",
+    "write_columnar_store",
+    "open_columnar_store",
+    "accepts_columnar_store",
+    "write_partitioned_dataset",
+    "read_partitioned_dataset",
+    "list_partitions",
+    "ExportQueue",
+    "ExportError",
+    "savefig_options",
+    "preprocess_dataset",
+    "load_country_dataset",
+    "clean_text_columns",
+    "WEEKDAY_NAMES",
+    "derive_time_features",
+    "add_time_features",
+    "time_features_cache_path",
+    "SharedFrame",
+    "share_frame",
+    "attach_shared_frame",
+    "map_shared",
+    "benchmark_handoff",
+    "encode_video_ids",
+    "decode_video_ids",
+    "compact_video_ids",
+    "restore_video_ids",
+    "MemoryPlan",
+    "plan_run",
+    "run_planned",
+    "iter_plan_frames",
+    "estimate_file_footprint",
+    "parquet_footprint",
+    "memory_budget_bytes",
+    "track_stage",
+    "DatasetProfile",
+    "profile_dataset",
+    "load_profile"]
\ No newline at end of file
@@ -0,0 +1,403 @@
+import functools
+import inspect
+import json
+import os
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+SCHEMA_FILE = "_schema.json"
+STORE_VERSION = 2
+
+
+def _column_files(name):
+    """
+    Return the file names used for a column (safe for any column name).
+    """
+    stem = "".join(ch if ch.isalnum() or ch in "-_" else "_" for ch in str(name))
+    return {part: f"{stem}.{part}.npy" if part != "values" else f"{stem}.npy"
+            for part in ("values", "mask", "codes", "dictionary", "offsets")}
+
+
+def _encode_strings(values):
+    """
+    Concatenated UTF-8 bytes of ``values`` and the int64 offsets delimiting each string.
+    """
+    encoded = [value.encode("utf-8") for value in values]
+    offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+    np.cumsum([len(b) for b in encoded], out=offsets[1:])
+    return np.frombuffer(b"".join(encoded), dtype=np.uint8), offsets
+
+
+def _decode_strings(data, offsets):
+    """
+    Object array of the strings written by ``_encode_strings``.
+    """
+    buffer = np.asarray(data).tobytes()
+    bounds = np.asarray(offsets).tolist()
+    strings = np.empty(len(bounds) - 1, dtype=object)
+    strings[:] = [buffer[a:b].decode("utf-8") for a, b in zip(bounds[:-1], bounds[1:])]
+    return strings
+
+
+def _is_text(values):
+    return pd.api.types.infer_dtype(values, skipna=True) in ("string", "empty")
+
+
+def encode_columns(df):
+    """
+    Encode every column of a DataFrame into plain NumPy arrays.
+
+    Encodings (the ``kind`` of the schema entry):
+
+    - ``values``: NumPy numeric and boolean columns, as-is.
+    - ``datetime``: datetimes as UTC datetime64[ns], with their time zone.
+    - ``timedelta``: timedeltas as int64 nanoseconds.
+    - ``masked``: nullable extension columns (Int64, Float64, boolean) as
+      NumPy values plus a boolean mask of the missing values.
+    - ``dictionary``: text columns (object or string dtype) as int32 codes
+      (-1 for missing values) plus a dictionary of distinct strings.
+    - ``categorical``: Categoricals with text categories as their codes plus
+      the categories, keeping their order and ``ordered`` flag.
+
+    Dictionaries are stored as concatenated UTF-8 bytes plus int64 offsets,
+    so a long string costs its own length only.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        Data to encode.
+
+    Yields
+    ------
+    tuple of (dict, dict)
+        The schema entry of each column and its arrays keyed by file name.
+
+    Raises
+    ------
+    TypeError
+        For columns the store cannot round-trip, e.g. object columns mixing
+        strings and other values, or periods and intervals.
+    """
+    for name in df.columns:
+        column = df[name]
+        files = _column_files(name)
+        entry = {"name": str(name), "dtype": str(column.dtype)}
+        dtype = column.dtype
+
+        if pd.api.types.is_datetime64_any_dtype(dtype):
+            tz = getattr(column.dt, "tz", None)
+            values = column.dt.tz_convert("UTC").dt.tz_localize(None) if tz is not None else column
+            arrays = {files["values"]: values.to_numpy(dtype="datetime64[ns]")}
+            entry.update(kind="datetime", file=files["values"], tz=str(tz) if tz is not None else None)
+        elif pd.api.types.is_timedelta64_dtype(dtype):
+            arrays = {files["values"]: column.to_numpy(dtype="timedelta64[ns]").view(np.int64)}
+            entry.update(kind="timedelta", file=files["values"])
+        elif isinstance(dtype, np.dtype) and (pd.api.types.is_bool_dtype(dtype) or
+                                              pd.api.types.is_numeric_dtype(dtype)):
+            arrays = {files["values"]: column.to_numpy()}
+            entry.update(kind="values", file=files["values"])
+        elif isinstance(dtype, pd.api.extensions.ExtensionDtype) and hasattr(dtype, "numpy_dtype") and \
+                (pd.api.types.is_bool_dtype(dtype) or pd.api.types.is_numeric_dtype(dtype)):
+            arrays = {files["values"]: column.to_numpy(dtype=dtype.numpy_dtype, na_value=0),
+                      files["mask"]: column.isna().to_numpy()}
+            entry.update(kind="masked", file=files["values"], mask=files["mask"])
+        elif isinstance(dtype, pd.CategoricalDtype) and _is_text(dtype.categories):
+            data, offsets = _encode_strings(dtype.categories)
+            arrays = {files["codes"]: column.cat.codes.to_numpy().astype(np.int32),
+                      files["dictionary"]: data, files["offsets"]: offsets}
+            entry.update(kind="categorical", codes=files["codes"], dictionary=files["dictionary"],
+                         offsets=files["offsets"], ordered=bool(dtype.ordered))
+        elif (dtype == object or isinstance(dtype, pd.StringDtype)) and _is_text(column):
+            codes, uniques = pd.factorize(column)
+            data, offsets = _encode_strings(uniques)
+            arrays = {files["codes"]: codes.astype(np.int32), files["dictionary"]: data, files["offsets"]: offsets}
+            entry.update(kind="dictionary", codes=files["codes"], dictionary=files["dictionary"],
+                         offsets=files["offsets"])
+        else:
+            raise TypeError(f"Column '{name}' ({dtype}) cannot be stored without loss; "
+                            "convert it to text, numbers or datetimes first.")
+
+        yield entry, arrays
+
+
+def write_columnar_store(df, path):
+    """
+    Write a DataFrame as one NumPy ``.npy`` file per column.
+
+    Columns are encoded by ``encode_columns``: numeric, boolean, datetime
+    and timedelta columns are saved as-is, nullable columns with a mask and
+    text columns as int32 codes plus a UTF-8 dictionary. A ``_schema.json``
+    file records column order, dtypes and encodings.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        Cleaned dataset to store.
+    path : str or Path
+        Directory of the store (created if needed, e.g. ``data/store/US``).
+
+    Returns
+    -------
+    Path
+        The store directory.
+
+    Raises
+    ------
+    TypeError
+        If a column cannot be stored without loss (see ``encode_columns``).
+    """
+    path = Path(path)
+    path.mkdir(parents=True, exist_ok=True)
+    schema = {"version": STORE_VERSION, "n_rows": len(df), "columns": []}
+
+    for entry, arrays in encode_columns(df):
+        for filename, array in arrays.items():
+            np.save(path / filename, array)
+        schema["columns"].append(entry)
+
+    # Write the schema last and atomically: a store without it is incomplete
+    tmp = path / (SCHEMA_FILE + ".tmp")
+    tmp.write_text(json.dumps(schema, indent=2), encoding="utf-8")
+    os.replace(tmp, path / SCHEMA_FILE)
+    return path
+
+
+class ColumnarStore:
+    """
+    Read-only, memory-mapped view of a store written by ``write_columnar_store``.
+
+    Opening a store only reads its schema. Column files are memory-mapped on
+    first access, so only the pages a computation touches are read, and
+    processes reading the same store share the OS page cache.
+
+    Parameters
+    ----------
+    path : str or Path
+        Directory of the store.
+    """
+
+    def __init__(self, path):
+        self.path = Path(path)
+        schema_path = self.path / SCHEMA_FILE
+        if not schema_path.exists():
+            raise FileNotFoundError(f"No columnar store found at: {self.path}")
+        schema = json.loads(schema_path.read_text(encoding="utf-8"))
+        if schema.get("version") != STORE_VERSION:
+            raise ValueError(f"Columnar store at {self.path} has version {schema.get('version')}; "
+                             f"rewrite it with write_columnar_store (version {STORE_VERSION}).")
+        self.n_rows = schema["n_rows"]
+        self._schema = {entry["name"]: entry for entry in schema["columns"]}
+        self._cache = {}
+        self._dictionaries = {}
+        self._categoricals = {}
+
+    @property
+    def columns(self):
+        return pd.Index(list(self._schema))
+
+    def __len__(self):
+        return self.n_rows
+
+    def __contains__(self, name):
+        return name in self._schema
+
+    def _load(self, filename):
+        if filename not in self._cache:
+            self._cache[filename] = np.load(self.path / filename, mmap_mode="r")
+        return self._cache[filename]
+
+    def codes(self, name):
+        """
+        Return the memory-mapped int32 codes and the dictionary of an encoded column.
+
+        The dictionary (an object array of strings) is decoded once per store.
+        """
+        entry = self._schema[name]
+        if entry["kind"] not in ("dictionary", "categorical"):
+            raise ValueError(f"Column '{name}' is not dictionary-encoded.")
+        if name not in self._dictionaries:
+            self._dictionaries[name] = _decode_strings(self._load(entry["dictionary"]), self._load(entry["offsets"]))
+        return self._load(entry["codes"]), self._dictionaries[name]
+
+    def column(self, name, decode=True):
+        """
+        Return one column as a Series.
+
+        Parameters
+        ----------
+        name : str
+            Column name.
+        decode : bool, optional
+            For text columns, return strings with the column's dtype (default)
+            or, if False, a Categorical with sorted categories built on the
+            memory-mapped codes (no string is decoded). Categorical columns
+            are returned as Categoricals either way.
+
+        Returns
+        -------
+        pd.Series
+            Numeric, boolean, datetime and timedelta columns are zero-copy
+            views of the file.
+        """
+        if name not in self._schema:
+            raise KeyError(f"Column '{name}' not found in store.")
+        entry = self._schema[name]
+        kind = entry["kind"]
+
+        if kind == "categorical" or (kind == "dictionary" and not decode):
+            return pd.Series(self._categorical(name), name=name, copy=False)
+        if kind == "dictionary":
+            codes, categories = self.codes(name)
+            values = categories.take(codes, mode="clip") if len(categories) else np.empty(len(codes), dtype=object)
+            values[codes < 0] = np.nan
+            series = pd.Series(values, name=name, dtype=object)
+            return series if entry["dtype"] == "object" else series.astype(entry["dtype"])
+
+        # Plain ndarray view of the mapped buffer (no copy)
+        values = self._load(entry["file"]).view(np.ndarray)
+        if kind == "timedelta":
+            values = values.view("timedelta64[ns]")
+        series = pd.Series(values, name=name, copy=False)
+        if kind == "masked":
+            series = series.astype(entry["dtype"]).mask(self._load(entry["mask"]).view(np.ndarray))
+        elif kind == "datetime" and entry.get("tz"):
+            series = series.dt.tz_localize("UTC").dt.tz_convert(entry["tz"])
+        return series
+
+    def _categorical(self, name):
+        """
+        Categorical of a dictionary or categorical column, built once per store.
+
+        The dictionary of a text column is stored in order of appearance; its
+        categories are sorted here (remapping the codes when needed) so that
+        groupby and factorize order the labels as they would the decoded
+        strings. Categorical columns keep their stored categories.
+        """
+        if name not in self._categoricals:
+            codes, dictionary = self.codes(name)
+            entry = self._schema[name]
+            if entry["kind"] == "categorical":
+                self._categoricals[name] = pd.Categorical.from_codes(
+                    codes, pd.Index(dictionary, dtype=object), ordered=entry["ordered"])
+                return self._categoricals[name]
+            order = np.argsort(dictionary, kind="stable")
+            if np.array_equal(order, np.arange(len(order))):
+                sorted_codes = codes
+            else:
+                rank = np.empty(len(order), dtype=np.int32)
+                rank[order] = np.arange(len(order), dtype=np.int32)
+                sorted_codes = np.where(codes >= 0, rank.take(codes, mode="clip"), -1)
+            categories = pd.Index(dictionary[order], dtype=object)
+            self._categoricals[name] = pd.Categorical.from_codes(sorted_codes, categories)
+        return self._categoricals[name]
+
+    def __getitem__(self, key):
+        if isinstance(key, str):
+            return self.column(key)
+        return self.to_frame(list(key))
+
+    def to_frame(self, columns=None, decode=True):
+        """
+        Assemble a DataFrame from (a subset of) the stored columns.
+
+        Parameters
+        ----------
+        columns : list of str, optional
+            Columns to include (default: all).
+        decode : bool, optional
+            Decode dictionary columns to strings (default) or keep them Categorical.
+
+        Returns
+        -------
+        pd.DataFrame
+            A frame whose numeric columns are read-only memory-mapped views.
+        """
+        columns = list(self._schema) if columns is None else columns
+        return pd.DataFrame({name: self.column(name, decode=decode) for name in columns}, copy=False)
+
+
+def open_columnar_store(path):
+    """
+    Open a columnar store for reading (reads only the schema).
+
+    Parameters
+    ----------
+    path : str or Path
+        Directory of the store.
+
+    Returns
+    -------
+    ColumnarStore
+        The opened store.
+    """
+    return ColumnarStore(path)
+
+
+def _decode_store_categoricals(result, dtypes):
+    """
+    Turn the Categorical columns and index levels of ``result`` that have one
+    of the store's ``dtypes`` back into object strings.
+    """
+    def from_store(dtype):
+        return isinstance(dtype, pd.CategoricalDtype) and any(dtype == d for d in dtypes)
+
+    def decode_index(index):
+        if isinstance(index, pd.MultiIndex):
+            return index.set_levels([level.astype(object) if from_store(level.dtype) else level
+                                     for level in index.levels])
+        return index.astype(object) if from_store(index.dtype) else index
+
+    if not dtypes or not isinstance(result, (pd.DataFrame, pd.Series)):
+        return result
+    if isinstance(result, pd.DataFrame):
+        decoded = [i for i, dtype in enumerate(result.dtypes) if from_store(dtype)]
+        if decoded:
+            result = result.copy(deep=False)
+            for i in decoded:
+                result.isetitem(i, result.iloc[:, i].astype(object))
+        result.columns = decode_index(result.columns)
+    elif from_store(result.dtype):
+        result = result.astype(object)
+    return result.set_axis(decode_index(result.index))
+
+
+def accepts_columnar_store(func=None, *, columns=None, column_args=()):
+    """
+    Let a DataFrame-based function also take a ColumnarStore as first argument.
+
+    Only the columns the function reads are materialized: ``columns`` lists
+    them and ``column_args`` names the parameters that hold more column
+    names (e.g. ``category_column``); names missing from the store are
+    skipped, and every column is used when ``columns`` is None. Numeric
+    columns are memory-mapped views and dictionary-encoded strings are
+    Categoricals on the stored codes, so no string is decoded. Categorical
+    columns and index levels of the result that come from those strings are
+    returned as plain strings, as for a DataFrame input.
+
+    Usable bare (``@accepts_columnar_store``) or with arguments
+    (``@accepts_columnar_store(columns=["views", "likes"])``).
+    """
+    if func is None:
+        return functools.partial(accepts_columnar_store, columns=columns, column_args=column_args)
+    signature = inspect.signature(func)
+
+    @functools.wraps(func)
+    def wrapper(df, *args, **kwargs):
+        if not isinstance(df, ColumnarStore):
+            return func(df, *args, **kwargs)
+        names = None
+        if columns is not None:
+            bound = signature.bind(df, *args, **kwargs)
+            bound.apply_defaults()
+            wanted = set(columns)
+            for arg in column_args:
+                value = bound.arguments.get(arg)
+                wanted.update([value] if isinstance(value, str) else value or ())
+            names = [name for name in df.columns if name in wanted]
+        frame = df.to_frame(names, decode=False)
+        # Only text columns are turned into Categoricals; stored Categoricals stay as they are
+        dtypes = [frame[name].dtype for name in frame.columns if df._schema[name]["kind"] == "dictionary"]
+        return _decode_store_categoricals(func(frame, *args, **kwargs), dtypes)
+    return wrapper
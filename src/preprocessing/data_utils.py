@@ -1,37 +1,85 @@
+import os
+
 import numpy as np
 import pandas as pd
 
+from .columnar_store import SCHEMA_FILE, open_columnar_store
+from .memory_planner import iter_plan_frames, plan_run
+from .profiler import profile_dataset
+
 
-def load_data(file_path):
+def load_data(file_path, chunked=False, budget_bytes=None):
     """
     Load a CSV dataset into a pandas DataFrame.
 
     Parameters
     ----------
     file_path : str
-        The path to the CSV file to be loaded.
+        The path to the CSV file to be loaded, or the directory of a columnar
+        store written by ``write_columnar_store``.
+    chunked : bool, optional
+        Whether the caller can process the data chunk by chunk. When the file
+        does not fit the memory budget, an iterator of chunks is then returned
+        instead of a sample (default False).
+    budget_bytes : int, optional
+        Memory budget (default: ``memory_budget_bytes()``).
 
     Returns
     -------
-    pd.DataFrame
-        A DataFrame containing the loaded data.
+    pd.DataFrame or iterator of pd.DataFrame
+        A DataFrame containing the loaded data. Data loaded from a columnar
+        store is memory-mapped instead of read into RAM.
+
+    Notes
+    -----
+    CSV files are loaded as decided by ``plan_run``. When the estimated
+    footprint exceeds the memory budget, the file is read in chunks: with
+    ``chunked=True`` the chunks are returned as they are read; otherwise a
+    uniform sample that fits the budget is returned, with the kept share of
+    rows in ``df.attrs['sample_fraction']``.
     """
+    if isinstance(file_path, (str, os.PathLike)):
+        if os.path.isfile(os.path.join(file_path, SCHEMA_FILE)):
+            return open_columnar_store(file_path).to_frame()
+        if os.path.isfile(file_path):
+            plan = plan_run(file_path, budget_bytes=budget_bytes, streaming=chunked)
+            if plan.mode == "chunked":
+                return iter_plan_frames(plan)
+            if plan.mode == "sampled":
+                sample = next(iter_plan_frames(plan))
+                sample.attrs["sample_fraction"] = plan.sample_fraction
+                return sample
     return pd.read_csv(file_path)
 
 
-def explore_data(df):
+def explore_data(df, sample=None):
     """
     Display basic information about the DataFrame for exploration.
 
+    Prints the shape and the per-column profile from ``profile_dataset``
+    (dtypes, missing values, distinct counts, min/max, quantiles and string
+    lengths), which takes one streaming pass instead of
+    ``df.describe(include='all')``.
+
     Parameters
     ----------
     df : pd.DataFrame
         The DataFrame to explore.
+    sample : float, optional
+        Profile only this share of the rows, in (0, 1].
+
+    Returns
+    -------
+    DatasetProfile
+        The profile, which can be saved and compared with later runs.
     """
+    profile = profile_dataset(df, sample=sample)
     print("Shape:", df.shape)
-    print("\nData Types:\n", df.dtypes)
-    print("\nMissing Values:\n", df.isnull().sum())
-    print("\nSummary Statistics:\n", df.describe(include='all'))
+    if sample is not None:
+        print(f"Profiled rows: {profile.n_profiled} (sample of {sample:g})")
+    with pd.option_context("display.max_columns", None, "display.width", None):
+        print("\nProfile:\n", profile.table)
+    return profile
 
 
 def unique_values_with_counts(df, column):
@@ -171,22 +219,114 @@ def convert_to_datetime(df, date_col, date_format='%y.%d.%m'):
     return df
 
 
-def save_table(df, filename: str, format: str = "csv"):
+# File extension written by save_table for each supported format
+TABLE_EXTENSIONS = {
+    "csv": ".csv",
+    "csv.gz": ".csv.gz",
+    "csv.zst": ".csv.zst",
+    "parquet": ".parquet",
+    "feather": ".feather",
+    "excel": ".xlsx",
+    "html": ".html",
+}
+
+
+def resolve_table_format(format=None):
+    """
+    Return the table format to use, defaulting to ``output_settings.tables_format``.
+
+    Args:
+        format (str, optional): Explicit format. If None, the value from
+            settings.yaml is used ("csv" if the setting is missing).
+
+    Returns:
+        str: A lowercase key of ``TABLE_EXTENSIONS``.
+
+    Raises:
+        ValueError: If the format is not supported.
+    """
+    if format is None:
+        from ..config_loader import get_settings
+
+        format = get_settings().output.tables_format
+    format = format.lower()
+    if format not in TABLE_EXTENSIONS:
+        raise ValueError(f"Unsupported format '{format}'. Choose from: {', '.join(TABLE_EXTENSIONS)}.")
+    return format
+
+
+def save_table(df, filename: str, format: str = None, queue=None):
     """
     Save a DataFrame table to disk.
 
+    Parquet and Feather keep column dtypes (datetimes, categoricals, nullable
+    integers) across a ``load_table`` round-trip; the CSV variants do not.
+    "csv.zst" requires the optional ``zstandard`` package.
+
     Args:
         df (pd.DataFrame): Table to save.
         filename (str): File path without extension.
-        format (str): One of ["csv", "excel", "html"].
+        format (str, optional): One of ["csv", "csv.gz", "csv.zst", "parquet",
+            "feather", "excel", "html"]. Defaults to ``output_settings.tables_format``.
+        queue (ExportQueue, optional): If given, the table is written in the
+            background; call ``queue.wait()`` to collect errors.
+
+    Returns:
+        str: Path of the written file (a Future resolving to it when queued).
     """
-    format = format.lower()
+    if queue is not None:
+        return queue.submit_table(df, filename, format=format)
+    format = resolve_table_format(format)
+
+    path = f"{filename}{TABLE_EXTENSIONS[format]}"
     if format == "csv":
-        df.to_csv(f"{filename}.csv", index=False)
+        df.to_csv(path, index=False)
+    elif format == "csv.gz":
+        df.to_csv(path, index=False, compression="gzip")
+    elif format == "csv.zst":
+        df.to_csv(path, index=False, compression="zstd")
+    elif format == "parquet":
+        df.to_parquet(path, index=False)
+    elif format == "feather":
+        # Feather stores no index, and requires a default one
+        df.reset_index(drop=True).to_feather(path)
     elif format == "excel":
-        df.to_excel(f"{filename}.xlsx", index=False)
+        df.to_excel(path, index=False)
     elif format == "html":
-        df.to_html(f"{filename}.html", index=False)
-    else:
-        raise ValueError("Unsupported format. Choose from 'csv', 'excel', or 'html'.")
+        df.to_html(path, index=False)
+    return path
 
+
+def load_table(filename: str, format: str = None):
+    """
+    Load a table written by ``save_table``.
+
+    Args:
+        filename (str): Path with a known extension (e.g. "summary.parquet"),
+            or without extension, in which case ``format`` picks it.
+        format (str, optional): Format to read when ``filename`` has no known
+            extension. Defaults to ``output_settings.tables_format``.
+
+    Returns:
+        pd.DataFrame: The loaded table.
+    """
+    filename = str(filename)
+    # Longest extension first, so ".csv.gz" wins over ".csv"
+    for known, extension in sorted(TABLE_EXTENSIONS.items(), key=lambda item: -len(item[1])):
+        if filename.endswith(extension):
+            format, path = known, filename
+            break
+    else:
+        format = resolve_table_format(format)
+        path = f"{filename}{TABLE_EXTENSIONS[format]}"
+
+    if format in ("csv", "csv.gz", "csv.zst"):
+        compression = {"csv": None, "csv.gz": "gzip", "csv.zst": "zstd"}[format]
+        return pd.read_csv(path, compression=compression)
+    if format == "parquet":
+        return pd.read_parquet(path)
+    if format == "feather":
+        return pd.read_feather(path)
+    if format == "excel":
+        return pd.read_excel(path)
+    raise ValueError(f"Loading '{format}' tables is not supported.")
@@ -0,0 +1,230 @@
+import asyncio
+import io
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from .data_utils import TABLE_EXTENSIONS, resolve_table_format, save_table
+
+
+class ExportError(Exception):
+    """
+    Raised when one or more queued exports failed.
+
+    Attributes
+    ----------
+    failures : dict
+        Maps each failed output path to the exception raised while writing it.
+    """
+
+    def __init__(self, failures):
+        self.failures = failures
+        details = "\n".join(f"- {path}: {error!r}" for path, error in failures.items())
+        super().__init__(f"{len(failures)} export(s) failed:\n{details}")
+
+
+def savefig_options(filepath, **overrides):
+    """
+    Return the output path and ``savefig`` arguments honouring ``visualization_settings``.
+
+    Parameters
+    ----------
+    filepath : str or Path
+        Destination path. Without a suffix, the format is appended.
+    **overrides
+        Explicit ``savefig`` arguments; they win over the settings.
+
+    Returns
+    -------
+    tuple of (str, dict)
+        The final path and keyword arguments with ``dpi`` (``plot_dpi``) and
+        ``format`` (the path suffix, else ``plot_format``).
+    """
+    from ..config_loader import get_settings
+
+    visualization = get_settings().visualization
+    path = Path(filepath)
+    format = overrides.pop("format", None) or path.suffix.lstrip(".") or visualization.plot_format
+    if not path.suffix:
+        path = path.with_name(f"{path.name}.{format}")
+    return str(path), {"dpi": visualization.plot_dpi, "format": format, **overrides}
+
+
+def _atomic_write_bytes(path, data):
+    """
+    Write bytes next to ``path`` and rename into place, so readers never see a partial file.
+    """
+    tmp = f"{path}.tmp"
+    with open(tmp, "wb") as file:
+        file.write(data)
+    os.replace(tmp, path)
+
+
+class ExportQueue:
+    """
+    Concurrent, bounded writer for tables and figures.
+
+    Tables are written by ``save_table`` and figures are rendered into an
+    in-memory buffer on the calling thread (matplotlib is not thread-safe), then
+    written by a pool of worker threads. Every file is written to a temporary
+    name and renamed into place. Producers block while the queued payloads
+    exceed ``max_in_flight_bytes``. Failures are collected per file and raised
+    together as an ``ExportError`` by ``wait()``.
+
+    Parameters
+    ----------
+    max_workers : int, optional
+        Number of writer threads (default 4).
+    max_in_flight_bytes : int, optional
+        Upper bound on the size of queued, not yet written payloads (default 256 MB).
+        A single payload larger than the bound is still accepted once the queue is empty.
+
+    Examples
+    --------
+    >>> with ExportQueue() as exports:
+    ...     exports.submit_table(summary, "outputs/tables/US/summary")
+    ...     exports.submit_figure(fig, "outputs/plots/US/summary.png")
+    """
+
+    def __init__(self, max_workers=4, max_in_flight_bytes=256 * 1024 ** 2):
+        self.max_in_flight_bytes = max_in_flight_bytes
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="export")
+        self._budget = threading.Condition()
+        self._in_flight = 0
+        self._futures = {}
+
+    def _reserve(self, size):
+        with self._budget:
+            while self._in_flight and self._in_flight + size > self.max_in_flight_bytes:
+                self._budget.wait()
+            self._in_flight += size
+
+    def _release(self, size):
+        with self._budget:
+            self._in_flight -= size
+            self._budget.notify_all()
+
+    def _submit(self, path, size, write):
+        self._reserve(size)
+
+        def task():
+            try:
+                write()
+            finally:
+                self._release(size)
+            return path
+
+        future = self._executor.submit(task)
+        self._futures[future] = path
+        return future
+
+    def submit_table(self, df, filename, format=None):
+        """
+        Queue a table for writing with ``save_table``.
+
+        Parameters
+        ----------
+        df : pd.DataFrame
+            Table to save. It must not be modified until the write completes.
+        filename : str
+            File path without extension.
+        format : str, optional
+            Any format supported by ``save_table`` (default: ``output_settings.tables_format``).
+
+        Returns
+        -------
+        concurrent.futures.Future
+            Resolves to the final file path.
+        """
+        format = resolve_table_format(format)
+        final = f"{filename}{TABLE_EXTENSIONS[format]}"
+        tmp_stem = f"{filename}.tmp"
+        size = int(df.memory_usage(index=True, deep=False).sum())
+
+        def write():
+            save_table(df, tmp_stem, format=format)
+            os.replace(f"{tmp_stem}{TABLE_EXTENSIONS[format]}", final)
+
+        return self._submit(final, size, write)
+
+    def submit_figure(self, fig, filepath, **savefig_kwargs):
+        """
+        Render a figure now and queue its bytes for writing.
+
+        Parameters
+        ----------
+        fig : matplotlib.figure.Figure
+            Figure to export; it can be closed as soon as this returns.
+        filepath : str
+            Destination path. Without a suffix, the format from ``savefig_kwargs``
+            (or ``visualization_settings.plot_format``) is appended.
+        **savefig_kwargs
+            Passed to ``fig.savefig`` (e.g. ``dpi``, ``format``); ``dpi`` defaults
+            to ``visualization_settings.plot_dpi``.
+
+        Returns
+        -------
+        concurrent.futures.Future
+            Resolves to the final file path.
+        """
+        path, options = savefig_options(filepath, **savefig_kwargs)
+        buffer = io.BytesIO()
+        fig.savefig(buffer, **options)
+        data = buffer.getvalue()
+
+        return self._submit(path, len(data), lambda: _atomic_write_bytes(path, data))
+
+    def wait(self):
+        """
+        Block until every queued export has finished.
+
+        Returns
+        -------
+        list of str
+            Paths written successfully, in submission order.
+
+        Raises
+        ------
+        ExportError
+            If any export failed; the other exports are still completed.
+        """
+        written, failures = [], {}
+        for future, path in list(self._futures.items()):
+            error = future.exception()
+            if error is None:
+                written.append(path)
+            else:
+                failures[path] = error
+        self._futures.clear()
+        if failures:
+            raise ExportError(failures)
+        return written
+
+    async def wait_async(self):
+        """
+        Await every queued export from an asyncio pipeline (see ``wait``).
+        """
+        pending = [asyncio.wrap_future(future) for future in self._futures]
+        await asyncio.gather(*pending, return_exceptions=True)
+        return self.wait()
+
+    def close(self):
+        """
+        Wait for pending exports and shut the worker threads down.
+        """
+        try:
+            return self.wait()
+        finally:
+            self._executor.shutdown(wait=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        else:
+            # Don't mask the original error with export failures
+            self._executor.shutdown(wait=True)
+        return False
@@ -0,0 +1,446 @@
+import contextlib
+import io
+import itertools
+import logging
+import os
+import sys
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+from ..config_loader import get_settings
+from .partitioned_store import list_partitions
+
+logger = logging.getLogger(__name__)
+
+MODES = ("in_memory", "partitioned", "chunked", "sampled")
+
+# Working copies made while cleaning and merging a loaded frame (filter masks, merge output)
+DEFAULT_OVERHEAD = 2.5
+# Share of the available memory used when no budget is configured
+DEFAULT_BUDGET_FRACTION = 0.5
+# Bytes of a file parsed to measure the in-memory size per byte on disk
+_SAMPLE_BYTES = 1 << 20
+# Assumed in-memory bytes per byte of a compressed CSV, which cannot be sampled by byte offset
+_COMPRESSED_CSV_EXPANSION = 10.0
+# Extra bytes of a Python str object (header plus array pointer) over its Parquet payload
+_PY_STR_OVERHEAD = 57
+
+
+def _read_int(path):
+    try:
+        with open(path) as f:
+            value = f.read().strip()
+    except OSError:
+        return None
+    return int(value) if value.isdigit() else None
+
+
+def available_memory_bytes():
+    """
+    Memory this process can still use: MemAvailable, capped by the cgroup limit.
+    """
+    available = None
+    try:
+        with open("/proc/meminfo") as f:
+            for line in f:
+                if line.startswith("MemAvailable:"):
+                    available = int(line.split()[1]) * 1024
+                    break
+    except OSError:
+        pass
+    if available is None and hasattr(os, "sysconf"):
+        try:
+            available = os.sysconf("SC_AVPHYS_PAGES") * os.sysconf("SC_PAGE_SIZE")
+        except (ValueError, OSError):
+            available = None
+
+    limit = _read_int("/sys/fs/cgroup/memory.max") or _read_int("/sys/fs/cgroup/memory/memory.limit_in_bytes")
+    if limit is not None and limit < (1 << 60):
+        used = _read_int("/sys/fs/cgroup/memory.current") or _read_int("/sys/fs/cgroup/memory/memory.usage_in_bytes") or 0
+        headroom = max(limit - used, 0)
+        available = headroom if available is None else min(available, headroom)
+    return available
+
+
+def memory_budget_bytes(settings=None):
+    """
+    Memory budget of a run: ``preprocessing_settings.memory_budget_mb``, or half
+    of the available memory when it is 0.
+    """
+    settings = get_settings() if settings is None else settings
+    budget_mb = settings.preprocessing.memory_budget_mb
+    if budget_mb:
+        return budget_mb * 1024 * 1024
+    available = available_memory_bytes()
+    return int(available * DEFAULT_BUDGET_FRACTION) if available else None
+
+
+def current_rss_bytes():
+    """
+    Resident set size of this process (0 if the platform does not report it).
+    """
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError):
+        return 0
+
+
+def peak_rss_bytes():
+    """
+    Peak resident set size of this process since start or the last ``reset_peak_rss``.
+    """
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    if resource is None:
+        return 0
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and in kilobytes elsewhere
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def reset_peak_rss():
+    """
+    Reset the peak RSS counter (Linux only). Returns False where unsupported.
+    """
+    try:
+        with open("/proc/self/clear_refs", "w") as f:
+            f.write("5")
+        return True
+    except OSError:
+        return False
+
+
+@contextlib.contextmanager
+def track_stage(name, stats=None):
+    """
+    Log the duration and peak RSS of a stage.
+
+    The peak counter is reset on entry where the platform allows it, so the
+    logged peak belongs to this stage; elsewhere it is the process peak so far.
+
+    Parameters
+    ----------
+    name : str
+        Stage name used in the log line.
+    stats : list, optional
+        Receives a dict with 'stage', 'seconds', 'rss_bytes' and 'peak_rss_bytes'.
+
+    Yields
+    ------
+    dict
+        The stage record; set its 'skip' key to drop it (e.g. when a read
+        finds no more data).
+    """
+    per_stage = reset_peak_rss()
+    record = {"stage": name}
+    start = time.perf_counter()
+    try:
+        yield record
+    finally:
+        if not record.pop("skip", False):
+            record.update(seconds=time.perf_counter() - start, rss_bytes=current_rss_bytes(),
+                          peak_rss_bytes=peak_rss_bytes())
+            logger.info("stage %s: %.2fs, rss %.0f MB, %s peak rss %.0f MB", name, record["seconds"],
+                        record["rss_bytes"] / 2**20, "stage" if per_stage else "process",
+                        record["peak_rss_bytes"] / 2**20)
+            if stats is not None:
+                stats.append(record)
+
+
+def estimate_file_footprint(path, sample_bytes=_SAMPLE_BYTES):
+    """
+    Estimate the rows and in-memory size of a data file once loaded with pandas.
+
+    CSV files are measured by parsing their first ``sample_bytes`` and
+    scaling by the file size; Parquet files by loading their first row group
+    and scaling by the row count in the metadata. Other files are assumed to
+    grow ten-fold, as are compressed CSVs (whose row count is derived from a
+    sample of rows).
+
+    Parameters
+    ----------
+    path : str or Path
+        CSV (optionally compressed), Parquet or JSON file.
+    sample_bytes : int, optional
+        Bytes of a CSV parsed for the estimate (default 1 MB).
+
+    Returns
+    -------
+    dict
+        'path', 'file_bytes', 'rows' and 'memory_bytes' (estimates).
+    """
+    path = Path(path)
+    size = path.stat().st_size
+    name = path.name.lower()
+
+    if name.endswith(".parquet"):
+        import pyarrow.parquet as pq
+        parquet = pq.ParquetFile(path)
+        rows = parquet.metadata.num_rows
+        if rows == 0 or parquet.num_row_groups == 0:
+            return {"path": path, "file_bytes": size, "rows": rows, "memory_bytes": 0}
+        first = parquet.read_row_group(0).to_pandas()
+        per_row = first.memory_usage(deep=True).sum() / max(len(first), 1)
+        return {"path": path, "file_bytes": size, "rows": rows, "memory_bytes": int(per_row * rows)}
+
+    if name.endswith(".csv"):
+        with open(path, "rb") as f:
+            head = f.read(sample_bytes)
+        complete = head if len(head) == size else head[:head.rfind(b"\n") + 1]
+        sample = pd.read_csv(io.BytesIO(complete)) if complete else pd.DataFrame()
+        scale = size / max(len(complete), 1)
+        return {"path": path, "file_bytes": size, "rows": int(len(sample) * scale),
+                "memory_bytes": int(sample.memory_usage(deep=True).sum() * scale)}
+
+    if ".csv." in name:
+        sample = pd.read_csv(path, nrows=1000)
+        per_row = sample.memory_usage(deep=True).sum() / max(len(sample), 1)
+        memory = size * _COMPRESSED_CSV_EXPANSION
+        return {"path": path, "file_bytes": size, "rows": int(memory / max(per_row, 1)), "memory_bytes": int(memory)}
+
+    return {"path": path, "file_bytes": size, "rows": None, "memory_bytes": size * 10}
+
+
+def parquet_footprint(path):
+    """
+    Estimate the rows and in-memory size of a Parquet file from its footer only.
+
+    Unlike ``estimate_file_footprint`` no row group is read: the size is the
+    uncompressed size of all row groups, plus the Python object overhead of
+    every value of a string column.
+
+    Parameters
+    ----------
+    path : str or Path
+        Parquet file, e.g. a partition of ``write_partitioned_dataset``.
+
+    Returns
+    -------
+    dict
+        'path', 'file_bytes', 'rows' and 'memory_bytes' (estimates).
+    """
+    import pyarrow.parquet as pq
+    path = Path(path)
+    metadata = pq.ParquetFile(path).metadata
+    memory = 0
+    for i in range(metadata.num_row_groups):
+        row_group = metadata.row_group(i)
+        memory += row_group.total_byte_size
+        for j in range(row_group.num_columns):
+            column = row_group.column(j)
+            if column.physical_type == "BYTE_ARRAY":
+                memory += column.num_values * _PY_STR_OVERHEAD
+    return {"path": path, "file_bytes": path.stat().st_size, "rows": metadata.num_rows, "memory_bytes": memory}
+
+
+@dataclass(frozen=True, slots=True)
+class MemoryPlan:
+    """
+    Execution mode chosen for a run by ``plan_run``.
+
+    Attributes:
+        mode (str): 'in_memory', 'partitioned', 'chunked' or 'sampled'.
+        paths (tuple): Input files.
+        estimated_bytes (int): Estimated peak memory of loading everything
+            (footprint times the overhead factor).
+        budget_bytes (int or None): Memory budget (None if unknown).
+        chunk_rows (int or None): Rows per chunk read in 'chunked' and 'sampled' mode.
+        sample_fraction (float or None): Share of rows kept in 'sampled' mode.
+        partitioned_root (Path or None): Partitioned dataset read in 'partitioned' mode.
+        reason (str): Why this mode was chosen.
+        files (tuple): ``estimate_file_footprint`` result of every input.
+    """
+    mode: str
+    paths: tuple
+    estimated_bytes: int
+    budget_bytes: int = None
+    chunk_rows: int = None
+    sample_fraction: float = None
+    partitioned_root: Path = None
+    reason: str = ""
+    files: tuple = field(default=(), repr=False)
+
+
+def plan_run(paths, budget_bytes=None, partitioned_root=None, streaming=True, overhead=DEFAULT_OVERHEAD,
+             settings=None):
+    """
+    Choose how to execute a run from the estimated footprint of its inputs.
+
+    In order of preference:
+
+    - 'in_memory': everything fits the budget, load it as usual.
+    - 'partitioned': ``partitioned_root`` holds a partitioned copy of the data
+      (``write_partitioned_dataset``) whose largest partition fits; process
+      one (country, month) partition at a time. Partitions are sized from
+      their Parquet footers (``parquet_footprint``), without reading data.
+    - 'chunked': the analysis can combine partial results (``streaming``);
+      read the files in chunks of ``chunk_rows`` rows.
+    - 'sampled': otherwise, keep a uniform ``sample_fraction`` of the rows so
+      the sample fits.
+
+    The decision is logged at INFO level (WARNING when the data does not fit).
+
+    Parameters
+    ----------
+    paths : str, Path or list
+        Input files, e.g. the ``*videos.csv`` files of all countries.
+    budget_bytes : int, optional
+        Memory budget (default: ``memory_budget_bytes(settings)``).
+    partitioned_root : str or Path, optional
+        Root of a partitioned copy of the same data, e.g. ``paths.yaml``'s
+        ``partitioned_data_directory``.
+    streaming : bool, optional
+        Whether the analysis can run chunk by chunk and combine the results.
+    overhead : float, optional
+        Peak memory as a multiple of the loaded size (default 2.5).
+    settings : Settings, optional
+        Typed settings used for the default budget.
+
+    Returns
+    -------
+    MemoryPlan
+        The chosen plan.
+    """
+    paths = tuple(Path(p) for p in ([paths] if isinstance(paths, (str, os.PathLike)) else paths))
+    files = tuple(estimate_file_footprint(p) for p in paths)
+    footprint = sum(f["memory_bytes"] for f in files)
+    rows = sum(f["rows"] or 0 for f in files)
+    estimated = int(footprint * overhead)
+    budget = memory_budget_bytes(settings) if budget_bytes is None else budget_bytes
+
+    plan = dict(paths=paths, estimated_bytes=estimated, budget_bytes=budget, files=files)
+    if budget is None or estimated <= budget:
+        plan.update(mode="in_memory", reason="estimated footprint fits the budget" if budget else "budget unknown")
+    else:
+        partitions = list_partitions(partitioned_root) if partitioned_root is not None else pd.DataFrame()
+        largest = max((parquet_footprint(p)["memory_bytes"] for p in partitions.get("path", [])), default=None)
+        per_row = footprint / max(rows, 1)
+        if largest is not None and largest * overhead <= budget:
+            plan.update(mode="partitioned", partitioned_root=Path(partitioned_root),
+                        reason=f"largest of {len(partitions)} partitions fits the budget")
+        else:
+            chunk_rows = max(int(budget / (per_row * overhead)), 1)
+            if streaming:
+                plan.update(mode="chunked", chunk_rows=chunk_rows,
+                            reason="footprint exceeds the budget; analysis combines chunks")
+            else:
+                plan.update(mode="sampled", chunk_rows=chunk_rows, sample_fraction=budget / estimated,
+                            reason="footprint exceeds the budget; analysis needs all rows at once")
+
+    plan = MemoryPlan(**plan)
+    level = logging.INFO if plan.mode == "in_memory" else logging.WARNING
+    logger.log(level, "memory plan: %s (estimated %.0f MB for %d files, budget %s): %s", plan.mode,
+               estimated / 2**20, len(paths), "unknown" if budget is None else f"{budget / 2**20:.0f} MB",
+               plan.reason)
+    return plan
+
+
+def iter_plan_frames(plan, usecols=None, seed=0):
+    """
+    Yield the input data of a plan as DataFrames.
+
+    'in_memory' and 'sampled' plans yield one frame, 'chunked' plans one frame
+    per chunk and 'partitioned' plans one frame per partition (with a
+    'country' column from the partition path).
+
+    Parameters
+    ----------
+    plan : MemoryPlan
+        Plan from ``plan_run``.
+    usecols : list of str, optional
+        Columns to read (default: all).
+    seed : int, optional
+        Seed of the row sample in 'sampled' mode.
+    """
+    if plan.mode == "partitioned":
+        for partition in list_partitions(plan.partitioned_root).itertuples(index=False):
+            frame = pd.read_parquet(partition.path, columns=usecols)
+            frame.insert(0, "country", partition.country)
+            yield frame
+        return
+
+    def read(path, **kwargs):
+        if str(path).lower().endswith(".parquet"):
+            frame = pd.read_parquet(path, columns=usecols)
+            if "chunksize" not in kwargs:
+                return frame
+            size = kwargs["chunksize"]
+            return (frame.iloc[i:i + size] for i in range(0, len(frame), size))
+        return pd.read_csv(path, usecols=usecols, **kwargs)
+
+    if plan.mode == "in_memory":
+        frames = [read(path) for path in plan.paths]
+        yield frames[0] if len(frames) == 1 else pd.concat(frames, ignore_index=True)
+    elif plan.mode == "chunked":
+        for path in plan.paths:
+            yield from read(path, chunksize=plan.chunk_rows)
+    elif plan.mode == "sampled":
+        rng = np.random.default_rng(seed)
+        # Sample each chunk as it is read, so the full data is never held at once
+        parts = [chunk[rng.random(len(chunk)) < plan.sample_fraction]
+                 for path in plan.paths for chunk in read(path, chunksize=plan.chunk_rows)]
+        yield pd.concat(parts, ignore_index=True)
+    else:
+        raise ValueError(f"Unknown plan mode {plan.mode!r}; expected one of {MODES}.")
+
+
+def run_planned(plan, analysis, combine=None, usecols=None, stats=None):
+    """
+    Run an analysis on the data of a plan, tracking memory per stage.
+
+    Parameters
+    ----------
+    plan : MemoryPlan
+        Plan from ``plan_run``.
+    analysis : callable
+        Function of one DataFrame, e.g. ``summarize_engagement_by_category_df``
+        (for chunked or partitioned plans, one that returns combinable parts).
+    combine : callable, optional
+        Combines the list of per-frame results (default: ``pd.concat`` for
+        pandas results, the list itself otherwise). Unused in 'in_memory' and
+        'sampled' mode, which read a single frame.
+    usecols : list of str, optional
+        Columns to read.
+    stats : list, optional
+        Receives one ``track_stage`` record per stage.
+
+    Returns
+    -------
+    Any
+        The analysis result.
+    """
+    results = []
+    frames = iter_plan_frames(plan, usecols=usecols)
+    for i in itertools.count():
+        with track_stage(f"{plan.mode}[{i}] load", stats) as stage:
+            frame = next(frames, None)
+            stage["skip"] = frame is None
+        if frame is None:
+            break
+        with track_stage(f"{plan.mode}[{i}] analysis", stats):
+            results.append(analysis(frame))
+        del frame
+
+    if len(results) == 1 and plan.mode in ("in_memory", "sampled"):
+        return results[0]
+    if combine is not None:
+        with track_stage(f"{plan.mode} combine", stats):
+            return combine(results)
+    if results and isinstance(results[0], (pd.DataFrame, pd.Series)):
+        return pd.concat(results)
+    return results
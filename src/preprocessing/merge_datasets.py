@@ -3,19 +3,35 @@ import os
 import json
 from pathlib import Path
 
-def dataset_merger(file_paths, how='inner', on=None):
+from .memory_planner import iter_plan_frames, plan_run
+
+def dataset_merger(file_paths, how='inner', on=None, chunked=False, budget_bytes=None):
     """
     Merge multiple datasets (CSV and structured JSON) into a single DataFrame.
 
+    When the first file is a CSV that does not fit the memory budget
+    (``plan_run``) and the merge is 'inner' or 'left', it is loaded as
+    ``load_data`` does: with ``chunked=True`` it is read in chunks and each
+    chunk is merged with the other files as it is read; otherwise a uniform
+    sample that fits the budget is merged, with the kept share of rows in
+    ``df.attrs['sample_fraction']``.
+
     Parameters:
     - file_paths (list): List of file paths (CSV or JSON).
     - how (str): Type of merge: 'inner', 'outer', 'left', or 'right'.
     - on (str or list): Column(s) to join on. If None, auto-detects common columns.
+    - chunked (bool): Whether the caller can process the merged data chunk by chunk.
+    - budget_bytes (int): Memory budget. If None, uses ``memory_budget_bytes()``.
 
     Returns:
-    - pd.DataFrame: Merged DataFrame.
+    - pd.DataFrame or iterator of pd.DataFrame: Merged DataFrame, or the merged
+      chunks of a first file read in chunks.
     """
     dataframes = []
+    plan = None
+    first = str(file_paths[0]) if len(file_paths) else ''
+    if len(file_paths) > 1 and how in ('inner', 'left') and first.endswith('.csv') and os.path.exists(first):
+        plan = plan_run(first, budget_bytes=budget_bytes, streaming=chunked)
 
     for file in file_paths:
         # Convert Path objects to strings for compatibility
@@ -25,7 +41,8 @@ def dataset_merger(file_paths, how='inner', on=None):
             raise FileNotFoundError(f"File not found: {file_str}")
         
         if file_str.endswith('.csv'):
-            df = pd.read_csv(file_str)
+            # A first file over the budget is read while merging, below
+            df = None if plan is not None and plan.mode != 'in_memory' and not dataframes else pd.read_csv(file_str)
 
         elif file_str.endswith('.json'):
             with open(file_str, 'r') as f:
@@ -47,10 +64,18 @@ def dataset_merger(file_paths, how='inner', on=None):
 
         dataframes.append(df)
 
-    # Start with the first DataFrame
-    merged_df = dataframes[0]
+    if dataframes[0] is None:
+        merged = (_merge_all(chunk, dataframes[1:], how, on) for chunk in iter_plan_frames(plan))
+        if plan.mode == 'chunked':
+            return merged
+        sample = next(merged)
+        sample.attrs['sample_fraction'] = plan.sample_fraction
+        return sample
+    return _merge_all(dataframes[0], dataframes[1:], how, on)
+
 
-    for df in dataframes[1:]:
+def _merge_all(merged_df, others, how, on):
+    for df in others:
         if on is None:
             common_cols = merged_df.columns.intersection(df.columns).tolist()
             if not common_cols:
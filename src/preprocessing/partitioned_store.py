@@ -0,0 +1,186 @@
+import os
+from pathlib import Path
+
+import pandas as pd
+
+NULL_PARTITION = "__HIVE_DEFAULT_PARTITION__"
+PART_FILE = "part-0.parquet"
+
+
+def _partition_dir(root, country, month):
+    return Path(root) / f"country={country}" / f"month={month}"
+
+
+def write_partitioned_dataset(df, root, country=None, date_column="trending_date",
+                              country_column="country"):
+    """
+    Write cleaned data as Parquet partitions laid out ``country=XX/month=YYYY-MM/``.
+
+    Each (country, trending month) pair becomes one directory holding a single
+    Parquet file. Existing partitions touched by ``df`` are replaced atomically;
+    other partitions are left as they are, so countries can be written one at
+    a time. Rows without a date go to the ``month=__HIVE_DEFAULT_PARTITION__``
+    partition.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        Cleaned dataset with a datetime ``date_column``.
+    root : str or Path
+        Root directory of the dataset.
+    country : str, optional
+        Country code for all rows. Required if ``df`` has no ``country_column``.
+    date_column : str, optional
+        Column used for month partitioning (default 'trending_date').
+    country_column : str, optional
+        Column holding the country code (default 'country'). It is encoded in
+        the directory name and not repeated inside the files.
+
+    Returns
+    -------
+    list of Path
+        The partition files written.
+
+    Raises
+    ------
+    ValueError
+        If no country is given and ``df`` has no ``country_column``.
+    """
+    if country is None and country_column not in df.columns:
+        raise ValueError(f"Pass 'country' or include a '{country_column}' column.")
+
+    countries = (
+        df[country_column].astype(str) if country_column in df.columns
+        else pd.Series(country, index=df.index)
+    )
+    months = pd.to_datetime(df[date_column]).dt.to_period("M").astype(str)
+    months = months.where(months != "NaT", NULL_PARTITION)
+    payload = df.drop(columns=[country_column], errors="ignore")
+
+    written = []
+    # Group by position (arrays, not labels), so a non-unique index cannot mix partitions
+    keys = [countries.to_numpy(), months.to_numpy()]
+    for (country_code, month), part in payload.groupby(keys, sort=True):
+        partition = _partition_dir(root, country_code, month)
+        partition.mkdir(parents=True, exist_ok=True)
+        tmp = partition / (PART_FILE + ".tmp")
+        part.to_parquet(tmp, index=False)
+        os.replace(tmp, partition / PART_FILE)
+        written.append(partition / PART_FILE)
+    return written
+
+
+def list_partitions(root, countries=None, start_date=None, end_date=None):
+    """
+    List the partitions that can hold rows for the given countries and date window.
+
+    Pruning only inspects directory names, so no data file is opened.
+
+    Parameters
+    ----------
+    root : str or Path
+        Root directory of the dataset.
+    countries : list of str, optional
+        Country codes to keep (default: all).
+    start_date, end_date : str, optional
+        Inclusive date window, e.g. ``analysis_settings.time_period`` values.
+
+    Returns
+    -------
+    pd.DataFrame
+        Columns 'country', 'month' and 'path', one row per kept partition.
+    """
+    root = Path(root)
+    start = pd.Period(start_date, freq="M") if start_date else None
+    end = pd.Period(end_date, freq="M") if end_date else None
+    wanted = None if countries is None else {str(c) for c in countries}
+    bounded = start is not None or end is not None
+
+    rows = []
+    if not root.exists():
+        return pd.DataFrame(columns=["country", "month", "path"])
+
+    for country_dir in sorted(root.glob("country=*")):
+        country = country_dir.name.split("=", 1)[1]
+        if wanted is not None and country not in wanted:
+            continue
+        for month_dir in sorted(country_dir.glob("month=*")):
+            month = month_dir.name.split("=", 1)[1]
+            if month == NULL_PARTITION:
+                if bounded:
+                    continue
+            else:
+                period = pd.Period(month, freq="M")
+                if (start is not None and period < start) or (end is not None and period > end):
+                    continue
+            part = month_dir / PART_FILE
+            if part.exists():
+                rows.append({"country": country, "month": month, "path": part})
+
+    return pd.DataFrame(rows, columns=["country", "month", "path"])
+
+
+def read_partitioned_dataset(root, countries=None, start_date=None, end_date=None,
+                             columns=None, date_column="trending_date", country_column="country"):
+    """
+    Read a partitioned dataset, pruning partitions before any file is opened.
+
+    Only partitions matching ``countries`` and overlapping the date window are
+    read; rows in the first and last month are then trimmed to the exact
+    window (both bounds inclusive). Rows without a date are returned only
+    when no window is given.
+
+    Parameters
+    ----------
+    root : str or Path
+        Root directory written by ``write_partitioned_dataset``.
+    countries : list of str, optional
+        Country codes to load (default: all).
+    start_date, end_date : str, optional
+        Inclusive date window in 'YYYY-MM-DD' format.
+    columns : list of str, optional
+        Columns to read (default: all). The date column is always read when
+        a window is given.
+    date_column : str, optional
+        Date column used for partitioning (default 'trending_date').
+    country_column : str, optional
+        Name of the country column added from the partition path.
+
+    Returns
+    -------
+    pd.DataFrame
+        The matching rows with a ``country_column`` column.
+    """
+    partitions = list_partitions(root, countries, start_date, end_date)
+    read_columns = None
+    if columns is not None:
+        read_columns = [c for c in columns if c != country_column]
+        if (start_date or end_date) and date_column not in read_columns:
+            read_columns.append(date_column)
+
+    start = pd.to_datetime(start_date) if start_date else None
+    end = pd.to_datetime(end_date) if end_date else None
+    first_month = pd.Period(start_date, freq="M") if start_date else None
+    last_month = pd.Period(end_date, freq="M") if end_date else None
+
+    frames = []
+    for partition in partitions.itertuples(index=False):
+        frame = pd.read_parquet(partition.path, columns=read_columns)
+        # The null partition is only listed without a window, so it needs no trimming
+        if partition.month != NULL_PARTITION:
+            month = pd.Period(partition.month, freq="M")
+            # Only the boundary months can contain rows outside the window
+            if start is not None and month == first_month:
+                frame = frame[frame[date_column] >= start]
+            if end is not None and month == last_month:
+                frame = frame[frame[date_column] <= end]
+        frame.insert(0, country_column, partition.country)
+        frames.append(frame)
+
+    if not frames:
+        return pd.DataFrame(columns=[country_column] + (list(read_columns) if read_columns else []))
+
+    result = pd.concat(frames, ignore_index=True)
+    if columns is not None:
+        result = result[[c for c in columns if c in result.columns]]
+    return result
@@ -0,0 +1,223 @@
+import hashlib
+import json
+from dataclasses import asdict
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from ..analysis.preview import DEFAULT_STRATA, SAMPLE_COLUMN, load_preview_sample, preview_cache_path
+from ..config_loader import get_paths_config, get_settings
+from .data_utils import convert_to_datetime, drop_columns, handle_missing_values
+from .memory_planner import iter_plan_frames, plan_run
+from .merge_datasets import dataset_merger
+from .time_features import add_time_features, time_features_cache_path
+from .video_ids import compact_video_ids
+
+# Columns the country notebooks drop before analysis (category_id is needed for the merge)
+DEFAULT_COLUMNS_TO_DROP = ("thumbnail_link", "description")
+
+
+def clean_text_columns(df, columns, lowercase=False):
+    """
+    Normalise whitespace in text columns, optionally lowercasing them.
+
+    Leading/trailing whitespace is stripped and inner runs of whitespace
+    (including newlines) are collapsed to one space. Missing columns and
+    non-text columns are skipped.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        Input DataFrame. Cleaned columns are assigned, not modified in place.
+    columns : iterable of str
+        Columns to clean, e.g. ``preprocessing_settings.columns_to_clean``.
+    lowercase : bool, optional
+        Lowercase the text as well (``convert_to_lowercase``).
+
+    Returns
+    -------
+    pd.DataFrame
+        DataFrame with the cleaned columns.
+    """
+    for column in columns:
+        if column not in df.columns or not pd.api.types.is_object_dtype(df[column]):
+            continue
+        text = df[column].str.replace(r"\s+", " ", regex=True).str.strip()
+        df[column] = text.str.lower() if lowercase else text
+    return df
+
+
+def preprocess_dataset(df, settings=None, columns_to_drop=None, date_column="trending_date",
+                       date_format="%y.%d.%m", value_column="views"):
+    """
+    Apply the ``settings.yaml`` preprocessing rules, cheapest and most selective first.
+
+    Steps, in order:
+
+    1. Drop ``columns_to_drop``, so no later step touches them.
+    2. Parse ``date_column`` (if still text) with ``convert_to_datetime``.
+    3. Keep rows inside ``analysis_settings.time_period`` (inclusive) and with
+       ``value_column`` >= ``trending_category_threshold``. Both filters are
+       combined into one mask, so rows are copied only once.
+    4. Drop rows with missing values (``drop_missing_values``).
+    5. Encode 'video_id' as uint64 (``compact_video_ids``), so deduplication
+       and later groupbys and joins compare integers.
+    6. Drop duplicate rows (``remove_duplicates``) on the reduced data.
+    7. Clean ``columns_to_clean`` (``convert_to_lowercase``).
+
+    The input DataFrame is not modified.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        Raw dataset, e.g. a ``*videos.csv`` file.
+    settings : Settings, optional
+        Typed settings (default: ``get_settings()``).
+    columns_to_drop : list of str, optional
+        Columns to remove first.
+    date_column : str, optional
+        Column used for time-period pruning (default 'trending_date').
+    date_format : str, optional
+        Format of ``date_column`` when it is text (default '%y.%d.%m').
+    value_column : str, optional
+        Column compared with the threshold (default 'views').
+
+    Returns
+    -------
+    pd.DataFrame
+        The preprocessed dataset.
+    """
+    settings = get_settings() if settings is None else settings
+    df = _filter_rows(df, settings, columns_to_drop, date_column, date_format, value_column)
+    return _compact_and_clean(df, settings.preprocessing).reset_index(drop=True)
+
+
+def _filter_rows(df, settings, columns_to_drop, date_column, date_format, value_column):
+    """
+    Steps 1-4 of ``preprocess_dataset``, which only look at one row at a time.
+    """
+    analysis, preprocessing = settings.analysis, settings.preprocessing
+
+    df = drop_columns(df, list(columns_to_drop)) if columns_to_drop else df.copy(deep=False)
+
+    keep = np.ones(len(df), dtype=bool)
+    if date_column in df.columns:
+        if not pd.api.types.is_datetime64_any_dtype(df[date_column]):
+            df = convert_to_datetime(df, date_column, date_format)
+        dates = df[date_column]
+        period = analysis.time_period
+        if period.start_date:
+            keep &= (dates >= pd.Timestamp(period.start_date)).to_numpy()
+        if period.end_date:
+            keep &= (dates <= pd.Timestamp(period.end_date)).to_numpy()
+
+    if analysis.trending_category_threshold and value_column in df.columns:
+        keep &= (df[value_column] >= analysis.trending_category_threshold).to_numpy()
+
+    if not keep.all():
+        df = df[keep]
+
+    if preprocessing.drop_missing_values:
+        df = handle_missing_values(df, strategy="drop")
+    return df
+
+
+def _compact_and_clean(df, preprocessing):
+    """
+    Steps 5-7 of ``preprocess_dataset``, which need all rows at once.
+    """
+    if preprocessing.compact_video_ids and "video_id" in df.columns:
+        df = compact_video_ids(df)
+    if preprocessing.remove_duplicates:
+        df = df.drop_duplicates()
+    if preprocessing.columns_to_clean:
+        df = clean_text_columns(df.copy(deep=False), preprocessing.columns_to_clean,
+                                lowercase=preprocessing.convert_to_lowercase)
+    return df
+
+
+def _preview_key(settings, columns_to_drop):
+    """
+    Short hash of the settings and dropped columns that shape a preview sample.
+    """
+    inputs = {
+        "time_period": asdict(settings.analysis.time_period),
+        "trending_category_threshold": settings.analysis.trending_category_threshold,
+        "preprocessing": asdict(settings.preprocessing),
+        "columns_to_drop": sorted(columns_to_drop or ()),
+        "strata": list(DEFAULT_STRATA),
+        # Samples written before they carried their id are rebuilt
+        "sample_column": SAMPLE_COLUMN,
+    }
+    return hashlib.sha1(json.dumps(inputs, sort_keys=True).encode()).hexdigest()[:12]
+
+
+def load_country_dataset(country, settings=None, columns_to_drop=DEFAULT_COLUMNS_TO_DROP, preview=None):
+    """
+    Load, preprocess and merge one country's videos with its category names.
+
+    Time features (``add_time_features``) are derived from the raw CSV and
+    cached next to it. The videos are then reduced by ``preprocess_dataset``
+    before the merge, so the merge and all later analyses run on the smallest
+    dataset. Rows whose category is not in the JSON file are dropped (inner merge).
+
+    When the CSV does not fit the memory budget (``plan_run``), it is read in
+    chunks and each chunk is filtered before the next one is read, so only
+    the reduced rows are held in memory; time features are then derived per
+    chunk and not cached.
+
+    In preview mode a stratified sample of ``preview_fraction`` of the rows
+    (by category and trending month) is returned instead. It is saved next to
+    the CSV under a name that includes a hash of the time period, category
+    threshold, preprocessing settings and ``columns_to_drop``, and reused
+    until the CSV changes, so preview runs skip loading the full data.
+    Row counts and totals computed on the sample cover only the sampled
+    rows: scale them with ``src.analysis.preview.estimate_population``.
+
+    Parameters
+    ----------
+    country : str
+        Country code, e.g. 'CA'. Files are taken from ``paths.yaml``'s
+        ``<country>_data`` directory (``<country>videos.csv`` and
+        ``<country>_category_id.json``).
+    settings : Settings, optional
+        Typed settings (default: ``get_settings()``).
+    columns_to_drop : list of str, optional
+        Columns removed before preprocessing (default: thumbnail_link, description).
+    preview : bool, optional
+        Return the preview sample (default: ``analysis_settings.preview_mode``).
+
+    Returns
+    -------
+    pd.DataFrame
+        Preprocessed dataset with time features, a 'category_name' column and
+        no 'category_id'.
+    """
+    settings = get_settings() if settings is None else settings
+    directory = Path(get_paths_config()[f"{country}_data"])
+    source = directory / f"{country}videos.csv"
+
+    def build():
+        plan = plan_run(source, settings=settings)
+        if plan.mode == "in_memory":
+            videos = add_time_features(pd.read_csv(source), cache_path=time_features_cache_path(source),
+                                       source_path=source)
+            videos = preprocess_dataset(videos, settings, columns_to_drop=columns_to_drop)
+        else:
+            # Reduce every chunk as it is read; only deduplication needs all rows at once
+            parts = [_filter_rows(add_time_features(chunk), settings, columns_to_drop, "trending_date",
+                                  "%y.%d.%m", "views")
+                     for chunk in iter_plan_frames(plan)]
+            videos = pd.concat(parts, ignore_index=True)
+            videos = _compact_and_clean(videos, settings.preprocessing).reset_index(drop=True)
+        categories = dataset_merger([directory / f"{country}_category_id.json"])
+        merged = videos.merge(categories, how="inner", on="category_id")
+        merged.attrs = videos.attrs  # keeps the video_id side table of compact_video_ids
+        return drop_columns(merged, ["category_id"])
+
+    if not (settings.analysis.preview_mode if preview is None else preview):
+        return build()
+    fraction = settings.analysis.preview_fraction
+    cache_path = preview_cache_path(source, fraction, key=_preview_key(settings, columns_to_drop))
+    return load_preview_sample(build, cache_path, fraction, source_path=source, sample_id=country)
@@ -0,0 +1,302 @@
+import atexit
+import pickle
+import sys
+import time
+import weakref
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+import pandas as pd
+
+from .columnar_store import ColumnarStore, encode_columns
+
+_ALIGNMENT = 64
+
+# Shared frames attached in this process, reused across tasks of a pool worker
+_attached = {}
+
+# Segments whose mapping was still exported when released
+_unclosed = []
+
+
+def _open_segment(name):
+    # Python 3.13+ can skip the resource tracker for segments owned by another process;
+    # on older versions, workers started by the owner share its tracker, so this is safe.
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(name=name, track=False)
+    return shared_memory.SharedMemory(name=name)
+
+
+def _close_deferred():
+    for segment in list(_unclosed):
+        try:
+            segment.close()
+        except BufferError:
+            continue
+        _unclosed.remove(segment)
+
+
+atexit.register(_close_deferred)
+
+
+def _release(segment, unlink):
+    _close_deferred()
+    try:
+        segment.close()
+    except BufferError:
+        # Arrays handed out by to_frame() still export the mapping: retry the
+        # close on later releases and at exit, once they are garbage collected
+        _unclosed.append(segment)
+    if unlink:
+        try:
+            segment.unlink()
+        except FileNotFoundError:
+            pass
+
+
+class SharedFrame(ColumnarStore):
+    """
+    A DataFrame held in one ``multiprocessing.shared_memory`` segment.
+
+    Columns use the same encoding as the columnar store (``encode_columns``:
+    numeric, boolean, datetime and timedelta columns as-is, nullable columns
+    with a mask, text as int32 codes plus a UTF-8 dictionary),
+    and the same read API: ``column``, ``codes``, ``to_frame``. Columns are
+    read-only, zero-copy NumPy views of the segment, and every function
+    decorated with ``accepts_columnar_store`` takes a SharedFrame directly.
+
+    Pickling a SharedFrame only sends its small ``spec`` (segment name and
+    layout), so passing it to a process pool costs almost nothing; workers
+    attach to the segment by name. The creating process owns the segment and
+    unlinks it on ``close()``, on context-manager exit or when the object is
+    garbage collected; attached copies only unmap it.
+
+    Build one with ``SharedFrame.from_frame`` (or ``share_frame``).
+    """
+
+    def __init__(self, spec, segment=None, owner=False):
+        self.spec = spec
+        self.path = None
+        self.n_rows = spec["n_rows"]
+        self._schema = {entry["name"]: entry for entry in spec["columns"]}
+        self._cache = {}
+        self._dictionaries = {}
+        self._categoricals = {}
+        self._segment = segment if segment is not None else _open_segment(spec["name"])
+        self._owner = owner
+        self._finalizer = weakref.finalize(self, _release, self._segment, owner)
+
+    @classmethod
+    def from_frame(cls, df):
+        """
+        Copy a DataFrame into a new shared memory segment.
+
+        Parameters
+        ----------
+        df : pd.DataFrame
+            Cleaned dataset to share.
+
+        Returns
+        -------
+        SharedFrame
+            The owning handle. Keep it alive while workers use the data.
+
+        Raises
+        ------
+        TypeError
+            If a column cannot be stored without loss (see ``encode_columns``).
+        """
+        columns, arrays, layout, size = [], {}, {}, 0
+        for entry, encoded in encode_columns(df):
+            columns.append(entry)
+            for key, array in encoded.items():
+                array = np.ascontiguousarray(array)
+                layout[key] = {"offset": size, "dtype": array.dtype.str, "shape": list(array.shape)}
+                arrays[key] = array
+                size += -(-array.nbytes // _ALIGNMENT) * _ALIGNMENT
+
+        segment = shared_memory.SharedMemory(create=True, size=max(size, 1))
+        try:
+            for key, array in arrays.items():
+                target = np.ndarray(array.shape, dtype=array.dtype, buffer=segment.buf,
+                                    offset=layout[key]["offset"])
+                target[...] = array
+                del target
+        except BaseException:
+            _release(segment, unlink=True)
+            raise
+
+        spec = {"name": segment.name, "n_rows": len(df), "columns": columns, "arrays": layout}
+        return cls(spec, segment=segment, owner=True)
+
+    @property
+    def name(self):
+        return self.spec["name"]
+
+    @property
+    def nbytes(self):
+        return self._segment.size
+
+    def _load(self, key):
+        if key not in self._cache:
+            if not self._finalizer.alive:
+                raise ValueError("SharedFrame is closed.")
+            info = self.spec["arrays"][key]
+            dtype = np.dtype(info["dtype"])
+            start = info["offset"]
+            stop = start + dtype.itemsize * int(np.prod(info["shape"]))
+            # frombuffer keeps the slice (and so the mapping) exported for as long
+            # as the array or anything built on it is alive
+            view = np.frombuffer(self._segment.buf[start:stop], dtype=dtype).reshape(info["shape"])
+            view.flags.writeable = False
+            self._cache[key] = view
+        return self._cache[key]
+
+    def close(self):
+        """
+        Release this handle; the owner also unlinks the segment.
+
+        DataFrames already built from the segment stay valid until they are
+        garbage collected.
+        """
+        self._cache.clear()
+        self._dictionaries.clear()
+        self._categoricals.clear()
+        self._finalizer()
+        _attached.pop(self.name, None)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
+
+    def __reduce__(self):
+        return attach_shared_frame, (self.spec,)
+
+
+def share_frame(df):
+    """
+    Copy a DataFrame into shared memory (see ``SharedFrame.from_frame``).
+    """
+    return SharedFrame.from_frame(df)
+
+
+def attach_shared_frame(spec):
+    """
+    Attach to a shared frame by its ``spec`` (segment name and layout).
+
+    Repeated attachments in the same process reuse one mapping, so pool
+    workers attach once however many tasks they run.
+
+    Parameters
+    ----------
+    spec : dict
+        ``SharedFrame.spec`` of the owning handle.
+
+    Returns
+    -------
+    SharedFrame
+        A read-only, non-owning handle.
+    """
+    frame = _attached.get(spec["name"])
+    if frame is None or not frame._finalizer.alive:
+        frame = _attached[spec["name"]] = SharedFrame(spec)
+    return frame
+
+
+def map_shared(func, frame, items, max_workers=None, mp_context=None):
+    """
+    Run ``func(frame, item)`` for every item on a process pool.
+
+    Only the frame's spec is sent to the workers.
+
+    Parameters
+    ----------
+    func : callable
+        Picklable (module-level) function taking the frame and one item.
+    frame : SharedFrame
+        Shared data.
+    items : iterable
+        One task per item (e.g. country codes or column names).
+    max_workers : int, optional
+        Worker processes (default: number of CPUs).
+    mp_context : multiprocessing context, optional
+        Start method context, e.g. ``multiprocessing.get_context('spawn')``.
+
+    Returns
+    -------
+    list
+        Results in the order of ``items``.
+    """
+    items = list(items)
+    with ProcessPoolExecutor(max_workers=max_workers, mp_context=mp_context) as executor:
+        return list(executor.map(func, [frame] * len(items), items))
+
+
+def _sum_column(frame, column):
+    return float(np.nansum(frame[column].to_numpy(dtype=np.float64)))
+
+
+def benchmark_handoff(df, columns=None, max_workers=2, repeats=3, mp_context=None):
+    """
+    Compare handing a DataFrame to a process pool by pickling vs shared memory.
+
+    Each run sends the data with one task per column (summing the column) to
+    a fresh pool, once as the pickled DataFrame and once as a SharedFrame.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        Dataset to hand off.
+    columns : list of str, optional
+        Numeric columns, one task each (default: all numeric columns).
+    max_workers : int, optional
+        Worker processes (default 2).
+    repeats : int, optional
+        Runs per method; the best time is kept (default 3).
+    mp_context : multiprocessing context, optional
+        Start method context.
+
+    Returns
+    -------
+    dict
+        'pickle_bytes' and 'spec_bytes' (payload per task), 'pickle_seconds',
+        'share_seconds' (copying into shared memory) and 'shared_seconds'
+        (pool run including the copy).
+    """
+    if columns is None:
+        columns = [c for c in df.columns
+                   if pd.api.types.is_numeric_dtype(df[c]) and not pd.api.types.is_bool_dtype(df[c])]
+
+    def best(run):
+        timings = []
+        for _ in range(repeats):
+            start = time.perf_counter()
+            run()
+            timings.append(time.perf_counter() - start)
+        return min(timings)
+
+    def run_pickled():
+        with ProcessPoolExecutor(max_workers=max_workers, mp_context=mp_context) as executor:
+            list(executor.map(_sum_column, [df] * len(columns), columns))
+
+    def run_shared():
+        with share_frame(df) as frame:
+            map_shared(_sum_column, frame, columns, max_workers=max_workers, mp_context=mp_context)
+
+    with share_frame(df) as frame:
+        spec_bytes = len(pickle.dumps(frame))
+    start = time.perf_counter()
+    share_frame(df).close()
+    share_seconds = time.perf_counter() - start
+
+    return {
+        "pickle_bytes": len(pickle.dumps(df)),
+        "spec_bytes": spec_bytes,
+        "pickle_seconds": best(run_pickled),
+        "share_seconds": share_seconds,
+        "shared_seconds": best(run_shared),
+    }
@@ -0,0 +1,170 @@
+import os
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+WEEKDAY_NAMES = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
+
+# Derived columns and their dtypes (publish_weekday is a Categorical with int8 codes)
+TIME_FEATURES = {
+    'publish_day': 'datetime64[ns]',
+    'publish_hour': 'int8',
+    'publish_weekday': 'category',
+    'trending_month': 'int8',
+    'days_to_trend': 'int16',
+}
+
+CACHE_SUFFIX = '.time_features.parquet'
+
+
+def _naive_datetimes(values, date_format=None):
+    """
+    Parse to datetime64[ns] without timezone (UTC-converted), leaving datetimes as they are.
+    """
+    if not pd.api.types.is_datetime64_any_dtype(values):
+        values = pd.to_datetime(values, format=date_format, errors='coerce', utc=date_format is None)
+    if getattr(values.dt, 'tz', None) is not None:
+        values = values.dt.tz_convert('UTC').dt.tz_localize(None)
+    return values
+
+
+def _small_int(values, dtype):
+    """
+    Cast to a compact integer dtype, falling back to the nullable variant when values are missing.
+    """
+    if values.isna().any():
+        return values.astype(dtype.capitalize())
+    return values.astype(dtype)
+
+
+def derive_time_features(df, publish_column='publish_time', trending_column='trending_date',
+                         trending_format='%y.%d.%m'):
+    """
+    Derive the publish/trending time features once, as compact columns.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        Dataset with ``publish_column`` (ISO timestamps, possibly tz-aware) and
+        ``trending_column`` (datetime, or text in ``trending_format``).
+    publish_column : str, optional
+        Publish timestamp column (default 'publish_time').
+    trending_column : str, optional
+        Trending date column (default 'trending_date').
+    trending_format : str, optional
+        Format of ``trending_column`` when it is text (default '%y.%d.%m').
+
+    Returns
+    -------
+    pd.DataFrame
+        Aligned with ``df``:
+
+        - ``publish_time`` / ``trending_date``: parsed, tz-naive datetimes
+        - ``publish_day``: publish date at midnight
+        - ``publish_hour``: int8, 0-23
+        - ``publish_weekday``: ordered Categorical of day names; its int8 codes
+          are the weekday number (0 = Monday)
+        - ``trending_month``: int8, 1-12
+        - ``days_to_trend``: int16, whole days from publishing to trending
+
+        Integer columns use the nullable dtype (e.g. 'Int16') if a date is missing.
+    """
+    publish = _naive_datetimes(df[publish_column])
+    trending = _naive_datetimes(df[trending_column], trending_format)
+
+    weekday_codes = publish.dt.dayofweek.fillna(-1).to_numpy(dtype=np.int8)
+    weekdays = pd.Categorical.from_codes(weekday_codes, categories=WEEKDAY_NAMES, ordered=True)
+
+    return pd.DataFrame({
+        publish_column: publish,
+        trending_column: trending,
+        'publish_day': publish.dt.normalize(),
+        'publish_hour': _small_int(publish.dt.hour, 'int8'),
+        'publish_weekday': pd.Series(weekdays, index=df.index),
+        'trending_month': _small_int(trending.dt.month, 'int8'),
+        'days_to_trend': _small_int((trending - publish).dt.days, 'int16'),
+    }, index=df.index)
+
+
+def add_time_features(df, cache_path=None, source_path=None, **kwargs):
+    """
+    Return ``df`` with the time features of ``derive_time_features`` added or replaced.
+
+    With ``cache_path``, the features are stored next to the dataset as Parquet
+    and reused while the cache is newer than ``source_path`` (when given) and
+    has as many rows as ``df``.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        Dataset with publish and trending dates. It is not modified.
+    cache_path : str or Path, optional
+        Feature cache file; see ``time_features_cache_path``.
+    source_path : str or Path, optional
+        File ``df`` was loaded from, used to invalidate a stale cache.
+    **kwargs
+        Passed to ``derive_time_features``.
+
+    Returns
+    -------
+    pd.DataFrame
+        A new frame sharing ``df``'s other columns.
+    """
+    features = None
+    if cache_path is not None and _cache_is_fresh(cache_path, source_path):
+        cached = pd.read_parquet(cache_path)
+        if len(cached) == len(df):
+            features = cached.set_axis(df.index)
+    if features is None:
+        features = derive_time_features(df, **kwargs)
+        if cache_path is not None:
+            tmp = f"{cache_path}.tmp"
+            features.reset_index(drop=True).to_parquet(tmp, index=False)
+            os.replace(tmp, cache_path)
+
+    result = df.copy(deep=False)
+    for column in features.columns:
+        result[column] = features[column]
+    return result
+
+
+def time_features_cache_path(source_path):
+    """
+    Return the feature cache file stored alongside a dataset file.
+    """
+    source_path = Path(source_path)
+    return source_path.with_name(source_path.name + CACHE_SUFFIX)
+
+
+def _cache_is_fresh(cache_path, source_path):
+    if not os.path.exists(cache_path):
+        return False
+    if source_path is None:
+        return True
+    return os.stat(cache_path).st_mtime_ns >= os.stat(source_path).st_mtime_ns
+
+
+def weekday_codes(df):
+    """
+    Weekday number of every row (0 = Monday, -1 = unknown) as int8.
+
+    Uses the ``publish_weekday`` feature when present (Categorical codes or day
+    names) and derives it from ``publish_time`` otherwise.
+    """
+    if 'publish_weekday' in df.columns:
+        weekdays = df['publish_weekday']
+        if isinstance(weekdays.dtype, pd.CategoricalDtype) and list(weekdays.cat.categories) == WEEKDAY_NAMES:
+            return weekdays.cat.codes.to_numpy(dtype=np.int8)
+        return pd.Categorical(weekdays, categories=WEEKDAY_NAMES).codes.astype(np.int8)
+    publish = _naive_datetimes(df['publish_time'])
+    return publish.dt.dayofweek.fillna(-1).to_numpy(dtype=np.int8)
+
+
+def trending_months(df):
+    """
+    Trending month number (1-12) of every row, from the ``trending_month`` feature if present.
+    """
+    if 'trending_month' in df.columns and pd.api.types.is_integer_dtype(df['trending_month']):
+        return df['trending_month']
+    return pd.to_datetime(df['trending_date']).dt.month
@@ -0,0 +1,170 @@
+import numpy as np
+import pandas as pd
+
+# YouTube ids are 11 characters of URL-safe base64: 10 x 6 bits plus the top 4 bits of the last one
+VIDEO_ID_LENGTH = 11
+ALPHABET = "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789-_"
+
+_ALPHABET_BYTES = np.frombuffer(ALPHABET.encode("ascii"), dtype=np.uint8)
+_DIGITS = np.full(256, 255, dtype=np.uint8)
+_DIGITS[_ALPHABET_BYTES] = np.arange(64, dtype=np.uint8)
+
+
+def _side_table_series(side_table):
+    if side_table is None:
+        return pd.Series([], index=pd.Index([], dtype=np.uint64), dtype=object)
+    if isinstance(side_table, pd.Series):
+        return side_table
+    return pd.Series(list(side_table.values()), index=pd.Index(list(side_table.keys()), dtype=np.uint64),
+                     dtype=object)
+
+
+def encode_video_ids(ids):
+    """
+    Encode video ids as uint64, keeping malformed ids in a side table.
+
+    A well-formed id (11 URL-safe base64 characters whose last character only
+    uses its top 4 bits) is decoded to the 64-bit number it stands for, so the
+    mapping is the same for every dataset and ``decode_video_ids`` gives back
+    the exact string. Anything else (placeholders such as '#NAME?', wrong
+    lengths, missing values) gets a deterministic 64-bit hash instead and is
+    recorded in the side table.
+
+    Parameters
+    ----------
+    ids : array-like
+        Video ids, e.g. ``df['video_id']``.
+
+    Returns
+    -------
+    tuple of (np.ndarray, pd.Series)
+        uint64 codes aligned with ``ids``, and the side table mapping the codes
+        of malformed ids (index) to their original values.
+
+    Raises
+    ------
+    ValueError
+        If the hash of a malformed id equals the code of a valid id or of
+        another malformed id (never seen in practice).
+    """
+    values = pd.Series(ids, copy=False)
+    text = values.to_numpy(dtype=object)
+    codes = np.zeros(len(text), dtype=np.uint64)
+    valid = np.zeros(len(text), dtype=bool)
+
+    is_text = np.fromiter((type(value) is str for value in text), dtype=bool, count=len(text))
+    candidates = np.flatnonzero(is_text)
+    if len(candidates):
+        candidates = candidates[np.char.str_len(text[candidates].astype(str)) == VIDEO_ID_LENGTH]
+        chars = text[candidates].astype(f"U{VIDEO_ID_LENGTH}").view(np.uint32).reshape(-1, VIDEO_ID_LENGTH)
+        digits = _DIGITS[np.minimum(chars, 255)]
+        ok = (digits != 255).all(axis=1) & (digits[:, -1] & 3 == 0)
+        digits = digits[ok].astype(np.uint64)
+        packed = np.zeros(len(digits), dtype=np.uint64)
+        for i in range(VIDEO_ID_LENGTH - 1):
+            packed = (packed << np.uint64(6)) | digits[:, i]
+        packed = (packed << np.uint64(4)) | (digits[:, -1] >> np.uint64(2))
+        codes[candidates[ok]] = packed
+        valid[candidates[ok]] = True
+
+    malformed = np.flatnonzero(~valid)
+    side_table = _side_table_series(None)
+    if len(malformed):
+        # Missing values (None/NaN) collapse into one None entry that hashes to 2**64 - 1
+        bad = text[malformed]
+        bad[pd.isna(bad)] = None
+        originals = pd.unique(bad)
+        hashed = pd.util.hash_array(originals)
+        if len(np.unique(hashed)) < len(hashed):
+            raise ValueError("Hash collision between malformed video ids.")
+        if np.isin(hashed, codes[valid]).any():
+            raise ValueError("Hash of a malformed video id collides with a valid video id.")
+        side_table = pd.Series(originals, index=pd.Index(hashed, dtype=np.uint64), dtype=object)
+        codes[malformed] = pd.util.hash_array(bad)
+
+    side_table.index.name = "code"
+    return codes, side_table.rename("video_id")
+
+
+def decode_video_ids(codes, side_table=None):
+    """
+    Turn uint64 codes from ``encode_video_ids`` back into video id strings.
+
+    Parameters
+    ----------
+    codes : array-like
+        uint64 codes.
+    side_table : pd.Series or dict, optional
+        Side table returned by ``encode_video_ids``; codes found in it are
+        replaced by the stored original value.
+
+    Returns
+    -------
+    np.ndarray
+        Object array of video ids.
+    """
+    codes = np.asarray(codes, dtype=np.uint64)
+    shifts = np.arange(VIDEO_ID_LENGTH - 2, -1, -1, dtype=np.uint64) * np.uint64(6) + np.uint64(4)
+    digits = np.empty((len(codes), VIDEO_ID_LENGTH), dtype=np.uint8)
+    digits[:, :-1] = (codes[:, None] >> shifts) & np.uint64(63)
+    digits[:, -1] = (codes & np.uint64(15)) << np.uint64(2)
+    ids = _ALPHABET_BYTES[digits].view(f"S{VIDEO_ID_LENGTH}").ravel().astype(str).astype(object)
+
+    side_table = _side_table_series(side_table)
+    if len(side_table):
+        position = side_table.index.get_indexer(codes)
+        found = position >= 0
+        ids[found] = side_table.to_numpy()[position[found]]
+    return ids
+
+
+def compact_video_ids(df, column="video_id"):
+    """
+    Replace a video id column with its uint64 codes.
+
+    Counting, ``nunique``, deduplication and joins on the column then work on
+    8-byte integers instead of Python strings. The side table is kept in
+    ``df.attrs[f'{column}_side_table']`` (a dict) for ``restore_video_ids``.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        Dataset with a text id column. It is not modified.
+    column : str, optional
+        Id column (default 'video_id').
+
+    Returns
+    -------
+    pd.DataFrame
+        A new frame with ``column`` as uint64.
+    """
+    codes, side_table = encode_video_ids(df[column])
+    result = df.copy(deep=False)
+    result[column] = codes
+    result.attrs = {**df.attrs, f"{column}_side_table": side_table.to_dict()}
+    return result
+
+
+def restore_video_ids(df, column="video_id", side_table=None):
+    """
+    Replace uint64 video id codes with the original strings.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        Dataset from ``compact_video_ids`` (or any frame with a code column).
+    column : str, optional
+        Id column (default 'video_id').
+    side_table : pd.Series or dict, optional
+        Side table (default: ``df.attrs[f'{column}_side_table']``).
+
+    Returns
+    -------
+    pd.DataFrame
+        A new frame with ``column`` as strings.
+    """
+    if side_table is None:
+        side_table = df.attrs.get(f"{column}_side_table")
+    result = df.copy(deep=False)
+    result[column] = decode_video_ids(df[column].to_numpy(), side_table)
+    return result
@@ -36,6 +36,12 @@ from .plot_trends import (
     plot_channel_category_heatmap
 )
 
+from .scatter import (
+    annotate_points,
+    density_scatter,
+    sampled_overlay
+)
+
 __all__ = [
     # plot_engagement
     "add_plot_engagement_labels",
@@ -70,5 +76,9 @@ __all__ = [
     "plot_trending_by_month",
     "visualize_top_tags_per_category",
     "plot_clickbait_effect_alternative",
-    "plot_channel_category_heatmap"
+    "plot_channel_category_heatmap",
+    # scatter
+    "annotate_points",
+    "density_scatter",
+    "sampled_overlay"
 ]
\ No newline at end of file
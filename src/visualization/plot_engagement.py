@@ -1,7 +1,10 @@
 import matplotlib.pyplot as plt
 import pandas as pd
 import seaborn as sns
-from src.analysis.engagement import correlation_by_category_before_trend
+from src.analysis.engagement import compute_like_dislike_ratio_df, correlation_by_category_before_trend
+from src.analysis.sketches import top_k_keys
+from src.preprocessing.export_queue import savefig_options
+from src.visualization.scatter import DEFAULT_MAX_POINTS, annotate_points, density_scatter, sampled_overlay
 
 
 def add_plot_engagement_labels(ax, title="", xlabel="", ylabel=""):
@@ -128,37 +131,51 @@ def plot_engagement_correlation_before_trend(df: pd.DataFrame):
 
     return fig
 
-def plot_like_dislike_ratio_vs_views(df: pd.DataFrame):
+def plot_like_dislike_ratio_vs_views(df: pd.DataFrame, max_points: int = DEFAULT_MAX_POINTS, kind: str = "hexbin",
+                                     overlay_points: int = 2000, seed: int = 0):
     """
     Visualize avg Like/Dislike ratio vs avg Views per category.
 
+    Per-video data (with 'likes', 'dislikes', 'views' and 'category_name') is
+    also accepted: videos are drawn individually up to ``max_points``, and as a
+    density (log-scaled views) with a per-category stratified sample on top
+    beyond that. Category averages are marked and labelled in both cases.
+
     Parameters:
-        df (pd.DataFrame): DataFrame with 'category_name', 'avg_like_dislike_ratio', 'avg_views'.
+        df (pd.DataFrame): DataFrame with 'category_name', 'avg_like_dislike_ratio', 'avg_views'
+            (as returned by ``like_dislike_ratio_vs_views``), or per-video data.
+        max_points (int): Largest number of videos drawn individually.
+        kind (str): Density rendering, 'hexbin' or 'hist2d'.
+        overlay_points (int): Videos sampled over the density (0 for none).
+        seed (int): Seed of the overlay sample.
 
     Returns:
         matplotlib.figure.Figure
     """
     fig, ax = plt.subplots(figsize=(10, 6))
 
-    # Scatter plot
-    sns.scatterplot(
-        data=df,
-        x="avg_like_dislike_ratio",
-        y="avg_views",
-        s=100,
-        color="mediumseagreen",
-        ax=ax
-    )
-
+    if {"avg_like_dislike_ratio", "avg_views"}.issubset(df.columns):
+        summary = df
+    else:
+        ratio = compute_like_dislike_ratio_df(df)
+        categories = df["category_name"]
+        if len(df) <= max_points:
+            ax.scatter(ratio, df["views"], s=8, alpha=0.4, color="gray")
+        else:
+            density = density_scatter(ax, ratio, df["views"], kind=kind, yscale="log")
+            fig.colorbar(density, ax=ax, label="Videos")
+            if overlay_points:
+                sampled_overlay(ax, ratio, df["views"], n=overlay_points, strata=categories, seed=seed,
+                                color="dimgray", s=4, alpha=0.5)
+        summary = pd.DataFrame({
+            "avg_like_dislike_ratio": ratio.groupby(categories, observed=True).mean(),
+            "avg_views": df["views"].groupby(categories, observed=True).mean(),
+        }).reset_index()
+
+    ax.scatter(summary["avg_like_dislike_ratio"], summary["avg_views"], s=100, color="mediumseagreen",
+               edgecolor="white", zorder=3)
     # Annotate each point with category name
-    for _, row in df.iterrows():
-        ax.text(
-            row["avg_like_dislike_ratio"] + 0.5,
-            row["avg_views"],
-            row["category_name"],
-            fontsize=9,
-            verticalalignment='center'
-        )
+    annotate_points(ax, summary["avg_like_dislike_ratio"], summary["avg_views"], summary["category_name"])
 
     ax.set_title("Average Like/Dislike Ratio vs Average Views by Category")
     ax.set_xlabel("Avg Like/Dislike Ratio")
@@ -167,7 +184,7 @@ def plot_like_dislike_ratio_vs_views(df: pd.DataFrame):
     plt.tight_layout()
     return fig
 
-def plot_engagement_per_user(dataframe, user_col='channel_title', metric='likes'):
+def plot_engagement_per_user(dataframe, user_col='channel_title', metric='likes', approximate=False):
     """
     Plot total engagement metric (e.g., likes) by user/channel.
 
@@ -175,12 +192,20 @@ def plot_engagement_per_user(dataframe, user_col='channel_title', metric='likes'
         dataframe (pd.DataFrame): YouTube dataset.
         user_col (str): Column representing the user/channel.
         metric (str): Engagement metric to sum (e.g., 'likes', 'dislikes').
+        approximate (bool): Select the top users from a sample of rows weighted by
+            the metric (``approximate_top_k``), then sum the metric exactly for
+            those users only.
 
     Returns:
         matplotlib.figure.Figure: Bar chart of top users by engagement metric.
     """
-    df = dataframe.copy()
-    grouped = df.groupby(user_col)[metric].sum().sort_values(ascending=False).head(10)
+    if approximate:
+        top_users = top_k_keys(dataframe[user_col], 10, approximate=True, weights=dataframe[metric].fillna(0))
+        selected = dataframe[user_col].isin(top_users)
+        grouped = dataframe[metric][selected].groupby(dataframe[user_col][selected], observed=True).sum() \
+            .sort_values(ascending=False)
+    else:
+        grouped = dataframe.groupby(user_col)[metric].sum().sort_values(ascending=False).head(10)
     fig, ax = plt.subplots()
     grouped.plot(kind='bar', ax=ax)
     add_plot_engagement_labels(ax, f"Top {user_col} by {metric.capitalize()}", user_col, metric.capitalize())
@@ -199,8 +224,7 @@ def plot_engagement_per_post(dataframe, id_col='video_id', metric='comment_count
     Returns:
         matplotlib.figure.Figure: Bar chart of videos by engagement.
     """
-    df = dataframe.copy()
-    grouped = df.groupby(id_col)[metric].sum().sort_values(ascending=False).head(10)
+    grouped = dataframe.groupby(id_col)[metric].sum().sort_values(ascending=False).head(10)
     fig, ax = plt.subplots()
     grouped.plot(kind='bar', ax=ax)
     add_plot_engagement_labels(ax, f"Top Videos by {metric.capitalize()}", id_col, metric.capitalize())
@@ -220,10 +244,12 @@ def plot_engagement_over_time(dataframe, datetime_col='trending_date', metric='l
     Returns:
         matplotlib.figure.Figure: Line plot of metric over time.
     """
-    df = dataframe.copy()
-    df[datetime_col] = pd.to_datetime(df[datetime_col])
-    df.set_index(datetime_col, inplace=True)
-    grouped = df[metric].resample(freq).sum()
+    values = pd.Series(
+        dataframe[metric].to_numpy(),
+        index=pd.DatetimeIndex(pd.to_datetime(dataframe[datetime_col]), name=datetime_col),
+        name=metric,
+    )
+    grouped = values.resample(freq).sum()
     fig, ax = plt.subplots()
     grouped.plot(ax=ax)
     add_plot_engagement_labels(ax, f"{metric.capitalize()} Over Time", "Date", metric.capitalize())
@@ -315,15 +341,21 @@ def customize_engagement_plot_style(style="ggplot"):
     plt.style.use(style)
 
 
-def save_engagement_plot(fig, filepath):
+def save_engagement_plot(fig, filepath, queue=None):
     """
     Save a plot figure to file.
 
     Parameters:
         fig (matplotlib.figure.Figure): Figure object to save.
-        filepath (str): Destination file path.
+        filepath (str): Destination file path. Without a suffix, the
+            configured ``plot_format`` is appended.
+        queue (ExportQueue, optional): If given, the figure is rendered now and
+            written in the background; call ``queue.wait()`` to collect errors.
     """
-    fig.savefig(filepath)
+    if queue is not None:
+        return queue.submit_figure(fig, filepath)
+    path, options = savefig_options(filepath)
+    fig.savefig(path, **options)
 
 
 
@@ -1,6 +1,9 @@
 import matplotlib.pyplot as plt
 import seaborn as sns
 import pandas as pd
+from src.analysis.sketches import top_k_keys
+from src.preprocessing.export_queue import savefig_options
+from src.visualization.scatter import DEFAULT_MAX_POINTS, density_scatter, sampled_overlay
 
 def add_plot_trends_labels(ax, title="", xlabel="", ylabel=""):
     """
@@ -32,9 +35,11 @@ def plot_category_trends(dataframe, category_col='category_name', value_col='vie
     Returns:
         matplotlib.figure.Figure: A line plot showing trends per category.
     """
-    df = dataframe.copy()
-    df['trending_date'] = pd.to_datetime(df['trending_date'])
-    df.set_index('trending_date', inplace=True)
+    # Two-column frame indexed by date; the input frame is left untouched
+    df = pd.DataFrame(
+        {category_col: dataframe[category_col].to_numpy(), value_col: dataframe[value_col].to_numpy()},
+        index=pd.DatetimeIndex(pd.to_datetime(dataframe['trending_date']), name='trending_date'),
+    )
     grouped = df.groupby(category_col).resample(freq)[value_col].sum().unstack(0)
     fig, ax = plt.subplots()
     grouped.plot(ax=ax)
@@ -62,7 +67,7 @@ def plot_category_growth(growth_df: pd.DataFrame, title: str = "Category Growth
     """
     # Ensure the index is in datetime format
     if not pd.api.types.is_datetime64_any_dtype(growth_df.index):
-        growth_df.index = pd.to_datetime(growth_df.index, errors='coerce')
+        growth_df = growth_df.set_axis(pd.to_datetime(growth_df.index, errors='coerce'))
         growth_df = growth_df[~growth_df.index.isna()]
 
     # Create plot
@@ -95,10 +100,12 @@ def plot_time_series_trends(dataframe, datetime_col='trending_date', value_col='
     Returns:
         matplotlib.figure.Figure: A time series line plot.
     """
-    df = dataframe.copy()
-    df[datetime_col] = pd.to_datetime(df[datetime_col])
-    df.set_index(datetime_col, inplace=True)
-    grouped = df[value_col].resample(freq).sum()
+    values = pd.Series(
+        dataframe[value_col].to_numpy(),
+        index=pd.DatetimeIndex(pd.to_datetime(dataframe[datetime_col]), name=datetime_col),
+        name=value_col,
+    )
+    grouped = values.resample(freq).sum()
     fig, ax = plt.subplots()
     grouped.plot(ax=ax)
     add_plot_trends_labels(ax, f"{value_col.capitalize()} Over Time", "Date", value_col.capitalize())
@@ -118,30 +125,45 @@ def plot_trend_comparison(dataframe, group_col='category_name', value_col='likes
     Returns:
         matplotlib.figure.Figure: Bar chart comparing average metrics across groups.
     """
-    df = dataframe.copy()
-    grouped = df.groupby(group_col)[value_col].mean().sort_values(ascending=False).head(10)
+    grouped = dataframe.groupby(group_col)[value_col].mean().sort_values(ascending=False).head(10)
     fig, ax = plt.subplots()
     grouped.plot(kind='bar', ax=ax)
     add_plot_trends_labels(ax, f"Average {value_col.capitalize()} by {group_col}", group_col, value_col.capitalize())
     return fig
 
 
-def create_scatter_plot(x, y, title="", xlabel="", ylabel=""):
+def create_scatter_plot(x, y, title="", xlabel="", ylabel="", max_points=DEFAULT_MAX_POINTS, kind="hexbin",
+                        strata=None, overlay_points=2000, seed=0):
     """
     Generate a scatter plot for any two numerical variables.
 
+    With more than ``max_points`` points, the density is drawn instead
+    (hexbin or 2-D histogram) with a stratified sample of points on top, so
+    rendering time stays bounded regardless of the row count.
+
     Parameters:
         x (array-like): Values for the x-axis.
         y (array-like): Values for the y-axis.
         title (str): Plot title.
         xlabel (str): X-axis label.
         ylabel (str): Y-axis label.
+        max_points (int): Largest number of points drawn individually.
+        kind (str): Density rendering, 'hexbin' or 'hist2d'.
+        strata (array-like, optional): Group per point used to stratify the overlay sample.
+        overlay_points (int): Points drawn over the density (0 for none).
+        seed (int): Seed of the overlay sample.
 
     Returns:
         matplotlib.figure.Figure: The resulting scatter plot.
     """
     fig, ax = plt.subplots()
-    ax.scatter(x, y)
+    if len(x) <= max_points:
+        ax.scatter(x, y)
+    else:
+        density = density_scatter(ax, x, y, kind=kind)
+        fig.colorbar(density, ax=ax, label="Count")
+        if overlay_points:
+            sampled_overlay(ax, x, y, n=overlay_points, strata=strata, seed=seed, color="black", s=3, alpha=0.4)
     add_plot_trends_labels(ax, title, xlabel, ylabel)
     return fig
 
@@ -164,42 +186,67 @@ def create_pie_chart(labels, sizes, title=""):
     return fig
 
 
-def highlight_trend_peaks(ax, data_series):
+def highlight_trend_peaks(ax, data_series, spikes=None, date_col='trending_date'):
     """
     Annotate the highest value(s) in a data series on a plot.
 
     Parameters:
         ax (matplotlib.axes.Axes): The axes object to annotate.
         data_series (pd.Series): Series containing the values with datetime index.
-    """
+        spikes (pd.DataFrame, optional): Output of ``detect_spikes`` for this
+            series; every detected spike (and dip) is annotated instead of
+            only the global maximum.
+        date_col (str): Date column of ``spikes``. Defaults to 'trending_date'.
+    """
+    if spikes is not None:
+        for date, value, z_score in zip(spikes[date_col], spikes['value'], spikes['z_score']):
+            ax.annotate(f"z={z_score:+.1f}", xy=(date, value), xytext=(date, value * 1.1),
+                        arrowprops=dict(arrowstyle="->", color='red' if z_score > 0 else 'purple'))
+        return
     peaks = data_series[data_series == data_series.max()]
     for date, value in peaks.items():
         ax.annotate(f"Peak: {value}", xy=(date, value), xytext=(date, value * 1.1),
                     arrowprops=dict(arrowstyle="->", color='red'))
 
 
-def annotate_trend_changes(ax, change_points):
+def annotate_trend_changes(ax, change_points, date_col='trending_date'):
     """
     Annotate specific change points on a plot.
 
     Parameters:
         ax (matplotlib.axes.Axes): Axes object to annotate.
-        change_points (list of tuples): Each tuple contains (x, y, label).
-    """
+        change_points (list of tuples or pd.DataFrame): Each tuple contains
+            (x, y, label). The output of ``detect_change_points`` is also
+            accepted; each change is labelled with its relative (or absolute)
+            change in level.
+        date_col (str): Date column of a change-point frame. Defaults to 'trending_date'.
+    """
+    if isinstance(change_points, pd.DataFrame):
+        change_points = [
+            (date, value, f"{relative:+.0%}" if pd.notna(relative) else f"{change:+,.0f}")
+            for date, value, relative, change in zip(change_points[date_col], change_points['value'],
+                                                     change_points['relative_change'], change_points['change'])
+        ]
     for (x, y, label) in change_points:
         ax.annotate(label, xy=(x, y), xytext=(x, y * 1.1),
                     arrowprops=dict(arrowstyle="->", color='blue'))
 
 
-def export_trend_plot(fig, filepath):
+def export_trend_plot(fig, filepath, queue=None):
     """
     Export a matplotlib figure to a file.
 
     Parameters:
         fig (matplotlib.figure.Figure): The figure to save.
-        filepath (str): Path to save the file.
+        filepath (str): Path to save the file. Without a suffix, the
+            configured ``plot_format`` is appended.
+        queue (ExportQueue, optional): If given, the figure is rendered now and
+            written in the background; call ``queue.wait()`` to collect errors.
     """
-    fig.savefig(filepath)
+    if queue is not None:
+        return queue.submit_figure(fig, filepath)
+    path, options = savefig_options(filepath)
+    fig.savefig(path, **options)
 
 
 def adjust_plot_scale(ax, scale_type="linear"):
@@ -261,12 +308,20 @@ def plot_avg_days_to_trend_by_category(df: pd.DataFrame):
 def plot_trending_day_distribution(df: pd.DataFrame):
     """
     Nicely plots the count of trending videos by weekday without title clutter or palette warnings.
+
+    Accepts either the raw data (with a 'publish_weekday' column) or the output of
+    `trending_day_distribution()` (columns 'weekday' and 'count').
     """
     weekday_order = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
-    df['publish_weekday'] = pd.Categorical(df['publish_weekday'], categories=weekday_order, ordered=True)
+    if {'weekday', 'count'}.issubset(df.columns):
+        counts = df.set_index('weekday')['count']
+    else:
+        counts = df['publish_weekday'].value_counts()
 
-    count_df = df['publish_weekday'].value_counts().reindex(weekday_order).reset_index()
-    count_df.columns = ['Weekday', 'Count']
+    count_df = pd.DataFrame({
+        'Weekday': weekday_order,
+        'Count': counts.reindex(weekday_order).to_numpy(),
+    })
 
     fig, ax = plt.subplots(figsize=(8, 5))
     sns.barplot(
@@ -295,7 +350,8 @@ def plot_trending_by_month(df):
     Plots the number of trending videos by month.
 
     Args:
-        df (pd.DataFrame): DataFrame with columns ['trending_month', 'count'].
+        df (pd.DataFrame): DataFrame with columns ['month', 'count'] as returned by
+            `trending_by_month()` (a 'trending_month' column is also accepted).
 
     Returns:
         matplotlib.figure.Figure: Bar plot of trending videos by month.
@@ -307,8 +363,12 @@ def plot_trending_by_month(df):
         9: 'September', 10: 'October', 11: 'November', 12: 'December'
     }
 
-    df['month_name'] = df['trending_month'].map(month_names)
-    df = df.sort_values('trending_month')
+    month_col = 'month' if 'month' in df.columns else 'trending_month'
+    df = pd.DataFrame({
+        'month': df[month_col].to_numpy(),
+        'month_name': df[month_col].map(month_names).to_numpy(),
+        'count': df['count'].to_numpy(),
+    }).sort_values('month')
 
     fig, ax = plt.subplots(figsize=(10, 5))
     sns.barplot(data=df, x='month_name', y='count', hue='month_name', dodge=False, palette='Blues', ax=ax, legend=False)
@@ -378,14 +438,13 @@ def plot_clickbait_effect_alternative(df: pd.DataFrame):
     import pandas as pd
 
     # Convert clickbait boolean to string for labeling
-    df = df.copy()
-    df['clickbait_in_title'] = df['clickbait_in_title'].map({True: 'Clickbait', False: 'No Clickbait'})
+    labels = df['clickbait_in_title'].map({True: 'Clickbait', False: 'No Clickbait'})
 
     metrics = ['views', 'likes', 'comment_count']
     fig, axes = plt.subplots(nrows=3, ncols=1, figsize=(14, 12), sharex=True)
 
     for i, metric in enumerate(metrics):
-        pivot_df = df.pivot(index='category_name', columns='clickbait_in_title', values=metric)
+        pivot_df = df[metric].groupby([df['category_name'], labels], observed=True).mean().unstack()
         pivot_df.plot(kind='bar', ax=axes[i], colormap='Set2')
         axes[i].set_title(f'Average {metric.capitalize()} by Category and Clickbait')
         axes[i].set_ylabel(metric.capitalize())
@@ -399,12 +458,13 @@ def plot_clickbait_effect_alternative(df: pd.DataFrame):
 
 
 
-def plot_channel_category_heatmap(df, top_n=10):
+def plot_channel_category_heatmap(df, top_n=10, approximate=False):
     """
     Heatmap showing how often each top channel appears under each category.
+    Set approximate=True to pick the top channels from a row sample (``approximate_top_k``).
     Returns the figure object.
     """
-    top_channels = df['channel_title'].value_counts().head(top_n).index
+    top_channels = top_k_keys(df['channel_title'], top_n, approximate=approximate)
     filtered = df[df['channel_title'].isin(top_channels)]
 
     pivot = (
@@ -0,0 +1,110 @@
+import numpy as np
+import pandas as pd
+from matplotlib.colors import LogNorm
+
+from src.analysis.sampling import stratified_positions
+
+# Above this many points, scatter plots switch to density rendering
+DEFAULT_MAX_POINTS = 50_000
+
+
+def annotate_points(ax, x, y, labels, offset=(6, 0), max_labels=None, **text_kwargs):
+    """
+    Label points with text placed at a fixed offset in screen points.
+
+    Positions and labels are converted to plain arrays once, instead of
+    iterating over DataFrame rows, and the offset is in points so it does not
+    depend on the data scale.
+
+    Parameters:
+        ax (matplotlib.axes.Axes): Axes to draw on.
+        x, y (array-like): Point coordinates.
+        labels (array-like): Text for each point.
+        offset (tuple): (dx, dy) offset in points. Defaults to (6, 0).
+        max_labels (int, optional): Label only the first ``max_labels`` points,
+            keeping the number of text artists bounded.
+        **text_kwargs: Passed to ``ax.annotate`` (e.g. ``fontsize``).
+
+    Returns:
+        list: The created annotations.
+    """
+    x = np.asarray(x, dtype=float)[:max_labels]
+    y = np.asarray(y, dtype=float)[:max_labels]
+    labels = np.asarray(labels, dtype=object)[:max_labels].astype(str)
+    keep = np.isfinite(x) & np.isfinite(y)
+    text_kwargs.setdefault("fontsize", 9)
+    text_kwargs.setdefault("va", "center")
+    return [
+        ax.annotate(label, (xi, yi), xytext=offset, textcoords="offset points", **text_kwargs)
+        for xi, yi, label in zip(x[keep].tolist(), y[keep].tolist(), labels[keep].tolist())
+    ]
+
+
+def density_scatter(ax, x, y, kind="hexbin", gridsize=80, xscale="linear", yscale="linear", cmap="viridis"):
+    """
+    Draw the density of many (x, y) points as a hexbin or 2-D histogram.
+
+    The number of drawn cells is bounded by ``gridsize``, so rendering cost
+    does not grow with the number of points. Counts use a log color scale.
+
+    Parameters:
+        ax (matplotlib.axes.Axes): Axes to draw on.
+        x, y (array-like): Point coordinates; non-finite points are skipped.
+        kind (str): 'hexbin' or 'hist2d'.
+        gridsize (int): Cells along the x-axis. Defaults to 80.
+        xscale, yscale (str): 'linear' or 'log' binning and axis scale.
+        cmap (str): Colormap name.
+
+    Returns:
+        matplotlib.collections.Collection: The density artist (for a colorbar).
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    keep = np.isfinite(x) & np.isfinite(y)
+    if xscale == "log":
+        keep &= x > 0
+    if yscale == "log":
+        keep &= y > 0
+    x, y = x[keep], y[keep]
+
+    if kind == "hexbin":
+        return ax.hexbin(x, y, gridsize=gridsize, xscale=xscale, yscale=yscale, mincnt=1, bins="log", cmap=cmap)
+    if kind != "hist2d":
+        raise ValueError("kind must be 'hexbin' or 'hist2d'.")
+
+    def edges(values, scale):
+        if not len(values):
+            return np.linspace(0, 1, gridsize + 1)
+        if scale == "log":
+            return np.geomspace(values.min(), values.max() * (1 + 1e-9), gridsize + 1)
+        return np.linspace(values.min(), values.max() + 1e-9, gridsize + 1)
+
+    counts, x_edges, y_edges = np.histogram2d(x, y, bins=[edges(x, xscale), edges(y, yscale)])
+    mesh = ax.pcolormesh(x_edges, y_edges, np.ma.masked_equal(counts.T, 0), norm=LogNorm(), cmap=cmap)
+    ax.set_xscale(xscale)
+    ax.set_yscale(yscale)
+    return mesh
+
+
+def sampled_overlay(ax, x, y, n=2000, strata=None, seed=0, **scatter_kwargs):
+    """
+    Scatter a stratified sample of at most about ``n`` points on top of a density plot.
+
+    Parameters:
+        ax (matplotlib.axes.Axes): Axes to draw on.
+        x, y (array-like): Point coordinates.
+        n (int): Number of points to draw. Defaults to 2000.
+        strata (array-like, optional): Group per point (e.g. category); each
+            group is sampled in proportion to its size and at least once.
+        seed (int): Seed of the sample.
+        **scatter_kwargs: Passed to ``ax.scatter``.
+
+    Returns:
+        np.ndarray: Positions of the drawn points.
+    """
+    x = np.asarray(x, dtype=float)
+    positions = stratified_positions(strata, n, seed=seed, n_rows=len(x))
+    scatter_kwargs.setdefault("s", 6)
+    scatter_kwargs.setdefault("alpha", 0.6)
+    ax.scatter(x[positions], np.asarray(y, dtype=float)[positions], **scatter_kwargs)
+    return positions
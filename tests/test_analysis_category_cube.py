@@ -0,0 +1,46 @@
+import pytest
+import numpy as np
+import pandas as pd
+
+from pathlib import Path
+import sys
+
+project_root = Path(__file__).resolve().parent.parent
+sys.path.append(str(project_root))
+
+from src.analysis.category_cube import CategoryDayCube
+
+@pytest.fixture
+def daily_df():
+    return pd.DataFrame({
+        'date': pd.to_datetime(['2023-01-01', '2023-01-02', '2023-01-04', '2023-02-01', '2023-01-01']),
+        'category': ['A', 'A', 'A', 'A', 'B'],
+        'views': [10, 20, 30, 120, 5]
+    })
+
+def test_cube_is_dense_and_does_not_mutate(daily_df):
+    before = daily_df.copy()
+    cube = CategoryDayCube.from_frame(daily_df, 'category', 'views')
+    assert cube.values.shape == (2, 32)  # 2023-01-01 .. 2023-02-01
+    assert cube.values[0, 3] == 30
+    assert cube.counts[1].sum() == 1
+    pd.testing.assert_frame_equal(daily_df, before)
+
+def test_monthly_growth_and_top_n(daily_df):
+    cube = CategoryDayCube.from_frame(daily_df, 'category', 'views')
+    growth = cube.growth('M')
+    assert growth.loc[pd.Timestamp('2023-02-01'), 'A'] == pytest.approx(100.0)  # 60 -> 120
+    assert cube.top_categories(1) == ['A']
+    assert list(cube.growth('M', top_n=1).columns) == ['A']
+
+def test_rolling_average(daily_df):
+    cube = CategoryDayCube.from_frame(daily_df, 'category', 'views')
+    rolling = cube.rolling(3)
+    assert np.isnan(rolling['A'].iloc[1])
+    assert rolling.loc[pd.Timestamp('2023-01-03'), 'A'] == pytest.approx(10.0)
+    assert rolling.loc[pd.Timestamp('2023-01-04'), 'A'] == pytest.approx(50 / 3)
+
+def test_growth_report_keys(daily_df):
+    cube = CategoryDayCube.from_frame(daily_df, 'category', 'views')
+    report = cube.growth_report(freqs=('W', 'M'), windows=(7,))
+    assert set(report) == {'growth_W', 'growth_M', 'rolling_7d'}
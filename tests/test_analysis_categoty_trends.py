@@ -1,4 +1,5 @@
 import pytest
+import numpy as np
 import pandas as pd
 
 from pathlib import Path
@@ -82,6 +83,21 @@ def test_analyze_top_tags_by_category():
     assert 'A' in result
     assert isinstance(result['A'], pd.DataFrame)
 
+def test_approximate_top_tags_sample_videos():
+    rng = np.random.default_rng(0)
+    n = 30_000
+    df = pd.DataFrame({
+        'tags': np.where(rng.random(n) < 0.6, '"Music"|live', 'vlog|[none]|' + pd.Series(rng.integers(0, 500, n)).astype(str)),
+        'category_name': rng.choice(['Music', 'People'], n),
+    })
+    exact = category_trends.analyze_top_tags_by_category(df, top_n=2)
+    approx = category_trends.analyze_top_tags_by_category(df, top_n=2, approximate=True, epsilon=0.01)
+    for category in ['Music', 'People']:
+        estimated = approx[category].set_index('tag')['count']
+        counts = exact[category].set_index('tag')['count']
+        assert set(estimated.index) == set(counts.index) == {'music', 'live'}
+        np.testing.assert_allclose(estimated.reindex(counts.index), counts, rtol=0.1)
+
 def test_analyze_clickbait_effect_by_category():
     df = pd.DataFrame({
         'title': ['Amazing video', 'normal video'],
@@ -115,3 +131,21 @@ def test_analyze_channel_format_category_consistency():
     result = category_trends.analyze_channel_format_category_consistency(df, min_trending=5)
     assert 'channel_title' in result.columns
     assert 'category_consistency' in result.columns
+
+def test_channel_and_tag_summaries_dedupe_reuploads():
+    df = pd.DataFrame({
+        'title': ['Song A official video', 'Song A (official video)', 'Song A official video', 'Other'],
+        'channel_title': ['label', 'reuploader', 'label', 'reuploader'],
+        'video_id': [1, 2, 1, 3],
+        'views': [100, 50, 200, 10],
+        'likes': [1, 1, 2, 1],
+        'category_name': ['x', 'x', 'x', 'y'],
+        'tags': ['song|a', 'song|a', 'song|a', 'other'],
+        'publish_time': pd.to_datetime(['2018-01-01', '2018-01-05', '2018-01-01', '2018-01-02']),
+    })
+    summary = category_trends.summarize_top_trending_channels(df, dedupe=True).set_index('channel_title')
+    assert summary.loc['reuploader', 'trending_count'] == 1
+    assert summary.loc['label', 'trending_count'] == 2
+    tags = category_trends.analyze_top_tags_by_category(df, dedupe=True)
+    assert tags['x'].set_index('tag').loc['song', 'count'] == 2
+    assert 'duplicate_cluster' not in df.columns
@@ -0,0 +1,73 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from pathlib import Path
+import sys
+
+project_root = Path(__file__).resolve().parent.parent
+sys.path.append(str(project_root))
+
+from src.analysis.change_points import build_category_day_series, detect_change_points, detect_spikes
+
+@pytest.fixture
+def series():
+    # 20 noisy series of 300 days; each doubles its level on its own day, and all spike on day 150
+    rng = np.random.default_rng(0)
+    shifts = rng.integers(40, 260, 20)
+    values = np.full((20, 300), 1_000.0)
+    values[np.arange(300) >= shifts[:, None]] *= 2
+    values += rng.normal(0, 40, values.shape)
+    values[:, 150] += 800
+    index = pd.MultiIndex.from_product([['US', 'CA'], [f'cat{i}' for i in range(10)]],
+                                       names=['country', 'category_name'])
+    days = pd.DatetimeIndex(pd.date_range('2018-01-01', periods=300), name='trending_date')
+    return pd.DataFrame(values, index=index, columns=days), shifts
+
+def test_build_category_day_series_matches_groupby():
+    rng = np.random.default_rng(0)
+    n = 5_000
+    df = pd.DataFrame({
+        'country': rng.choice(['US', 'CA'], n),
+        'category_name': rng.choice(['Music', 'News', 'Gaming'], n),
+        'trending_date': pd.Timestamp('2018-01-01') + pd.to_timedelta(rng.integers(0, 60, n), 'D'),
+        'views': rng.integers(0, 1000, n),
+    })
+    df.loc[::100, 'category_name'] = None
+    matrix = build_category_day_series(df)
+    assert matrix.shape == (6, 60)
+    expected = df.groupby(['country', 'category_name', 'trending_date'])['views'].sum()
+    np.testing.assert_allclose(matrix.stack().loc[expected.index], expected)
+    assert matrix.to_numpy().sum() == expected.sum()
+    single = build_category_day_series(df, by=['category_name'])
+    assert list(single.index) == ['Gaming', 'Music', 'News']
+
+def test_change_points_found_in_every_series(series):
+    matrix, shifts = series
+    changes = detect_change_points(matrix, min_size=7)
+    for (country, category), shift in zip(matrix.index, shifts):
+        found = changes[(changes['country'] == country) & (changes['category_name'] == category)]
+        offsets = (found['trending_date'] - matrix.columns[0]).dt.days
+        assert (np.abs(offsets - shift) <= 2).any()
+    # The strongest change of a series is its doubling (the spike can split a segment nearby)
+    strongest = changes.loc[changes.groupby(['country', 'category_name'])['gain'].idxmax()]
+    assert strongest['relative_change'].median() == pytest.approx(1.0, abs=0.05)
+    # One change point per series at most when asked for
+    top = detect_change_points(matrix, max_change_points=1)
+    assert top.groupby(['country', 'category_name']).size().max() == 1
+
+def test_change_points_ignore_pure_noise():
+    rng = np.random.default_rng(1)
+    noise = pd.DataFrame(rng.normal(100, 5, (50, 365)))
+    assert len(detect_change_points(noise)) <= 5
+
+def test_spikes_flag_the_outlier_day(series):
+    matrix, _ = series
+    spikes = detect_spikes(matrix)
+    on_day = spikes[spikes['trending_date'] == matrix.columns[150]]
+    assert len(on_day) == len(matrix)
+    assert (on_day['direction'] == 'spike').all() and (on_day['z_score'] > 3.5).all()
+    # Nothing is scored before a full window of history
+    assert (spikes['trending_date'] >= matrix.columns[28]).all()
+    flat = pd.DataFrame(np.ones((2, 60)))
+    assert detect_spikes(flat).empty
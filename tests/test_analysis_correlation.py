@@ -0,0 +1,76 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from pathlib import Path
+import sys
+
+project_root = Path(__file__).resolve().parent.parent
+sys.path.append(str(project_root))
+
+from src.analysis.correlation import grouped_correlation, bootstrap_correlation, _rank_rows
+from src.analysis.engagement import engagement_correlation_by_category
+
+@pytest.fixture
+def sample_df():
+    rng = np.random.default_rng(0)
+    n = 600
+    x = rng.normal(size=n)
+    return pd.DataFrame({
+        'category_name': rng.choice(['Music', 'Gaming', 'News'], size=n),
+        'x': x,
+        'y': 2 * x + rng.normal(size=n),
+        'z': np.round(rng.normal(size=n)),  # many ties
+    })
+
+@pytest.mark.parametrize('method', ['pearson', 'spearman'])
+def test_grouped_correlation_matches_pandas(sample_df, method):
+    result = grouped_correlation(sample_df, ['x', 'y', 'z'], by='category_name', method=method)
+    expected = sample_df.groupby('category_name')[['x', 'y', 'z']].corr(method=method)
+    np.testing.assert_allclose(result.to_numpy(), expected.to_numpy(), atol=1e-12)
+    assert list(result.index) == list(expected.index)
+
+def test_grouped_correlation_small_groups_are_nan():
+    df = pd.DataFrame({'g': ['a', 'a', 'b', 'b', 'b'], 'x': [1, 2, 1, 2, 3], 'y': [2, 1, 1, 3, 2]})
+    result = grouped_correlation(df, ['x', 'y'], by='g')
+    assert result.loc['a'].isna().all().all()
+    assert result.loc[('b', 'x'), 'y'] == pytest.approx(0.5)
+
+def test_rank_rows_averages_ties():
+    values = np.array([[3.0, 1.0, 3.0, 2.0], [1.0, 1.0, 1.0, 0.0]])
+    expected = np.array([pd.Series(row).rank().to_numpy() for row in values])
+    np.testing.assert_array_equal(_rank_rows(values), expected)
+
+def test_bootstrap_is_reproducible_and_independent_of_workers(sample_df):
+    kwargs = dict(by='category_name', n_boot=200, seed=7, max_batch_elements=5_000)
+    serial = bootstrap_correlation(sample_df, 'x', ['y', 'z'], n_jobs=1, **kwargs)
+    parallel = bootstrap_correlation(sample_df, 'x', ['y', 'z'], n_jobs=4, **kwargs)
+    pd.testing.assert_frame_equal(serial, parallel)
+
+    row = serial.set_index(['category_name', 'variable']).loc[('Music', 'y')]
+    assert row['ci_lower'] < row['correlation'] < row['ci_upper']
+    assert row['correlation'] == pytest.approx(
+        sample_df[sample_df['category_name'] == 'Music'][['x', 'y']].corr().iloc[0, 1])
+
+def test_bootstrap_spearman_interval_contains_estimate(sample_df):
+    result = bootstrap_correlation(sample_df, 'x', 'y', method='spearman', n_boot=300, seed=1)
+    assert list(result.columns) == ['variable', 'n', 'correlation', 'ci_lower', 'ci_upper']
+    assert result['ci_lower'].iloc[0] < result['correlation'].iloc[0] < result['ci_upper'].iloc[0]
+    assert result['correlation'].iloc[0] == pytest.approx(sample_df[['x', 'y']].corr('spearman').iloc[0, 1])
+
+def test_engagement_correlation_by_category():
+    df = pd.DataFrame({
+        'category_name': ['Music'] * 4 + ['News'] * 4,
+        'views': [100, 200, 300, 400, 50, 60, 70, 80],
+        'likes': [10, 20, 30, 40, 8, 6, 7, 5],
+        'dislikes': [1, 2, 3, 4, 1, 1, 2, 2],
+        'comment_count': [5, 4, 3, 2, 1, 2, 3, 4],
+        'days_to_trend': [1, 1, 1, 1, 1, 1, 1, 0],
+    })
+    result = engagement_correlation_by_category(df, n_boot=0)
+    assert set(result['variable']) == {'avg_likes_per_day', 'avg_dislikes_per_day', 'avg_comments_per_day'}
+    music = result[result['category_name'] == 'Music'].set_index('variable')['correlation']
+    assert music['avg_likes_per_day'] == pytest.approx(1.0)
+    assert music['avg_comments_per_day'] == pytest.approx(-1.0)
+    assert result.loc[result['category_name'] == 'News', 'n'].iloc[0] == 3
+    assert result['ci_lower'].isna().all()
@@ -0,0 +1,49 @@
+import pytest
+import pandas as pd
+
+from pathlib import Path
+import sys
+
+project_root = Path(__file__).resolve().parent.parent
+sys.path.append(str(project_root))
+
+from src.analysis.date_index import DateRangeIndex, build_date_indexes
+from src.analysis.category_trends import filter_trends
+
+@pytest.fixture
+def dated_df():
+    return pd.DataFrame({
+        'date': pd.to_datetime(['2023-03-01', '2023-01-01', '2023-02-01', '2023-02-01', None]),
+        'country': ['US', 'CA', 'US', 'CA', 'US'],
+        'views': [30, 10, 20, 25, 99]
+    })
+
+def test_range_matches_mask_filter(dated_df):
+    index = DateRangeIndex(dated_df)
+    result = index.range('2023-02-01', '2023-03-01')
+    expected = filter_trends(dated_df, start_date='2023-02-01', end_date='2023-03-01')
+    assert sorted(result['views']) == sorted(expected['views'])
+    assert result['date'].is_monotonic_increasing
+
+def test_filter_trends_accepts_index(dated_df):
+    index = DateRangeIndex(dated_df)
+    assert len(filter_trends(index, start_date='2023-02-01')) == 3
+    assert len(filter_trends(index, end_date='2022-12-31')) == 0
+
+def test_filter_trends_sorted_frame_fast_path(dated_df):
+    sorted_df = dated_df.dropna().sort_values('date')
+    filtered = filter_trends(sorted_df, start_date='2023-01-15', end_date='2023-02-01')
+    assert list(filtered['views']) == [20, 25]
+
+def test_iter_days_and_windows(dated_df):
+    index = DateRangeIndex(dated_df)
+    days = [(day, len(rows)) for day, rows in index.iter_days()]
+    assert days == [(pd.Timestamp('2023-01-01'), 1), (pd.Timestamp('2023-02-01'), 2), (pd.Timestamp('2023-03-01'), 1)]
+    windows = {day: rows['views'].sum() for day, rows in index.iter_windows(window_days=31)}
+    assert windows[pd.Timestamp('2023-02-01')] == 45  # 2023-01-02 .. 2023-02-01
+    assert windows[pd.Timestamp('2023-03-01')] == 75  # 2023-01-30 .. 2023-03-01
+
+def test_build_date_indexes(dated_df):
+    indexes = build_date_indexes(dated_df)
+    assert set(indexes) == {'CA', 'US'}
+    assert len(indexes['US'].range('2023-01-01', '2023-12-31')) == 2
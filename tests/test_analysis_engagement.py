@@ -15,6 +15,8 @@ from src.analysis.engagement import (
     like_dislike_ratio_vs_views,
     engagement_disabled_analysis,
     compare_status_impact,
+    build_distribution_sketches,
+    summarize_distribution_by_category,
 )
 
 @pytest.fixture
@@ -67,3 +69,25 @@ def test_compare_status_impact(sample_df):
     result = compare_status_impact(sample_df)
     assert isinstance(result, pd.DataFrame)
     assert ("comments_disabled", "views") in result.index
+
+def test_summarize_distribution_by_category(sample_df):
+    result = summarize_distribution_by_category(sample_df)
+    assert list(result.columns) == ["category_name", "count", "mean", "p50", "p90", "p99"]
+    music = result.set_index("category_name").loc["Music"]
+    assert music["count"] == 2 and music["mean"] == 1500
+    assert music["p50"] == 1500
+
+def test_summarize_distribution_of_empty_frame(sample_df):
+    result = summarize_distribution_by_category(sample_df.iloc[:0])
+    assert list(result.columns) == ["category_name", "count", "mean", "p50", "p90", "p99"]
+    assert result.empty
+
+def test_distribution_sketches_merge_across_countries(sample_df):
+    us = build_distribution_sketches(sample_df.assign(country="US"))
+    ca = build_distribution_sketches(sample_df.assign(country="CA"))
+    for metric, sketch in us.items():
+        sketch.merge(ca[metric])
+    result = summarize_distribution_by_category(us, "engagement_rate", by=["category_name", "country"])
+    assert len(result) == 4
+    assert result["count"].tolist() == [1, 1, 2, 2]  # zero views have no engagement rate
+
@@ -0,0 +1,27 @@
+import numpy as np
+import pandas as pd
+
+from pathlib import Path
+import sys
+
+project_root = Path(__file__).resolve().parent.parent
+sys.path.append(str(project_root))
+
+from src.analysis.group_utils import grouped_mode, count_delimited
+
+def test_grouped_mode_matches_pandas_mode():
+    df = pd.DataFrame({
+        'channel_title': ['a', 'a', 'a', 'b', 'b', 'c'],
+        'category_name': ['y', 'x', 'y', 'z', 'x', None],
+    })
+    mode = grouped_mode(df['channel_title'], df['category_name'], default='N/A')
+    assert mode.to_dict() == {'a': 'y', 'b': 'x', 'c': 'N/A'}  # tie in 'b' -> smallest value
+    assert mode.index.name == 'channel_title'
+
+def test_grouped_mode_without_default_drops_empty_groups():
+    mode = grouped_mode(pd.Series(['a', 'b']), pd.Series([1, np.nan]))
+    assert list(mode.index) == ['a']
+
+def test_count_delimited():
+    tags = pd.Series(['a|b|c', 'single', None, '"x"|"y"'])
+    assert count_delimited(tags).tolist() == [3, 1, 1, 2]
@@ -0,0 +1,83 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from pathlib import Path
+import sys
+
+project_root = Path(__file__).resolve().parent.parent
+sys.path.append(str(project_root))
+
+from src.analysis.near_duplicates import (
+    DUPLICATE_CLUSTER_COLUMN,
+    add_duplicate_clusters,
+    drop_near_duplicates,
+    find_near_duplicates,
+    lsh_clusters,
+    minhash_signatures,
+    normalize_titles,
+)
+
+@pytest.fixture
+def uploads():
+    # The first two titles are a reupload of the same video by another channel
+    return pd.DataFrame({
+        'title': ['Official Music Video - Song A', 'official music video: song A!!',
+                  'Official Music Video - Song A', 'Cooking pasta at home', None, 'ab'],
+        'tags': ['music|"song a"', 'music|song a', 'music|"song a"', 'food|pasta', 'x', 'y'],
+        'channel_title': ['label', 'reuploader', 'label', 'chef', 'nobody', 'short'],
+        'publish_time': pd.to_datetime(['2018-01-01', '2018-01-03', '2018-01-01',
+                                        '2018-01-02', '2018-01-02', '2018-01-02']),
+    })
+
+def test_normalize_titles():
+    titles = normalize_titles(pd.Series(['Hello,  World!!', None, '__A_b__']))
+    assert titles[0] == 'hello world'
+    assert pd.isna(titles[1])
+    assert titles[2] == 'a b'
+
+def test_signature_agreement_estimates_jaccard():
+    base = 'the quick brown fox jumps over the lazy dog'
+    signatures = minhash_signatures([base, base + ' again', 'completely unrelated words'], num_perm=256)
+    assert signatures.dtype == np.uint64 and signatures.shape == (3, 256)
+    assert (signatures[0] == signatures[1]).mean() > 0.6
+    assert (signatures[0] == signatures[2]).mean() < 0.1
+    with pytest.raises(ValueError):
+        minhash_signatures([base], k=4)
+
+def test_find_near_duplicates(uploads):
+    clusters = find_near_duplicates(uploads)
+    assert clusters.dtype == np.int64
+    assert clusters[0] == clusters[1] == clusters[2]
+    assert len({clusters[0], clusters[3], clusters[5]}) == 3
+    assert clusters[4] == -1
+    with_tags = add_duplicate_clusters(uploads, include_tags=True)
+    assert DUPLICATE_CLUSTER_COLUMN not in uploads.columns
+    assert with_tags[DUPLICATE_CLUSTER_COLUMN].iloc[0] == with_tags[DUPLICATE_CLUSTER_COLUMN].iloc[1]
+
+def test_drop_near_duplicates_keeps_original_channel(uploads):
+    kept = drop_near_duplicates(uploads)
+    assert kept.index.tolist() == [0, 2, 3, 4, 5]
+    assert 'reuploader' not in kept['channel_title'].tolist()
+
+def test_titles_without_text_are_never_deduplicated():
+    uploads = pd.DataFrame({
+        'title': ['🔥🔥🔥', '???', '💯💯', '!!!'],
+        'channel_title': ['a', 'b', 'c', 'd'],
+        'publish_time': pd.to_datetime(['2018-01-01', '2018-01-02', '2018-01-03', '2018-01-04']),
+    })
+    assert normalize_titles(uploads['title']).isna().all()
+    assert (find_near_duplicates(uploads, include_tags=True) == -1).all()
+    assert len(drop_near_duplicates(uploads)) == 4
+
+def test_lsh_clusters_on_random_titles():
+    rng = np.random.default_rng(0)
+    words = np.array(['news', 'live', 'music', 'video', 'official', 'trailer', 'game', 'show',
+                      'vlog', 'today', 'best', 'funny', 'review', 'episode', 'new', 'top'])
+    titles = [' '.join(rng.choice(words, 8)) + f' {i}' for i in range(500)]
+    # Every tenth title gets a copy with a changed suffix
+    titles += [titles[i][:-len(str(i))] + 'x' + str(i) for i in range(0, 500, 10)]
+    clusters = lsh_clusters(minhash_signatures(titles))
+    copies = np.arange(500, len(titles))
+    np.testing.assert_array_equal(clusters[copies], clusters[np.arange(0, 500, 10)])
+    assert len(np.unique(clusters)) >= 480
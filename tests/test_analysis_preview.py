@@ -0,0 +1,95 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from pathlib import Path
+import sys
+
+project_root = Path(__file__).resolve().parent.parent
+sys.path.append(str(project_root))
+
+from src.analysis.preview import (
+    build_preview_sample,
+    load_preview_sample,
+    preview_cache_path,
+    estimate_population,
+    is_preview,
+)
+from src.analysis.engagement import summarize_engagement_by_category_df
+
+@pytest.fixture
+def trending_df():
+    rng = np.random.default_rng(0)
+    n = 20_000
+    return pd.DataFrame({
+        'video_id': [f'v{i}' for i in range(n)],
+        'country': rng.choice(['US', 'CA'], n),
+        'category_name': rng.choice(['Music', 'Gaming', 'News'], n, p=[0.6, 0.3, 0.1]),
+        'trending_date': pd.Timestamp('2018-01-01') + pd.to_timedelta(rng.integers(0, 120, n), 'D'),
+        'views': rng.lognormal(10, 0.5, n).round(),
+        'likes': rng.integers(0, 1000, n),
+        'comment_count': rng.integers(0, 100, n),
+    })
+
+def test_sample_is_stratified_and_weighted(trending_df):
+    sample = build_preview_sample(trending_df, 0.1, seed=1)
+    assert is_preview(sample) and not is_preview(trending_df)
+    assert len(sample) == pytest.approx(2000, abs=50)
+    # Weights add up to the population size of every stratum
+    assert sample['preview_weight'].sum() == pytest.approx(len(trending_df))
+    by_category = sample.groupby('category_name')['preview_weight'].sum()
+    assert by_category.to_dict() == pytest.approx(trending_df['category_name'].value_counts().to_dict())
+    # Analysis functions run on the sample unchanged
+    assert set(summarize_engagement_by_category_df(sample)['category_name']) == {'Music', 'Gaming', 'News'}
+
+def test_estimates_cover_full_data(trending_df):
+    sample = build_preview_sample(trending_df, 0.1, seed=2)
+    estimates = estimate_population(sample, ['views'], by='category_name').set_index(['category_name', 'statistic'])
+    truth = trending_df.groupby('category_name')['views'].agg(['size', 'sum', 'mean'])
+    truth.columns = ['count', 'total_views', 'mean_views']
+    truth = truth.stack().rename_axis(['category_name', 'statistic'])
+    # Counts per category are strata sums, so they are exact
+    counts = estimates.xs('count', level='statistic')
+    np.testing.assert_allclose(counts['estimate'], truth.xs('count', level='statistic').sort_index())
+    # Within three standard errors for totals and means
+    joined = estimates.join(truth.rename('truth'))
+    assert (np.abs(joined['estimate'] - joined['truth']) <= 3 * joined['std_error'] + 1e-6).all()
+    assert (joined['ci_lower'] <= joined['estimate']).all()
+
+def test_concatenated_country_samples_keep_their_strata(trending_df):
+    samples = [build_preview_sample(part, 0.1, by=['category_name'], seed=3)
+               for _, part in trending_df.groupby('country')]
+    assert samples[0]['preview_sample'].iloc[0] != samples[1]['preview_sample'].iloc[0]
+    combined = pd.concat(samples, ignore_index=True)
+    counts = estimate_population(combined, by='country').set_index('country')
+    np.testing.assert_allclose(counts['estimate'], trending_df['country'].value_counts().sort_index())
+    # Each country is a union of its own strata, so its count is exact
+    np.testing.assert_allclose(counts['std_error'], 0, atol=1e-9)
+
+def test_full_data_estimates_are_exact(trending_df):
+    result = estimate_population(trending_df, ['views'])
+    assert result['statistic'].tolist() == ['count', 'total_views', 'mean_views']
+    np.testing.assert_allclose(result['estimate'],
+                               [len(trending_df), trending_df['views'].sum(), trending_df['views'].mean()])
+    assert (result['std_error'] == 0).all()
+
+def test_sample_is_persisted(tmp_path, trending_df):
+    source = tmp_path / 'USvideos.csv'
+    source.write_text('x')
+    path = preview_cache_path(source, 0.05)
+    calls = []
+
+    def build():
+        calls.append(1)
+        return trending_df
+
+    first = load_preview_sample(build, path, 0.05, source_path=source)
+    second = load_preview_sample(build, path, 0.05, source_path=source)
+    assert path.name == 'USvideos.csv.preview-0.05-0.parquet'
+    assert preview_cache_path(source, 0.05, key='3f2a').name == 'USvideos.csv.preview-0.05-0-3f2a.parquet'
+    assert len(calls) == 1
+    pd.testing.assert_frame_equal(first, second)
+
+def test_invalid_fraction(trending_df):
+    with pytest.raises(ValueError):
+        build_preview_sample(trending_df, 0)
@@ -0,0 +1,67 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from pathlib import Path
+import sys
+
+project_root = Path(__file__).resolve().parent.parent
+sys.path.append(str(project_root))
+
+from src.analysis.rank_dynamics import (
+    RANK_COLUMN,
+    add_daily_ranks,
+    compute_daily_ranks,
+    compute_rank_dynamics,
+    summarize_rank_dynamics_by_category,
+)
+
+@pytest.fixture
+def leaderboard():
+    # Day 1: a > b > c; day 2: b > a > c; day 3: c alone. Country CA is ranked separately.
+    return pd.DataFrame({
+        'video_id': ['a', 'b', 'c', 'a', 'b', 'c', 'c', 'x'],
+        'country': ['US'] * 7 + ['CA'],
+        'category_name': ['Music', 'News', 'News', 'Music', 'News', 'News', 'News', 'Music'],
+        'trending_date': pd.to_datetime(['2018-01-01'] * 3 + ['2018-01-02'] * 3 + ['2018-01-03', '2018-01-01']),
+        'views': [300, 200, 100, 350, 500, 150, 160, 1],
+    })
+
+def test_daily_ranks_per_country_and_day(leaderboard):
+    ranks = compute_daily_ranks(leaderboard)
+    assert ranks.dtype == np.int16
+    assert ranks.tolist() == [1, 2, 3, 2, 1, 3, 1, 1]
+    with_ranks = add_daily_ranks(leaderboard)
+    assert with_ranks[RANK_COLUMN].dtype == np.int16
+    assert RANK_COLUMN not in leaderboard.columns
+
+def test_daily_ranks_match_groupby_rank():
+    rng = np.random.default_rng(0)
+    n = 20_000
+    df = pd.DataFrame({
+        'country': rng.choice(['US', 'CA', 'GB', 'DE'], n),
+        'trending_date': pd.Timestamp('2018-01-01') + pd.to_timedelta(rng.integers(0, 100, n), 'D'),
+        'views': rng.integers(0, 1_000, n).astype(float),
+    })
+    df.loc[::97, 'views'] = np.nan
+    expected = df.groupby(['country', 'trending_date'])['views'].rank(method='first', ascending=False)
+    np.testing.assert_array_equal(compute_daily_ranks(df), expected.fillna(0).astype(np.int16))
+
+def test_rank_dynamics_per_video(leaderboard):
+    dynamics = compute_rank_dynamics(leaderboard, top_n=1).set_index(['country', 'video_id'])
+    a, b, c = (dynamics.loc[('US', v)] for v in 'abc')
+    assert (a['entry_rank'], a['exit_rank'], a['best_rank']) == (1, 2, 1)
+    assert a['rank_velocity'] == -1
+    assert a['days_in_top'] == 1 and a['exited_top'] and not a['entered_top']
+    assert b['entered_top'] and b['days_to_best'] == 1
+    # c climbs from 3 to 1 over two days
+    assert c['rank_velocity'] == 1 and c['best_rank'] == 1 and c['days_to_best'] == 2
+    assert np.isnan(dynamics.loc[('CA', 'x'), 'rank_velocity'])
+
+def test_rank_dynamics_by_category(leaderboard):
+    summary = summarize_rank_dynamics_by_category(leaderboard, top_n=1).set_index('category_name')
+    assert summary.loc['News', 'videos'] == 2
+    assert summary.loc['Music', 'top_share'] == 1.0
+    assert summary.loc['News', 'entries'] == 2
+    assert summary.loc['Music', 'exits'] == 1
+    assert summary.loc['Music', 'mean_entry_rank'] == 1.0
@@ -0,0 +1,35 @@
+import numpy as np
+import pandas as pd
+
+from pathlib import Path
+import sys
+
+project_root = Path(__file__).resolve().parent.parent
+sys.path.append(str(project_root))
+
+from src.analysis.sampling import stratified_positions, stratified_sample
+
+def test_stratified_positions_proportional_with_minimum():
+    strata = pd.Series(['a'] * 900 + ['b'] * 95 + ['c'] * 5)
+    positions = stratified_positions(strata, 100, seed=1, min_per_stratum=2)
+    counts = strata.iloc[positions].value_counts()
+    assert counts.to_dict() == {'a': 90, 'b': 9, 'c': 2}  # 'c' is raised to the minimum
+    assert np.all(np.diff(positions) > 0)
+    np.testing.assert_array_equal(positions, stratified_positions(strata, 100, seed=1, min_per_stratum=2))
+
+def test_stratified_positions_skips_missing_and_returns_all_when_small():
+    strata = pd.Series(['a', None, 'b'])
+    np.testing.assert_array_equal(stratified_positions(strata, 10), [0, 2])
+    assert len(stratified_positions(None, 5, n_rows=100)) == 5
+    # Largest remainders fill the sample up to exactly n
+    assert len(stratified_positions(pd.Series(['a', 'b', 'c'] * 10), 10)) == 10
+
+def test_stratified_sample_multiple_columns():
+    df = pd.DataFrame({
+        'country': ['US', 'US', 'CA', 'CA'] * 50,
+        'category_name': ['Music', 'News'] * 100,
+        'views': range(200),
+    })
+    sample = stratified_sample(df, ['country', 'category_name'], n=20, seed=0)
+    assert len(sample) == 20
+    assert sample.groupby(['country', 'category_name']).size().tolist() == [5, 5, 5, 5]
@@ -0,0 +1,126 @@
+import pytest
+import numpy as np
+import pandas as pd
+
+from pathlib import Path
+import sys
+
+project_root = Path(__file__).resolve().parent.parent
+sys.path.append(str(project_root))
+
+from src.analysis.sketches import (
+    PrioritySample,
+    HyperLogLog,
+    TDigest,
+    approximate_top_k,
+    validate_sketches,
+)
+
+@pytest.fixture
+def skewed_values():
+    rng = np.random.default_rng(0)
+    return np.array([f"channel_{x}" for x in rng.zipf(1.5, 50_000) % 5_000], dtype=object)
+
+def test_priority_samples_merge_across_countries(skewed_values):
+    us = PrioritySample(5_000, seed=1).update(skewed_values[:25_000])
+    ca = PrioritySample(5_000, seed=2).update(pd.Series(skewed_values[25_000:]))
+    assert len(us) == 5_000 and us.threshold > 0
+    top = us.merge(ca).top(5)
+    exact = pd.Series(skewed_values).value_counts().head(5)
+    assert len(us) == 5_000
+    assert set(top['key']) == set(exact.index)
+    assert np.all(np.abs(top['count'].to_numpy() - exact.reindex(top['key']).to_numpy()) <= top['error'])
+
+def test_hyperloglog_merge_within_error(skewed_values):
+    left = HyperLogLog(12).update(skewed_values[:25_000])
+    right = HyperLogLog(12).update(skewed_values[25_000:])
+    exact = len(set(skewed_values))
+    assert left.merge(right).estimate() == pytest.approx(exact, rel=4 * left.relative_error)
+
+def test_weighted_top_k():
+    top = approximate_top_k(['a', 'b', 'a', 'c'], top_n=1, weights=[1, 10, 1, 3])
+    assert top['key'].tolist() == ['b']
+
+def test_approximate_top_k_samples_large_inputs(skewed_values):
+    small = approximate_top_k(skewed_values, top_n=5, epsilon=0.001)
+    exact = pd.Series(skewed_values).value_counts()
+    # 50,000 rows fit the sample of 100 / epsilon rows: counted exactly
+    assert list(small['key']) == list(exact.index[:5])
+    assert small['count'].tolist() == exact.head(5).tolist() and not small['error'].any()
+
+    values = np.tile(skewed_values, 6)
+    top = approximate_top_k(pd.Series(values).astype('category'), top_n=5, epsilon=0.01)
+    truth = (6 * exact).reindex(top['key']).to_numpy()
+    assert set(top['key']) == set(exact.index[:5])
+    assert np.all(np.abs(top['count'] - truth) <= top['error'])
+    weighted = approximate_top_k(values, top_n=3, epsilon=0.01, weights=np.arange(len(values)) % 7)
+    assert len(weighted) == 3 and np.all(weighted['error'] > 0)
+
+def test_empty_tdigest_quantiles():
+    result = TDigest().quantile([0.5, 0.9])
+    assert result.empty and list(result.columns) == [0.5, 0.9]
+
+def test_validate_sketches_report(skewed_values):
+    report = validate_sketches(skewed_values, top_n=5)
+    assert report['top_k_recall'] == 1.0
+    assert {'estimated', 'exact', 'abs_error', 'rel_error'}.issubset(report['top_k'].columns)
+    assert report['nunique_rel_error'] < 0.05
+
+@pytest.fixture
+def grouped_views():
+    rng = np.random.default_rng(0)
+    n = 60_000
+    return pd.DataFrame({
+        'category_name': rng.choice(['Music', 'Gaming', 'News'], n),
+        'country': rng.choice(['US', 'CA'], n),
+        'views': rng.lognormal(11, 2, n),
+    })
+
+def rank_error(values, estimates, q):
+    ordered = np.sort(values)
+    return np.abs(np.searchsorted(ordered, estimates) / len(ordered) - q)
+
+def test_tdigest_quantiles_per_group(grouped_views):
+    q = np.array([0.5, 0.9, 0.99])
+    digest = TDigest().update(grouped_views['views'], [grouped_views['category_name'], grouped_views['country']])
+    assert digest.keys.names == ['category_name', 'country']
+    assert len(digest.means) < len(grouped_views) / 10
+    estimates = digest.quantile(q)
+    for key, group in grouped_views.groupby(['category_name', 'country'])['views']:
+        assert np.all(rank_error(group.to_numpy(), estimates.loc[key].to_numpy(), q) < 0.01)
+    counts = digest.counts()
+    assert counts.sum() == len(grouped_views)
+    exact_means = grouped_views.groupby(['category_name', 'country'])['views'].mean()
+    np.testing.assert_allclose(digest.means_by_group().reindex(exact_means.index), exact_means)
+
+def test_tdigest_chunks_merge_and_rollup(grouped_views):
+    q = [0.5, 0.99]
+    us = grouped_views[grouped_views['country'] == 'US']
+    ca = grouped_views[grouped_views['country'] == 'CA']
+    merged = TDigest().update(us['views'], [us['category_name'], us['country']])
+    for start in range(0, len(ca), 5_000):
+        chunk = ca.iloc[start:start + 5_000]
+        merged.merge(TDigest().update(chunk['views'], [chunk['category_name'], chunk['country']]))
+    by_category = merged.rollup('category_name')
+    assert list(by_category.counts().sort_index()) == list(grouped_views['category_name'].value_counts().sort_index())
+    estimates = by_category.quantile(q)
+    for key, group in grouped_views.groupby('category_name')['views']:
+        assert np.all(rank_error(group.to_numpy(), estimates.loc[key].to_numpy(), q) < 0.01)
+    with pytest.raises(ValueError):
+        merged.merge(TDigest(compression=50))
+
+def test_tdigest_small_groups_are_exact():
+    digest = TDigest().update([1.0, 2.0, 3.0, np.nan, 10.0], ['a', 'a', 'a', 'b', None])
+    assert list(digest.keys) == ['a']
+    assert digest.quantile([0, 0.5, 1]).loc['a'].tolist() == [1.0, 2.0, 3.0]
+
+
+def test_tdigest_weighted_values_match_repeated_values(grouped_views):
+    rounded = grouped_views['views'].round(-3)
+    counts = rounded.value_counts()
+    weighted = TDigest().update(counts.index, weights=counts.to_numpy())
+    repeated = TDigest().update(rounded)
+    assert weighted.counts().iloc[0] == len(rounded)
+    q = [0.1, 0.5, 0.9]
+    assert np.all(rank_error(rounded.to_numpy(), weighted.quantile(q).iloc[0].to_numpy(), q) < 0.01)
+    np.testing.assert_allclose(weighted.means_by_group(), repeated.means_by_group())
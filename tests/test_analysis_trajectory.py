@@ -0,0 +1,77 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from pathlib import Path
+import sys
+
+project_root = Path(__file__).resolve().parent.parent
+sys.path.append(str(project_root))
+
+from src.analysis.trajectory import VideoSegments, build_trajectory_table, compute_snapshot_deltas
+
+@pytest.fixture
+def snapshots():
+    # Rows deliberately out of order; 'a' trends in two countries, 'c' once
+    return pd.DataFrame({
+        'video_id': ['a', 'b', 'a', 'a', 'b', 'c', 'a', 'b'],
+        'country': ['US', 'US', 'US', 'US', 'US', 'US', 'CA', 'US'],
+        'trending_date': pd.to_datetime(['2018-01-03', '2018-01-01', '2018-01-01', '2018-01-02',
+                                         '2018-01-02', '2018-01-05', '2018-01-01', '2018-01-05']),
+        'views': [400, 10, 100, 250, 30, 7, 50, 90],
+        'likes': [4, 1, 1, 2, 3, 0, 0, 9],
+        'category_name': ['Music', 'News', 'Music', 'Music', 'News', 'Gaming', 'Music', 'News'],
+    }, index=np.arange(8) * 10)
+
+def test_segments_sort_by_video_then_date(snapshots):
+    segments = VideoSegments(snapshots)
+    assert segments.by == ['country', 'video_id']
+    assert len(segments) == 4
+    assert segments.keys.values.tolist() == [['US', 'a'], ['US', 'b'], ['US', 'c'], ['CA', 'a']]
+    assert segments.lengths.tolist() == [3, 3, 1, 1]
+    assert snapshots.index[segments.order].tolist() == [20, 30, 0, 10, 40, 70, 50, 60]
+    with pytest.raises(KeyError):
+        VideoSegments(snapshots, by=['channel_title'])
+
+def test_snapshot_deltas(snapshots):
+    deltas = compute_snapshot_deltas(snapshots, metrics=['views', 'missing'])
+    us_a = deltas[(deltas['country'] == 'US') & (deltas['video_id'] == 'a')]
+    assert us_a['day_on_trending'].tolist() == [1, 2, 3]
+    assert us_a['views_delta'].tolist()[1:] == [150, 150]
+    assert us_a['views_growth'].tolist()[1:] == pytest.approx([1.5, 0.6])
+    us_b = deltas[(deltas['country'] == 'US') & (deltas['video_id'] == 'b')]
+    # Three days between the second and third snapshot: growth is per day
+    assert us_b['gap_days'].tolist()[1:] == [1, 3]
+    assert us_b['views_growth'].iloc[2] == pytest.approx(60 / 3 / 30)
+    assert 'missing_delta' not in deltas.columns
+    # Rows stay addressable by their original index
+    assert deltas.at[0, 'views_delta'] == 150
+
+def test_trajectory_table_matches_groupby(snapshots):
+    table = build_trajectory_table(snapshots).set_index(['country', 'video_id'])
+    assert table.loc[('US', 'a'), 'category_name'] == 'Music'
+    assert table['days_on_trending'].to_dict() == snapshots.groupby(['country', 'video_id']).size().to_dict()
+    assert table.loc[('US', 'b'), 'span_days'] == 5
+    assert table.loc[('US', 'b'), 'views_gain'] == 80
+    assert table.loc[('US', 'b'), 'views_peak_gain'] == 60
+    assert table.loc[('US', 'b'), 'views_peak_date'] == pd.Timestamp('2018-01-05')
+    # Ties keep the first peak
+    assert table.loc[('US', 'a'), 'views_peak_date'] == pd.Timestamp('2018-01-02')
+    single = table.loc[('US', 'c')]
+    assert np.isnan(single['views_peak_gain']) and pd.isna(single['views_peak_date'])
+    assert single['views_first'] == single['views_last'] == 7
+
+def test_trajectory_table_on_random_data():
+    rng = np.random.default_rng(0)
+    n = 5_000
+    df = pd.DataFrame({
+        'video_id': rng.integers(0, 400, n),
+        'trending_date': pd.Timestamp('2018-01-01') + pd.to_timedelta(rng.integers(0, 60, n), 'D'),
+        'views': rng.integers(0, 10**6, n),
+    })
+    df.loc[::50, 'trending_date'] = pd.NaT
+    table = build_trajectory_table(df).set_index('video_id').sort_index()
+    ordered = df.dropna(subset=['trending_date']).sort_values(['video_id', 'trending_date'], kind='stable')
+    grouped = ordered.groupby('video_id')['views']
+    np.testing.assert_array_equal(table['views_gain'], grouped.last() - grouped.first())
+    np.testing.assert_allclose(table['views_peak_gain'], grouped.diff().groupby(ordered['video_id']).max())
@@ -0,0 +1,60 @@
+import pytest
+import pandas as pd
+
+from pathlib import Path
+import sys
+
+project_root = Path(__file__).resolve().parent.parent
+sys.path.append(str(project_root))
+
+from src.analysis.trending_cube import build_trending_cube
+from src.analysis.engagement import (
+    summarize_engagement_by_category_df,
+    engagement_disabled_analysis,
+    compare_status_impact,
+)
+from src.analysis.category_trends import trending_by_month, trending_day_distribution
+
+@pytest.fixture
+def sample_df():
+    return pd.DataFrame({
+        "video_id": ["a", "b", "c", "d", "e"],
+        "category_name": ["Music", "Music", "Gaming", "Gaming", "Music"],
+        "trending_date": pd.to_datetime(["2018-01-02", "2018-01-02", "2018-02-05", "2018-03-01", "2018-03-02"]),
+        "publish_weekday": ["Monday", "Monday", "Sunday", "Friday", "Monday"],
+        "views": [1000, 2000, 1500, 0, 500],
+        "likes": [100, 150, 80, 20, 10],
+        "dislikes": [10, 5, 5, 0, 1],
+        "comment_count": [20, 30, 10, 5, 2],
+        "comments_disabled": [False, True, False, True, False],
+        "ratings_disabled": [False, False, True, True, False],
+        "video_error_or_removed": [False, False, False, True, False],
+    })
+
+def test_cube_matches_frame_tables(sample_df):
+    cube = build_trending_cube(sample_df)
+    pd.testing.assert_frame_equal(summarize_engagement_by_category_df(cube),
+                                  summarize_engagement_by_category_df(sample_df), check_dtype=False)
+    pd.testing.assert_frame_equal(engagement_disabled_analysis(cube),
+                                  engagement_disabled_analysis(sample_df), check_dtype=False)
+    pd.testing.assert_frame_equal(compare_status_impact(cube),
+                                  compare_status_impact(sample_df), check_dtype=False)
+
+def test_cube_calendar_tables(sample_df):
+    cube = build_trending_cube(sample_df)
+    by_month = trending_by_month(cube)
+    assert list(by_month["month"]) == [1, 2, 3]
+    assert list(by_month["count"]) == [2, 1, 2]
+    by_weekday = trending_day_distribution(cube)
+    assert by_weekday.loc[by_weekday["weekday"] == "Monday", "count"].item() == 3
+    assert by_weekday["count"].sum() == 5
+
+def test_rollup_and_describe(sample_df):
+    cube = build_trending_cube(sample_df, dimensions=["category_name"])
+    assert len(cube) == 2
+    rolled = cube.rollup(["category_name"], ["count", "sum_views"])
+    assert rolled.set_index("category_name").loc["Music", "sum_views"] == 3500
+    stats = cube.describe(["category_name"], "views").set_index("category_name")
+    assert stats.loc["Music", "std"] == pytest.approx(sample_df.loc[sample_df.category_name == "Music", "views"].std())
+    with pytest.raises(KeyError):
+        cube.rollup(["country"])
@@ -14,3 +14,66 @@ countries = settings['analysis_settings']['country_list']
 
 print(f"Working with countries: {countries}")
 print(f"Data path: {data_dir.resolve()}")
+
+
+import dataclasses
+import os
+import pickle
+import shutil
+
+import pytest
+
+from src import config_loader
+from src.config_loader import Settings, get_settings
+
+
+@pytest.fixture
+def tmp_project(tmp_path, monkeypatch):
+    shutil.copytree(config_loader.PROJECT_ROOT / "config", tmp_path / "config")
+    monkeypatch.setattr(config_loader, "PROJECT_ROOT", tmp_path)
+    config_loader.clear_config_cache()
+    yield tmp_path
+    config_loader.clear_config_cache()
+
+
+def test_typed_settings_match_yaml(tmp_project):
+    typed = get_settings()
+    assert typed.analysis.country_list == tuple(settings["analysis_settings"]["country_list"])
+    assert typed.visualization.plot_dpi == settings["visualization_settings"]["plot_dpi"]
+    assert typed.to_dict() == get_settings_config()
+
+
+def test_settings_cached_immutable_and_picklable(tmp_project):
+    typed = get_settings()
+    assert get_settings() is typed
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        typed.visualization.plot_dpi = 10
+    assert pickle.loads(pickle.dumps(typed)) == typed
+
+
+def test_settings_reloaded_when_file_changes(tmp_project):
+    before = get_settings()
+    path = tmp_project / "config" / "settings.yaml"
+    path.write_text(path.read_text().replace("plot_dpi: 300", "plot_dpi: 150"))
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    assert get_settings().visualization.plot_dpi == 150
+    assert before.visualization.plot_dpi == 300
+
+
+def test_settings_validation():
+    with pytest.raises(ValueError):
+        Settings.from_dict({"visualization_settings": {"plot_dpi": "high"}})
+    with pytest.raises(ValueError):
+        Settings.from_dict({"analysis_settings": {"time_period": {"start_date": "2024-01-01",
+                                                                  "end_date": "2023-01-01"}}})
+    with pytest.raises(ValueError):
+        Settings.from_dict({"output_settings": {"unknown_key": 1}})
+    with pytest.raises(ValueError):
+        Settings.from_dict({"analysis_settings": {"preview_fraction": 1.5}})
+    assert Settings.from_dict({"analysis_settings": {"preview_fraction": 1}}).analysis.preview_fraction == 1.0
+
+
+def test_settings_config_returns_independent_copies(tmp_project):
+    get_settings_config()["analysis_settings"]["country_list"].append("XX")
+    assert "XX" not in get_settings_config()["analysis_settings"]["country_list"]
@@ -0,0 +1,113 @@
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+import pytest
+import matplotlib
+matplotlib.use("Agg")
+import matplotlib.pyplot as plt
+
+from pathlib import Path
+import sys
+
+project_root = Path(__file__).resolve().parent.parent
+sys.path.append(str(project_root))
+
+from src.analysis import category_trends, engagement
+from src.visualization import plot_engagement, plot_trends
+
+# Analysis and plotting functions must neither modify their input nor copy it
+# whole. Each call below is traced with tracemalloc: the input must compare
+# equal to a deep snapshot afterwards, and the peak traced allocation must stay
+# below the shallow size of the input (the least a full-frame copy would cost).
+
+N_ROWS = 20_000
+N_FILLER_COLUMNS = 40
+
+
+@pytest.fixture(scope="module")
+def wide_df():
+    rng = np.random.default_rng(0)
+    publish = pd.Timestamp("2018-01-01") + pd.to_timedelta(rng.integers(0, 120 * 86400, N_ROWS), unit="s")
+    df = pd.DataFrame({
+        "video_id": rng.choice([f"vid{i:07d}" for i in range(N_ROWS // 4)], N_ROWS),
+        "channel_title": rng.choice([f"channel {i}" for i in range(300)], N_ROWS),
+        "category_name": rng.choice(["Music", "Gaming", "News", "Comedy", "Sports"], N_ROWS),
+        "title": rng.choice(["Amazing clip", "daily vlog", "INSANE trick", "news update"], N_ROWS),
+        "tags": rng.choice(["fun|wow|cool", '"music"|"pop"', "[none]", "news|daily"], N_ROWS),
+        "views": rng.integers(1, 10**6, N_ROWS),
+        "likes": rng.integers(0, 10**4, N_ROWS),
+        "dislikes": rng.integers(0, 10**3, N_ROWS),
+        "comment_count": rng.integers(0, 10**3, N_ROWS),
+        "comments_disabled": rng.random(N_ROWS) < 0.1,
+        "ratings_disabled": rng.random(N_ROWS) < 0.1,
+        "video_error_or_removed": rng.random(N_ROWS) < 0.05,
+        "publish_weekday": publish.day_name(),
+        "trending_date": (publish + pd.to_timedelta(rng.integers(0, 20, N_ROWS), unit="D")).normalize(),
+        "days_to_trend": rng.integers(0, 20, N_ROWS),
+    })
+    filler = pd.DataFrame(rng.random((N_ROWS, N_FILLER_COLUMNS)),
+                          columns=[f"feature_{i}" for i in range(N_FILLER_COLUMNS)])
+    return pd.concat([df, filler], axis=1)
+
+
+def run_traced(func, df, *args, **kwargs):
+    """Call ``func(df, ...)`` and return the peak traced allocation in bytes."""
+    snapshot = df.copy(deep=True)
+    func(df, *args, **kwargs)  # warm caches (fonts, lazy imports) outside the trace
+    plt.close("all")
+
+    tracemalloc.start()
+    try:
+        func(df, *args, **kwargs)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+        plt.close("all")
+
+    pd.testing.assert_series_equal(df.dtypes, snapshot.dtypes)
+    pd.testing.assert_frame_equal(df, snapshot)
+    return peak
+
+
+CASES = [
+    (category_trends.trending_day_distribution, {}),
+    (category_trends.trending_by_month, {}),
+    (category_trends.average_days_to_trend_by_category, {}),
+    (category_trends.analyze_top_tags_by_category, {}),
+    (category_trends.analyze_clickbait_effect_by_category, {}),
+    (category_trends.summarize_top_trending_channels, {}),
+    (category_trends.analyze_channel_format_category_consistency, {}),
+    (engagement.summarize_engagement_by_category_df, {}),
+    (engagement.correlation_by_category_before_trend, {}),
+    (engagement.like_dislike_ratio_vs_views, {}),
+    (engagement.engagement_disabled_analysis, {}),
+    (engagement.compare_status_impact, {}),
+    (plot_trends.plot_category_trends, {}),
+    (plot_trends.plot_time_series_trends, {}),
+    (plot_trends.plot_trend_comparison, {}),
+    (plot_trends.plot_trending_day_distribution, {}),
+    (plot_trends.plot_channel_category_heatmap, {}),
+    (plot_engagement.plot_engagement_disabled_stats, {}),
+    (plot_engagement.plot_engagement_per_user, {}),
+    (plot_engagement.plot_engagement_over_time, {}),
+]
+
+
+@pytest.mark.parametrize("func, kwargs", CASES, ids=[func.__name__ for func, _ in CASES])
+def test_no_input_mutation_or_full_copy(wide_df, func, kwargs):
+    peak = run_traced(func, wide_df, **kwargs)
+    shallow_size = wide_df.memory_usage(index=True, deep=False).sum()
+    assert peak < shallow_size, f"{func.__name__} allocated {peak} bytes (frame: {shallow_size})"
+
+
+def test_calculate_category_growth_leaves_input_unchanged(wide_df):
+    data = wide_df.rename(columns={"trending_date": "date"})
+    run_traced(category_trends.calculate_category_growth, data, "category_name", "views", top_n=3)
+    assert "period" not in data.columns
+
+
+def test_plot_trending_by_month_leaves_input_unchanged(wide_df):
+    counts = category_trends.trending_by_month(wide_df)
+    run_traced(plot_trends.plot_trending_by_month, counts)
+    assert list(counts.columns) == ["month", "count"]
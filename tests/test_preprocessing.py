@@ -17,8 +17,10 @@ from src.preprocessing.data_utils import (
     encode_categorical,
     drop_columns,
     convert_to_datetime,
-    save_table
+    save_table,
+    load_table
 )
+from src.preprocessing.merge_datasets import dataset_merger
 
 @pytest.fixture
 def dummy_df():
@@ -66,12 +68,77 @@ def test_save_table_csv(tmp_path):
     loaded = pd.read_csv(f"{path}.csv")
     pd.testing.assert_frame_equal(df, loaded)
 
+@pytest.mark.parametrize("format", ["parquet", "feather"])
+def test_save_load_table_preserves_dtypes(tmp_path, format):
+    pytest.importorskip("pyarrow")
+    df = pd.DataFrame({
+        "category": pd.Categorical(["Music", "Gaming"]),
+        "date": pd.to_datetime(["2018-01-01", "2018-01-02"]),
+        "views": pd.array([1, None], dtype="Int64"),
+        "ratio": [0.5, 1.5],
+    })
+    path = save_table(df, str(tmp_path / "table"), format=format)
+    assert path.endswith(f".{format}")
+    pd.testing.assert_frame_equal(load_table(path), df)
+
+def test_save_load_table_compressed_csv(tmp_path):
+    df = pd.DataFrame({"a": [1, 2], "b": ["x", "y"]})
+    save_table(df, str(tmp_path / "table"), format="csv.gz")
+    assert (tmp_path / "table.csv.gz").read_bytes()[:2] == b"\x1f\x8b"
+    pd.testing.assert_frame_equal(load_table(tmp_path / "table.csv.gz"), df)
+    pd.testing.assert_frame_equal(load_table(str(tmp_path / "table"), format="csv.gz"), df)
+
+def test_save_table_default_format_from_settings(tmp_path):
+    df = pd.DataFrame({"a": [1, 2]})
+    assert save_table(df, str(tmp_path / "table")) == str(tmp_path / "table.csv")
+
+def test_save_table_unsupported_format(tmp_path):
+    with pytest.raises(ValueError):
+        save_table(pd.DataFrame({"a": [1]}), str(tmp_path / "table"), format="txt")
+
 def test_load_data():
     sample_csv = "col1,col2\n1,x\n2,y"
     df = load_data(StringIO(sample_csv))
     assert df.shape == (2, 2)
     assert list(df.columns) == ["col1", "col2"]
 
+@pytest.fixture
+def large_csv(tmp_path):
+    rng = np.random.default_rng(0)
+    n = 20_000
+    df = pd.DataFrame({
+        "video_id": [f"id{i:09d}" for i in range(n)],
+        "category_id": rng.integers(1, 4, n),
+        "views": rng.integers(0, 10**6, n),
+    })
+    path = tmp_path / "USvideos.csv"
+    df.to_csv(path, index=False)
+    return path, df
+
+def test_load_data_over_budget(large_csv):
+    path, df = large_csv
+    sample = load_data(path, budget_bytes=1_000_000)
+    assert 0 < sample.attrs["sample_fraction"] < 1
+    assert len(sample) == pytest.approx(len(df) * sample.attrs["sample_fraction"], rel=0.1)
+    chunks = list(load_data(path, chunked=True, budget_bytes=1_000_000))
+    assert len(chunks) > 1
+    pd.testing.assert_frame_equal(pd.concat(chunks, ignore_index=True), df)
+    pd.testing.assert_frame_equal(load_data(path, budget_bytes=2**34), df)
+
+def test_dataset_merger_chunks_large_csv(large_csv, tmp_path):
+    path, df = large_csv
+    categories = tmp_path / "categories.csv"
+    pd.DataFrame({"category_id": [1, 2], "category_name": ["Music", "News"]}).to_csv(categories, index=False)
+    expected = dataset_merger([path, categories], budget_bytes=2**34)
+    chunks = list(dataset_merger([path, categories], chunked=True, budget_bytes=1_000_000))
+    assert len(chunks) > 1
+    pd.testing.assert_frame_equal(pd.concat(chunks, ignore_index=True), expected)
+    assert set(expected["category_name"]) == {"Music", "News"}
+    sample = dataset_merger([path, categories], budget_bytes=1_000_000)
+    assert 0 < sample.attrs["sample_fraction"] < 1
+    assert len(sample) == pytest.approx(len(expected) * sample.attrs["sample_fraction"], rel=0.1)
+    assert set(sample.columns) == set(expected.columns)
+
 def test_handle_missing_invalid_strategy(dummy_df):
     with pytest.raises(ValueError):
         handle_missing_values(dummy_df, strategy="invalid")
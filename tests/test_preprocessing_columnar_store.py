@@ -0,0 +1,101 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from pathlib import Path
+import sys
+
+project_root = Path(__file__).resolve().parent.parent
+sys.path.append(str(project_root))
+
+from src.preprocessing.columnar_store import ColumnarStore, write_columnar_store, open_columnar_store
+from src.preprocessing.data_utils import load_data
+from src.analysis.category_trends import identify_top_categories
+from src.analysis.engagement import summarize_engagement_by_category_df
+
+@pytest.fixture
+def trending_df():
+    return pd.DataFrame({
+        "video_id": ["a", "b", "c", "a"],
+        "category_name": ["Music", None, "Gaming", "Music"],
+        "views": [1000, 2000, 1500, 10],
+        "likes": [100.0, 150.0, np.nan, 1.0],
+        "comment_count": [20, 30, 10, 5],
+        "comments_disabled": [False, True, False, False],
+        "trending_date": pd.to_datetime(["2018-01-01", "2018-01-02", "2018-01-02", "2018-01-03"]),
+    })
+
+def test_round_trip(tmp_path, trending_df):
+    write_columnar_store(trending_df, tmp_path / "US")
+    store = open_columnar_store(tmp_path / "US")
+    assert len(store) == 4
+    pd.testing.assert_frame_equal(store.to_frame(), trending_df)
+
+def test_columns_are_memory_mapped(tmp_path, trending_df):
+    store = open_columnar_store(write_columnar_store(trending_df, tmp_path / "US"))
+    views = store["views"]
+    assert isinstance(store._load(store._schema["views"]["file"]), np.memmap)
+    assert not views.to_numpy().flags.writeable
+    codes, dictionary = store.codes("category_name")
+    assert codes.tolist() == [0, -1, 1, 0]
+    assert dictionary.tolist() == ["Music", "Gaming"]
+
+def test_analysis_and_load_data_accept_store(tmp_path, trending_df):
+    path = write_columnar_store(trending_df, tmp_path / "US")
+    store = open_columnar_store(path)
+    pd.testing.assert_frame_equal(summarize_engagement_by_category_df(store),
+                                  summarize_engagement_by_category_df(trending_df))
+    assert load_data(str(path)).shape == trending_df.shape
+
+def test_categorical_column_keeps_codes(tmp_path, trending_df):
+    store = open_columnar_store(write_columnar_store(trending_df, tmp_path / "US"))
+    categories = store.column("category_name", decode=False)
+    # Categories are sorted, codes are remapped from the stored dictionary order
+    assert categories.cat.categories.tolist() == ["Gaming", "Music"]
+    assert categories.cat.codes.tolist() == [1, -1, 0, 1]
+    assert store.column("category_name", decode=False).array is categories.array
+
+def test_decorated_functions_read_only_their_columns(tmp_path, trending_df, monkeypatch):
+    store = open_columnar_store(write_columnar_store(trending_df, tmp_path / "US"))
+    read = []
+    column = ColumnarStore.column
+    monkeypatch.setattr(ColumnarStore, "column", lambda self, name, decode=True: read.append((name, decode))
+                        or column(self, name, decode))
+    assert identify_top_categories(store, "category_name", "views") == ["Gaming", "Music"]
+    assert sorted(read) == [("category_name", False), ("views", False)]
+    read.clear()
+    summary = summarize_engagement_by_category_df(store)
+    assert {name for name, _ in read} == {"category_name", "video_id", "views", "likes", "comment_count"}
+    assert summary["category_name"].dtype == object
+
+def test_round_trip_keeps_dtypes(tmp_path):
+    df = pd.DataFrame({
+        "publish_time": pd.to_datetime(["2018-01-01T10:00Z", None, "2018-01-03T12:30Z"]),
+        "time_to_trend": pd.to_timedelta(["4 days", None, "1 hours"]),
+        "dislikes": pd.array([3, None, 5], dtype="Int64"),
+        "verified": pd.array([True, None, False], dtype="boolean"),
+        "title": pd.array(["Ünïcode 🎵", None, ""], dtype="string"),
+        "publish_weekday": pd.Categorical(["Tue", "Mon", None], categories=["Mon", "Tue", "Wed"], ordered=True),
+    })
+    store = open_columnar_store(write_columnar_store(df, tmp_path / "US"))
+    pd.testing.assert_frame_equal(store.to_frame(), df)
+    pd.testing.assert_series_equal(store.column("publish_weekday", decode=False), df["publish_weekday"])
+
+def test_long_text_costs_its_length(tmp_path):
+    descriptions = pd.Series([f"video {i} " + "x" * (50 + i % 2000) for i in range(3000)])
+    path = write_columnar_store(descriptions.to_frame("description"), tmp_path / "US")
+    stored = sum(f.stat().st_size for f in path.glob("*.npy"))
+    assert stored < 1.2 * descriptions.str.len().sum()
+    assert open_columnar_store(path)["description"].equals(descriptions)
+
+@pytest.mark.parametrize("column", [
+    pd.Series(["a", 1, 2.5], dtype=object),
+    pd.Series(pd.period_range("2018-01", periods=3, freq="M")),
+])
+def test_lossy_columns_are_rejected(tmp_path, column):
+    with pytest.raises(TypeError):
+        write_columnar_store(column.to_frame("value"), tmp_path / "US")
+
+def test_missing_store(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        open_columnar_store(tmp_path / "missing")
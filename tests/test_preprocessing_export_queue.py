@@ -0,0 +1,78 @@
+import asyncio
+
+import matplotlib
+matplotlib.use("Agg")
+import matplotlib.pyplot as plt
+import pandas as pd
+import pytest
+
+from pathlib import Path
+import sys
+
+project_root = Path(__file__).resolve().parent.parent
+sys.path.append(str(project_root))
+
+from src.preprocessing.export_queue import ExportQueue, ExportError
+
+@pytest.fixture
+def table():
+    return pd.DataFrame({"category": ["Music", "Gaming"], "views": [100, 200]})
+
+def test_tables_and_figures_written(tmp_path, table):
+    fig, ax = plt.subplots()
+    ax.plot([1, 2], [3, 4])
+    with ExportQueue(max_workers=2) as exports:
+        exports.submit_table(table, str(tmp_path / "summary"))
+        exports.submit_figure(fig, str(tmp_path / "trend"))
+        plt.close(fig)
+
+    pd.testing.assert_frame_equal(pd.read_csv(tmp_path / "summary.csv"), table)
+    assert (tmp_path / "trend.png").read_bytes()[:4] == b"\x89PNG"
+    assert not list(tmp_path.glob("*.tmp*"))
+
+def test_failures_are_reported_per_file(tmp_path, table):
+    exports = ExportQueue()
+    exports.submit_table(table, str(tmp_path / "ok"))
+    exports.submit_table(table, str(tmp_path / "missing_dir" / "bad"))
+    with pytest.raises(ExportError) as info:
+        exports.close()
+    assert list(info.value.failures) == [str(tmp_path / "missing_dir" / "bad.csv")]
+    assert (tmp_path / "ok.csv").exists()
+
+def test_in_flight_bytes_are_bounded(tmp_path, table, monkeypatch):
+    exports = ExportQueue(max_workers=4, max_in_flight_bytes=1)
+    peak = []
+    reserve = exports._reserve
+
+    def tracking_reserve(size):
+        reserve(size)
+        peak.append(exports._in_flight)
+
+    monkeypatch.setattr(exports, "_reserve", tracking_reserve)
+    for i in range(5):
+        exports.submit_table(table, str(tmp_path / f"t{i}"))
+    assert exports.close() == [str(tmp_path / f"t{i}.csv") for i in range(5)]
+    # A single oversized payload is admitted only when nothing else is queued
+    assert max(peak) == int(table.memory_usage().sum())
+
+def test_wait_async(tmp_path, table):
+    exports = ExportQueue()
+    exports.submit_table(table, str(tmp_path / "summary"), format="html")
+    written = asyncio.run(exports.wait_async())
+    assert written == [str(tmp_path / "summary.html")]
+
+def test_unsupported_format(tmp_path, table):
+    with pytest.raises(ValueError):
+        ExportQueue().submit_table(table, str(tmp_path / "x"), format="txt")
+
+def test_save_table_and_plot_exports_accept_queue(tmp_path, table):
+    from src.preprocessing.data_utils import save_table
+    from src.visualization.plot_trends import export_trend_plot
+
+    fig, _ = plt.subplots()
+    with ExportQueue() as exports:
+        save_table(table, str(tmp_path / "summary"), queue=exports)
+        export_trend_plot(fig, str(tmp_path / "trend.svg"), queue=exports)
+    plt.close(fig)
+    assert (tmp_path / "summary.csv").exists()
+    assert (tmp_path / "trend.svg").exists()
@@ -0,0 +1,118 @@
+import logging
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from pathlib import Path
+import sys
+
+project_root = Path(__file__).resolve().parent.parent
+sys.path.append(str(project_root))
+
+from src.config_loader import Settings
+from src.preprocessing.memory_planner import (
+    estimate_file_footprint,
+    memory_budget_bytes,
+    parquet_footprint,
+    plan_run,
+    run_planned,
+    track_stage,
+)
+from src.preprocessing.partitioned_store import write_partitioned_dataset
+
+@pytest.fixture
+def videos_csv(tmp_path):
+    rng = np.random.default_rng(0)
+    n = 20_000
+    df = pd.DataFrame({
+        "video_id": [f"id{i:09d}" for i in range(n)],
+        "category_name": rng.choice(["Music", "Gaming", "News"], n),
+        "views": rng.integers(0, 10**6, n),
+        "trending_date": pd.Timestamp("2018-01-01") + pd.to_timedelta(rng.integers(0, 90, n), "D"),
+    })
+    path = tmp_path / "USvideos.csv"
+    df.to_csv(path, index=False)
+    return path, df
+
+def views_by_category(df):
+    return df.groupby("category_name")["views"].sum()
+
+def test_estimate_is_close_to_loaded_size(videos_csv):
+    path, _ = videos_csv
+    estimate = estimate_file_footprint(path, sample_bytes=64 * 1024)
+    loaded = pd.read_csv(path)
+    assert estimate["rows"] == pytest.approx(len(loaded), rel=0.05)
+    assert estimate["memory_bytes"] == pytest.approx(loaded.memory_usage(deep=True).sum(), rel=0.05)
+
+def test_budget_from_settings():
+    settings = Settings.from_dict({"preprocessing_settings": {"memory_budget_mb": 64}})
+    assert memory_budget_bytes(settings) == 64 * 2**20
+    with pytest.raises(ValueError):
+        Settings.from_dict({"preprocessing_settings": {"memory_budget_mb": -1}})
+
+def test_fits_in_memory(videos_csv, caplog):
+    path, df = videos_csv
+    with caplog.at_level(logging.INFO, logger="src.preprocessing.memory_planner"):
+        plan = plan_run(path, budget_bytes=2**34)
+    assert plan.mode == "in_memory"
+    assert "memory plan: in_memory" in caplog.text
+    pd.testing.assert_series_equal(run_planned(plan, views_by_category), views_by_category(df))
+
+def test_chunked_when_over_budget(videos_csv, caplog):
+    path, df = videos_csv
+    with caplog.at_level(logging.INFO, logger="src.preprocessing.memory_planner"):
+        plan = plan_run(path, budget_bytes=1_000_000)
+    assert plan.mode == "chunked"
+    assert plan.chunk_rows < len(df)
+    assert any(r.levelno == logging.WARNING for r in caplog.records)
+
+    stats = []
+    result = run_planned(plan, views_by_category, combine=lambda parts: pd.concat(parts).groupby(level=0).sum(),
+                         stats=stats)
+    pd.testing.assert_series_equal(result, views_by_category(df))
+    loads = [s for s in stats if s["stage"].endswith("load")]
+    assert len(loads) == -(-len(df) // plan.chunk_rows)
+    assert all(s["peak_rss_bytes"] > 0 for s in stats)
+
+def test_sampled_when_analysis_needs_all_rows(videos_csv):
+    path, df = videos_csv
+    plan = plan_run(path, budget_bytes=1_000_000, streaming=False)
+    assert plan.mode == "sampled"
+    sample = run_planned(plan, lambda frame: frame)
+    assert len(sample) == pytest.approx(len(df) * plan.sample_fraction, rel=0.1)
+
+def test_partitioned_when_partitions_fit(videos_csv, tmp_path):
+    path, df = videos_csv
+    root = tmp_path / "partitioned"
+    write_partitioned_dataset(df.assign(trending_date=pd.to_datetime(df["trending_date"])), root, country="US")
+    plan = plan_run(path, budget_bytes=5_000_000, partitioned_root=root)
+    assert plan.mode == "partitioned"
+    result = run_planned(plan, views_by_category, combine=lambda parts: pd.concat(parts).groupby(level=0).sum())
+    pd.testing.assert_series_equal(result, views_by_category(df))
+
+def test_partitions_sized_from_footer_only(videos_csv, tmp_path, monkeypatch):
+    pq = pytest.importorskip("pyarrow.parquet")
+    path, df = videos_csv
+    root = tmp_path / "partitioned"
+    written = write_partitioned_dataset(df.assign(trending_date=pd.to_datetime(df["trending_date"])), root,
+                                        country="US")
+    loaded = pd.read_parquet(written[0])
+    assert parquet_footprint(written[0])["rows"] == len(loaded)
+    assert parquet_footprint(written[0])["memory_bytes"] == pytest.approx(loaded.memory_usage(deep=True).sum(),
+                                                                          rel=0.2)
+
+    def fail(*args, **kwargs):
+        raise AssertionError("partition data read while planning")
+    monkeypatch.setattr(pq.ParquetFile, "read_row_group", fail)
+    monkeypatch.setattr(pq.ParquetFile, "read", fail)
+    assert plan_run(path, budget_bytes=5_000_000, partitioned_root=root).mode == "partitioned"
+
+def test_track_stage_records():
+    stats = []
+    with track_stage("work", stats):
+        np.ones(1_000_000).sum()
+    with track_stage("skipped", stats) as stage:
+        stage["skip"] = True
+    assert [s["stage"] for s in stats] == ["work"]
+    assert stats[0]["seconds"] >= 0
@@ -0,0 +1,66 @@
+import pandas as pd
+import pytest
+
+from pathlib import Path
+import sys
+
+project_root = Path(__file__).resolve().parent.parent
+sys.path.append(str(project_root))
+
+pytest.importorskip("pyarrow")
+
+from src.preprocessing.partitioned_store import (
+    write_partitioned_dataset,
+    read_partitioned_dataset,
+    list_partitions,
+)
+
+@pytest.fixture
+def trending_df():
+    return pd.DataFrame({
+        "video_id": ["a", "b", "c", "d", "e"],
+        "country": ["US", "US", "US", "CA", "CA"],
+        "trending_date": pd.to_datetime(["2018-01-05", "2018-01-25", "2018-02-10", "2018-01-07", "2018-03-01"]),
+        "views": [10, 20, 30, 40, 50],
+    })
+
+def test_layout_and_pruning(tmp_path, trending_df):
+    write_partitioned_dataset(trending_df, tmp_path)
+    assert (tmp_path / "country=US" / "month=2018-01" / "part-0.parquet").exists()
+    parts = list_partitions(tmp_path, countries=["US"], start_date="2018-02-01")
+    assert parts[["country", "month"]].values.tolist() == [["US", "2018-02"]]
+
+def test_read_trims_window(tmp_path, trending_df):
+    write_partitioned_dataset(trending_df, tmp_path)
+    result = read_partitioned_dataset(tmp_path, countries=["US"], start_date="2018-01-10", end_date="2018-02-28")
+    assert sorted(result["video_id"]) == ["b", "c"]
+    assert set(result["country"]) == {"US"}
+
+def test_write_single_country_without_column(tmp_path, trending_df):
+    us = trending_df[trending_df["country"] == "US"].drop(columns="country")
+    write_partitioned_dataset(us, tmp_path, country="US")
+    result = read_partitioned_dataset(tmp_path, columns=["video_id", "views"])
+    assert list(result.columns) == ["video_id", "views"]
+    assert len(result) == 3
+    with pytest.raises(ValueError):
+        write_partitioned_dataset(us, tmp_path)
+
+def test_rows_without_date_read_only_without_window(tmp_path, trending_df):
+    undated = trending_df.copy()
+    undated.loc[1, "trending_date"] = pd.NaT
+    write_partitioned_dataset(undated, tmp_path)
+    assert (tmp_path / "country=US" / "month=__HIVE_DEFAULT_PARTITION__" / "part-0.parquet").exists()
+    everything = read_partitioned_dataset(tmp_path)
+    assert sorted(everything["video_id"]) == ["a", "b", "c", "d", "e"]
+    windowed = read_partitioned_dataset(tmp_path, start_date="2018-01-01", end_date="2018-12-31")
+    assert sorted(windowed["video_id"]) == ["a", "c", "d", "e"]
+
+def test_concatenated_countries_with_repeated_index(tmp_path, trending_df):
+    us = trending_df[trending_df["country"] == "US"].reset_index(drop=True)
+    ca = trending_df[trending_df["country"] == "CA"].reset_index(drop=True)
+    write_partitioned_dataset(pd.concat([us, ca]), tmp_path)
+    result = read_partitioned_dataset(tmp_path)
+    assert len(result) == len(trending_df)
+    views = result.set_index("video_id")["views"].to_dict()
+    assert views == dict(zip(trending_df["video_id"], trending_df["views"]))
+    assert set(result.loc[result["country"] == "CA", "video_id"]) == {"d", "e"}
@@ -0,0 +1,120 @@
+import pandas as pd
+import numpy as np
+import pytest
+
+from pathlib import Path
+import sys
+
+project_root = Path(__file__).resolve().parent.parent
+sys.path.append(str(project_root))
+
+from src.config_loader import Settings
+from src.preprocessing.pipeline import preprocess_dataset, clean_text_columns
+
+@pytest.fixture
+def raw_df():
+    return pd.DataFrame({
+        "video_id": ["a", "a", "b", "c", "d", "e"],
+        "trending_date": ["17.14.11", "17.14.11", "17.15.11", "18.01.07", "17.16.11", "17.16.11"],
+        "title": ["  Hello\n World ", "  Hello\n World ", "Big  News", "Late", "Low", None],
+        "views": [50_000, 50_000, 20_000, 90_000, 500, 30_000],
+        "thumbnail_link": ["x"] * 6,
+    })
+
+def make_settings(**preprocessing):
+    return Settings.from_dict({
+        "analysis_settings": {
+            "time_period": {"start_date": "2017-11-14", "end_date": "2018-06-14"},
+            "trending_category_threshold": 10000,
+        },
+        "preprocessing_settings": {"columns_to_clean": ["title"], **preprocessing},
+    })
+
+def test_preprocess_applies_settings(raw_df):
+    original = raw_df.copy()
+    result = preprocess_dataset(raw_df, make_settings(), columns_to_drop=["thumbnail_link"])
+    pd.testing.assert_frame_equal(raw_df, original)
+    assert list(result.columns) == ["video_id", "trending_date", "title", "views"]
+    # Duplicate, below-threshold, out-of-period and incomplete rows removed
+    assert result["video_id"].tolist() == ["a", "b"]
+    assert result["title"].tolist() == ["Hello World", "Big News"]
+    assert result["trending_date"].tolist() == [pd.Timestamp("2017-11-14"), pd.Timestamp("2017-11-15")]
+
+def test_preprocess_flags_can_be_disabled(raw_df):
+    settings = make_settings(drop_missing_values=False, remove_duplicates=False, convert_to_lowercase=True)
+    result = preprocess_dataset(raw_df, settings)
+    assert result["video_id"].tolist() == ["a", "a", "b", "e"]
+    assert result["title"].iloc[2] == "big news"
+    assert pd.isna(result["title"].iloc[3])
+
+def test_clean_text_columns_skips_missing_and_numeric():
+    df = pd.DataFrame({"views": [1, 2], "tags": [" a  b", "c "]})
+    cleaned = clean_text_columns(df, ["views", "tags", "description"])
+    assert cleaned["tags"].tolist() == ["a b", "c"]
+    assert cleaned["views"].tolist() == [1, 2]
+
+def test_preprocess_compacts_video_ids(raw_df):
+    result = preprocess_dataset(raw_df, make_settings(compact_video_ids=True))
+    assert result["video_id"].dtype == np.uint64
+    # Duplicates are still removed on the integer column
+    assert len(result) == 2
+    assert set(result.attrs["video_id_side_table"].values()) == {"a", "b"}
+
+def test_load_country_dataset_reduces_chunks_over_budget(tmp_path, monkeypatch):
+    from src.preprocessing import pipeline
+    rng = np.random.default_rng(0)
+    n = 20_000
+    pd.DataFrame({
+        "video_id": [f"id{i % 5_000:09d}" for i in range(n)],
+        "trending_date": rng.choice(["17.14.11", "18.01.02", "18.10.07"], n),
+        "publish_time": "2017-11-13T17:13:01.000Z",
+        "title": rng.choice(["  Hello\n World ", "Big  News"], n),
+        "views": rng.integers(0, 100_000, n),
+        "category_id": rng.integers(1, 3, n),
+        "thumbnail_link": "x",
+        "description": "y",
+    }).to_csv(tmp_path / "USvideos.csv", index=False)
+    (tmp_path / "US_category_id.json").write_text(
+        '{"items": [{"id": "1", "snippet": {"title": "Music"}}, {"id": "2", "snippet": {"title": "News"}}]}')
+    monkeypatch.setattr(pipeline, "get_paths_config", lambda: {"US_data": str(tmp_path)})
+
+    def load(budget_mb):
+        settings = Settings.from_dict({
+            "analysis_settings": {
+                "time_period": {"start_date": "2017-11-14", "end_date": "2018-06-14"},
+                "trending_category_threshold": 10000,
+            },
+            "preprocessing_settings": {"columns_to_clean": ["title"], "memory_budget_mb": budget_mb},
+        })
+        return pipeline.load_country_dataset("US", settings=settings, preview=False)
+
+    chunked = load(1)
+    expected = load(4096)
+    assert 0 < len(chunked) < n
+    pd.testing.assert_frame_equal(chunked, expected)
+
+def test_preview_sample_follows_settings(tmp_path, monkeypatch):
+    from src.preprocessing import pipeline
+    rng = np.random.default_rng(0)
+    n = 2_000
+    pd.DataFrame({
+        "video_id": [f"id{i:09d}" for i in range(n)],
+        "trending_date": rng.choice(["17.14.11", "18.01.02", "18.10.07"], n),
+        "publish_time": "2017-11-13T17:13:01.000Z",
+        "views": rng.integers(0, 100_000, n),
+        "category_id": rng.integers(1, 3, n),
+    }).to_csv(tmp_path / "USvideos.csv", index=False)
+    (tmp_path / "US_category_id.json").write_text(
+        '{"items": [{"id": "1", "snippet": {"title": "Music"}}, {"id": "2", "snippet": {"title": "News"}}]}')
+    monkeypatch.setattr(pipeline, "get_paths_config", lambda: {"US_data": str(tmp_path)})
+
+    def load(threshold, columns_to_drop=()):
+        settings = Settings.from_dict({"analysis_settings": {
+            "trending_category_threshold": threshold, "preview_fraction": 0.5}})
+        return pipeline.load_country_dataset("US", settings=settings, columns_to_drop=columns_to_drop,
+                                             preview=True)
+
+    assert load(0)["views"].min() < 50_000
+    assert load(50_000)["views"].min() >= 50_000
+    assert "publish_time" not in load(0, columns_to_drop=["publish_time"]).columns
+    assert len(list(tmp_path.glob("USvideos.csv.preview-*.parquet"))) == 3
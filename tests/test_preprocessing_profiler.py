@@ -0,0 +1,132 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from pathlib import Path
+import sys
+
+project_root = Path(__file__).resolve().parent.parent
+sys.path.append(str(project_root))
+
+from src.preprocessing.data_utils import explore_data
+from src.preprocessing.profiler import DatasetProfile, load_profile, profile_dataset
+
+
+@pytest.fixture
+def frame():
+    rng = np.random.default_rng(0)
+    n = 20_000
+    df = pd.DataFrame({
+        "video_id": [f"vid{i:05d}" for i in rng.integers(0, 8_000, n)],
+        "category_name": rng.choice(["Music", "Gaming", "News"], n),
+        "views": rng.lognormal(10, 1, n),
+        "likes": rng.integers(0, 50, n),
+        "comments_disabled": rng.random(n) < 0.1,
+        "trending_date": pd.Timestamp("2018-01-01") + pd.to_timedelta(rng.integers(0, 90, n), "D"),
+    })
+    df.loc[::10, "views"] = np.nan
+    df.loc[::7, "category_name"] = None
+    return df
+
+
+def test_profile_matches_exact_statistics(frame):
+    profile = profile_dataset(frame, chunk_rows=3_000, exact_limit=100)
+    table = profile.table
+
+    assert profile.n_rows == profile.n_profiled == len(frame)
+    assert table["nulls"].to_dict() == frame.isna().sum().to_dict()
+    assert table.at["views", "null_fraction"] == pytest.approx(0.1)
+    assert table.at["views", "min"] == frame["views"].min()
+    assert table.at["views", "max"] == frame["views"].max()
+    assert table.at["views", "mean"] == pytest.approx(frame["views"].mean())
+    assert table.at["views", "std"] == pytest.approx(frame["views"].std())
+    # Approximate statistics of a high-cardinality column
+    assert table.at["video_id", "distinct"] == pytest.approx(frame["video_id"].nunique(), rel=0.05)
+    assert table.at["views", "p50"] == pytest.approx(frame["views"].median(), rel=0.02)
+    assert table.at["views", "p99"] == pytest.approx(frame["views"].quantile(0.99), rel=0.05)
+    # Low-cardinality columns are counted exactly
+    assert table.at["likes", "distinct"] == frame["likes"].nunique()
+    assert table.at["likes", "p25"] == frame["likes"].quantile(0.25)
+    assert table.at["comments_disabled", "mean"] == pytest.approx(frame["comments_disabled"].mean())
+    assert table.at["trending_date", "p50"] == frame["trending_date"].quantile(0.5)
+    assert table.at["trending_date", "min"] == frame["trending_date"].min()
+    assert table.at["category_name", "distinct"] == 3
+    lengths = frame["category_name"].dropna().str.len()
+    assert table.loc["category_name", ["len_min", "len_max"]].tolist() == [lengths.min(), lengths.max()]
+    assert table.at["category_name", "len_mean"] == pytest.approx(lengths.mean())
+
+
+def test_profile_time_zones_timedeltas_and_categoricals(frame, tmp_path):
+    frame["publish_time"] = frame["trending_date"].dt.tz_localize("UTC").dt.tz_convert("America/New_York")
+    frame["time_to_trend"] = frame["trending_date"] - pd.Timestamp("2017-12-25")
+    frame["weekday"] = pd.Categorical(frame["trending_date"].dt.day_name())
+    frame["rank"] = pd.Categorical(frame["likes"] % 5)
+    profile = profile_dataset(frame, chunk_rows=3_000)
+    table = profile.table
+
+    assert table.at["publish_time", "kind"] == "datetime"
+    assert table.at["publish_time", "min"] == frame["publish_time"].min()
+    assert str(table.at["publish_time", "max"].tz) == "America/New_York"
+    assert table.at["time_to_trend", "kind"] == "timedelta"
+    assert table.at["time_to_trend", "mean"] == frame["time_to_trend"].mean()
+    assert table.at["time_to_trend", "max"] == frame["time_to_trend"].max()
+    assert table.at["weekday", "kind"] == "categorical"
+    assert table.at["weekday", "distinct"] == 7
+    assert table.at["weekday", "len_max"] == len("Wednesday")
+    assert table.at["rank", "max"] == 4 and np.isnan(table.at["rank", "len_max"])
+
+    profile.save(tmp_path / "profile.json")
+    restored = load_profile(tmp_path / "profile.json").table
+    assert restored.at["publish_time", "min"] == table.at["publish_time", "min"]
+    assert str(restored.at["publish_time", "min"].tz) == "America/New_York"
+    assert restored.at["time_to_trend", "p50"] == table.at["time_to_trend", "p50"]
+
+def test_profile_streams_chunks_and_csv(frame, tmp_path):
+    whole = profile_dataset(frame)
+    chunks = profile_dataset(frame.iloc[start:start + 5_000] for start in range(0, len(frame), 5_000))
+    assert chunks.table[["count", "nulls", "min", "max"]].equals(whole.table[["count", "nulls", "min", "max"]])
+
+    path = tmp_path / "data.csv"
+    frame[["views", "likes"]].to_csv(path, index=False)
+    from_csv = profile_dataset(path, chunk_rows=4_000)
+    assert from_csv.n_rows == len(frame)
+    assert from_csv.table.at["likes", "mean"] == pytest.approx(frame["likes"].mean())
+
+
+def test_sampled_profile(frame):
+    profile = profile_dataset(frame, sample=0.25, seed=1)
+    assert profile.n_rows == len(frame)
+    assert profile.n_profiled == pytest.approx(len(frame) * 0.25, rel=0.05)
+    assert profile.sample_fraction == 0.25
+    assert profile.table.at["views", "null_fraction"] == pytest.approx(0.1, abs=0.01)
+    with pytest.raises(ValueError):
+        profile_dataset(frame, sample=0)
+
+
+def test_profile_round_trips_and_diffs(frame, tmp_path):
+    profile = profile_dataset(frame)
+    path = tmp_path / "profile.json"
+    profile.save(path)
+    loaded = load_profile(path)
+    assert isinstance(loaded, DatasetProfile)
+    assert loaded.table.at["trending_date", "max"] == frame["trending_date"].max()
+    assert profile.diff(loaded).empty
+
+    changed = frame.drop(columns="likes").assign(extra=1.0)
+    changed.loc[:99, "views"] = np.nan
+    diff = profile.diff(profile_dataset(changed))
+    nulls = diff[(diff["column"] == "views") & (diff["statistic"] == "nulls")].iloc[0]
+    assert nulls["change"] == changed["views"].isna().sum() - frame["views"].isna().sum()
+    dtypes = diff[diff["statistic"] == "dtype"].set_index("column")
+    assert dtypes.loc["likes", "after"] is None
+    assert dtypes.loc["extra", "after"] == "float64"
+    # Small changes are ignored with a relative tolerance
+    assert (profile.diff(profile_dataset(changed), rtol=0.5)["column"] != "video_id").all()
+
+
+def test_explore_data_prints_profile(frame, capsys):
+    profile = explore_data(frame)
+    output = capsys.readouterr().out
+    assert "Shape: (20000, 6)" in output
+    assert "trending_date" in output
+    assert isinstance(profile, DatasetProfile)
@@ -0,0 +1,104 @@
+import gc
+import pickle
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from pathlib import Path
+import sys
+
+project_root = Path(__file__).resolve().parent.parent
+sys.path.append(str(project_root))
+
+from src.preprocessing import shared_frame
+from src.preprocessing.shared_frame import (
+    SharedFrame,
+    share_frame,
+    attach_shared_frame,
+    map_shared,
+    benchmark_handoff,
+    _sum_column,
+)
+from src.analysis.engagement import summarize_engagement_by_category_df
+
+@pytest.fixture
+def trending_df():
+    return pd.DataFrame({
+        "video_id": ["a", "b", "c", "a"],
+        "category_name": ["Music", None, "Gaming", "Music"],
+        "views": [1000, 2000, 1500, 10],
+        "likes": [100.0, 150.0, np.nan, 1.0],
+        "comment_count": [20, 30, 10, 5],
+        "comments_disabled": [False, True, False, False],
+        "trending_date": pd.to_datetime(["2018-01-01", "2018-01-02", "2018-01-02", "2018-01-03"]),
+    })
+
+def test_round_trip(trending_df):
+    with share_frame(trending_df) as frame:
+        assert isinstance(frame, SharedFrame)
+        assert len(frame) == 4
+        pd.testing.assert_frame_equal(frame.to_frame(), trending_df)
+
+def test_round_trip_keeps_dtypes(trending_df):
+    trending_df["time_to_trend"] = pd.to_timedelta([1, 2, None, 4], unit="D")
+    trending_df["dislikes"] = pd.array([1, None, 3, 4], dtype="Int64")
+    with share_frame(trending_df) as frame:
+        pd.testing.assert_frame_equal(frame.to_frame(), trending_df)
+
+def test_columns_are_read_only_views(trending_df):
+    with share_frame(trending_df) as frame:
+        views = frame["views"].to_numpy()
+        assert not views.flags.writeable
+        codes, dictionary = frame.codes("category_name")
+        assert codes.tolist() == [0, -1, 1, 0]
+        assert dictionary.tolist() == ["Music", "Gaming"]
+
+def test_pickle_sends_only_the_spec(trending_df):
+    with share_frame(trending_df) as frame:
+        payload = pickle.dumps(frame)
+        assert len(payload) < 2048
+        attached = pickle.loads(payload)
+        assert attached is attach_shared_frame(frame.spec)
+        pd.testing.assert_series_equal(attached["likes"], trending_df["likes"])
+
+def test_analysis_functions_accept_shared_frame(trending_df):
+    with share_frame(trending_df) as frame:
+        pd.testing.assert_frame_equal(summarize_engagement_by_category_df(frame),
+                                      summarize_engagement_by_category_df(trending_df))
+
+def test_map_shared_runs_on_process_pool(trending_df):
+    with share_frame(trending_df) as frame:
+        assert map_shared(_sum_column, frame, ["views", "comment_count"], max_workers=2) == [4510.0, 65.0]
+
+def test_close_unlinks_and_keeps_built_frames_valid(trending_df):
+    frame = share_frame(trending_df)
+    spec = frame.spec
+    result = frame.to_frame()
+    frame.close()
+    assert result["views"].sum() == 4510
+    with pytest.raises(ValueError):
+        frame["views"]
+    with pytest.raises(FileNotFoundError):
+        attach_shared_frame(spec)
+    # The mapping is closed once the built frame is gone
+    del result
+    gc.collect()
+    share_frame(trending_df).close()
+    assert not shared_frame._unclosed
+
+def test_owner_unlinks_when_collected(trending_df):
+    spec = share_frame(trending_df).spec
+    gc.collect()
+    with pytest.raises(FileNotFoundError):
+        attach_shared_frame(spec)
+
+def test_benchmark_handoff(trending_df):
+    result = benchmark_handoff(trending_df, max_workers=1, repeats=1)
+    assert result["spec_bytes"] < 2048
+    assert set(result) == {"pickle_bytes", "spec_bytes", "pickle_seconds", "share_seconds", "shared_seconds"}
+
+def test_benchmark_handoff_skips_categorical_columns(trending_df):
+    trending_df["weekday"] = pd.Categorical(["Mon", "Tue", "Tue", "Wed"])
+    result = benchmark_handoff(trending_df, max_workers=1, repeats=1)
+    assert result["spec_bytes"] < 2048
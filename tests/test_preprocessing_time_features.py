@@ -0,0 +1,73 @@
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from pathlib import Path
+import sys
+
+project_root = Path(__file__).resolve().parent.parent
+sys.path.append(str(project_root))
+
+from src.preprocessing.time_features import (
+    add_time_features,
+    derive_time_features,
+    time_features_cache_path,
+)
+from src.analysis.category_trends import trending_by_month, trending_day_distribution
+
+@pytest.fixture
+def raw_df():
+    return pd.DataFrame({
+        "video_id": ["a", "b", "c"],
+        "trending_date": ["17.14.11", "17.01.12", "18.02.01"],
+        "publish_time": ["2017-11-13T17:13:01.000Z", "2017-11-28T23:59:00.000Z", "2018-01-01T00:30:00.000Z"],
+    })
+
+def test_features_match_notebook_derivation(raw_df):
+    features = derive_time_features(raw_df)
+    publish = pd.to_datetime(raw_df["publish_time"]).dt.tz_localize(None)
+    trending = pd.to_datetime(raw_df["trending_date"], format="%y.%d.%m")
+
+    assert features["publish_hour"].dtype == np.int8
+    assert features["days_to_trend"].dtype == np.int16
+    assert features["trending_month"].dtype == np.int8
+    assert features["publish_weekday"].cat.codes.dtype == np.int8
+    assert features["publish_hour"].tolist() == publish.dt.hour.tolist()
+    assert features["publish_weekday"].astype(str).tolist() == publish.dt.day_name().tolist()
+    assert features["days_to_trend"].tolist() == (trending - publish).dt.days.tolist()
+    assert features["publish_day"].dt.date.tolist() == publish.dt.date.tolist()
+
+def test_missing_dates_use_nullable_integers(raw_df):
+    raw_df.loc[1, "publish_time"] = None
+    features = derive_time_features(raw_df)
+    assert str(features["days_to_trend"].dtype) == "Int16"
+    assert features["days_to_trend"].isna().tolist() == [False, True, False]
+    assert pd.isna(features["publish_weekday"].iloc[1])
+
+def test_cache_reused_until_source_changes(tmp_path, raw_df, monkeypatch):
+    source = tmp_path / "CAvideos.csv"
+    raw_df.to_csv(source, index=False)
+    cache = time_features_cache_path(source)
+    first = add_time_features(raw_df, cache_path=cache, source_path=source)
+    assert cache.exists()
+
+    import src.preprocessing.time_features as time_features
+    monkeypatch.setattr(time_features, "derive_time_features", lambda *a, **k: pytest.fail("not cached"))
+    pd.testing.assert_frame_equal(add_time_features(raw_df, cache_path=cache, source_path=source), first)
+
+    stat = cache.stat()
+    os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    with pytest.raises(pytest.fail.Exception):
+        add_time_features(raw_df, cache_path=cache, source_path=source)
+
+def test_analysis_consumes_features(raw_df):
+    df = add_time_features(raw_df)
+    by_day = trending_day_distribution(df)
+    assert by_day.set_index("weekday")["count"].to_dict() == {
+        "Monday": 2, "Tuesday": 1, "Wednesday": 0, "Thursday": 0, "Friday": 0, "Saturday": 0, "Sunday": 0}
+    assert trending_by_month(df).to_dict("list") == {"month": [1, 11, 12], "count": [1, 1, 1]}
+    # Plain day names still work
+    named = raw_df.assign(publish_weekday=df["publish_weekday"].astype(str))
+    pd.testing.assert_frame_equal(trending_day_distribution(named), by_day)
@@ -0,0 +1,48 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from pathlib import Path
+import sys
+
+project_root = Path(__file__).resolve().parent.parent
+sys.path.append(str(project_root))
+
+from src.preprocessing.video_ids import (
+    encode_video_ids,
+    decode_video_ids,
+    compact_video_ids,
+    restore_video_ids,
+)
+
+def test_valid_ids_round_trip_without_side_table():
+    ids = pd.Series(["2kyS6SvSYSE", "1ZAPwfrtAFY", "AAAAAAAAAAA", "__________w"])
+    codes, side_table = encode_video_ids(ids)
+    assert codes.dtype == np.uint64
+    assert codes[2] == 0
+    assert codes[3] == np.iinfo(np.uint64).max - 3
+    assert side_table.empty
+    assert decode_video_ids(codes).tolist() == ids.tolist()
+
+def test_encoding_is_the_same_for_every_dataset():
+    first, _ = encode_video_ids(["2kyS6SvSYSE", "#NAME?"])
+    second, _ = encode_video_ids(["#NAME?", "xx", "2kyS6SvSYSE"])
+    assert first[0] == second[2]
+    assert first[1] == second[0]
+
+def test_malformed_ids_go_to_side_table():
+    ids = ["#NAME?", "abc", None, np.nan, "AAAAAAAAAAB", "ÄAAAAAAAAAA", "#NAME?"]
+    codes, side_table = encode_video_ids(ids)
+    assert len(side_table) == 5
+    assert codes[0] == codes[6]
+    assert codes[2] == codes[3]
+    decoded = decode_video_ids(codes, side_table)
+    assert decoded.tolist() == ["#NAME?", "abc", None, None, "AAAAAAAAAAB", "ÄAAAAAAAAAA", "#NAME?"]
+
+def test_compact_and_restore_dataframe():
+    df = pd.DataFrame({"video_id": ["2kyS6SvSYSE", "#NAME?", "2kyS6SvSYSE"], "views": [1, 2, 3]})
+    compact = compact_video_ids(df)
+    assert df["video_id"].dtype == object
+    assert compact["video_id"].dtype == np.uint64
+    assert compact.groupby("video_id")["views"].sum().sort_values().tolist() == [2, 4]
+    pd.testing.assert_frame_equal(restore_video_ids(compact), df)
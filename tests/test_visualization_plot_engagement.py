@@ -47,6 +47,14 @@ def test_plot_like_dislike_ratio_vs_views():
     assert isinstance(fig, plt.Figure)
 
 
+def test_plot_like_dislike_ratio_vs_views_skips_unobserved_categories(basic_df):
+    df = basic_df.assign(category_name=pd.Categorical(basic_df["category_name"],
+                                                      categories=["Music", "Gaming", "Education", "Sports"]))
+    fig = plot_like_dislike_ratio_vs_views(df)
+    assert len(fig.axes[0].collections[-1].get_offsets()) == 3
+    assert sorted(text.get_text() for text in fig.axes[0].texts) == ["Education", "Gaming", "Music"]
+
+
 def test_plot_engagement_per_user(basic_df):
     fig = plot_engagement_per_user(basic_df, metric="likes")
     assert isinstance(fig, plt.Figure)
@@ -92,3 +92,31 @@ def test_export_trend_plot(tmp_path, sample_df):
     file_path = tmp_path / "trend_plot.png"
     plot_trends.export_trend_plot(fig, str(file_path))
     assert file_path.exists()
+
+def test_export_trend_plot_uses_configured_format_and_dpi(tmp_path, sample_df, monkeypatch):
+    from src.config_loader import get_settings
+    fig = plot_trends.plot_time_series_trends(sample_df)
+    calls = []
+    monkeypatch.setattr(fig, "savefig", lambda path, **options: calls.append((path, options)))
+    plot_trends.export_trend_plot(fig, str(tmp_path / "trend_plot"))
+    visualization = get_settings().visualization
+    assert calls == [(str(tmp_path / f"trend_plot.{visualization.plot_format}"),
+                      {"dpi": visualization.plot_dpi, "format": visualization.plot_format})]
+
+def test_annotations_accept_detection_output(sample_df):
+    from src.analysis.change_points import build_category_day_series, detect_change_points, detect_spikes
+    days = pd.date_range('2024-01-01', periods=60)
+    views = [100] * 30 + [300] * 30
+    views[45] = 2000
+    df = pd.DataFrame({'trending_date': days, 'category_name': 'Music', 'views': views})
+    series = build_category_day_series(df, by=['category_name'])
+    changes = detect_change_points(series)
+    spikes = detect_spikes(series, window=14)
+    fig, ax = plt.subplots()
+    ax.plot(series.columns, series.loc['Music'])
+    plot_trends.highlight_trend_peaks(ax, series.loc['Music'], spikes=spikes)
+    plot_trends.annotate_trend_changes(ax, changes)
+    labels = [text.get_text() for text in ax.texts]
+    assert '+200%' in labels
+    assert any(label.startswith('z=+') for label in labels)
+    plt.close(fig)
@@ -0,0 +1,60 @@
+import matplotlib
+matplotlib.use("Agg")
+import matplotlib.pyplot as plt
+import numpy as np
+import pandas as pd
+import pytest
+
+from pathlib import Path
+import sys
+
+project_root = Path(__file__).resolve().parent.parent
+sys.path.append(str(project_root))
+
+from src.visualization.scatter import annotate_points, density_scatter, sampled_overlay
+from src.visualization.plot_engagement import plot_like_dislike_ratio_vs_views
+from src.visualization.plot_trends import create_scatter_plot
+
+@pytest.fixture
+def videos():
+    rng = np.random.default_rng(0)
+    n = 5000
+    return pd.DataFrame({
+        "category_name": rng.choice(["Music", "Gaming", "News"], size=n),
+        "views": rng.integers(1_000, 1_000_000, size=n),
+        "likes": rng.integers(0, 10_000, size=n),
+        "dislikes": rng.integers(0, 500, size=n),
+    })
+
+@pytest.mark.parametrize("kind", ["hexbin", "hist2d"])
+def test_density_scatter_bounds_artists(kind):
+    fig, ax = plt.subplots()
+    rng = np.random.default_rng(0)
+    x, y = rng.random(20_000), rng.random(20_000) * 1000 + 1
+    density_scatter(ax, x, y, kind=kind, gridsize=20, yscale="log")
+    assert ax.get_yscale() == "log"
+    assert len(ax.collections) == 1
+    plt.close(fig)
+
+def test_sampled_overlay_and_annotations():
+    fig, ax = plt.subplots()
+    strata = np.repeat(["a", "b"], [990, 10])
+    positions = sampled_overlay(ax, np.arange(1000), np.arange(1000), n=50, strata=strata)
+    assert len(positions) == 50
+    assert (strata[positions] == "b").sum() >= 1
+    texts = annotate_points(ax, [1, np.nan, 3], [1, 2, 3], ["x", "y", "z"])
+    assert [t.get_text() for t in texts] == ["x", "z"]
+    plt.close(fig)
+
+def test_create_scatter_plot_switches_to_density(videos):
+    fig = create_scatter_plot(videos["views"], videos["likes"], max_points=1000, overlay_points=100)
+    ax = fig.axes[0]
+    assert len(ax.collections) == 2  # density + overlay
+    assert len(ax.collections[1].get_offsets()) == 100
+    plt.close(fig)
+
+def test_plot_like_dislike_ratio_per_video(videos):
+    fig = plot_like_dislike_ratio_vs_views(videos, max_points=1000, overlay_points=200)
+    ax = fig.axes[0]
+    assert sorted(t.get_text() for t in ax.texts) == ["Gaming", "Music", "News"]
+    plt.close(fig)